@@ -24,8 +24,14 @@ if __name__ == "__main__":
         # but remove REST API views and URLs
         remove_file("{{ cookiecutter.underscored }}/api/views.py")
         remove_file("{{ cookiecutter.underscored }}/api/urls.py")
+        remove_file("{{ cookiecutter.underscored }}/api/pagination.py")
+        remove_file("{{ cookiecutter.underscored }}/api/exports.py")
+        remove_file("{{ cookiecutter.underscored }}/api/upsert.py")
+        remove_file("{{ cookiecutter.underscored }}/api/caching.py")
         remove_file("{{ cookiecutter.underscored }}/tests/test_api.py")
 
     if "no" == "{{ cookiecutter.include_graphql }}":
         remove_file("{{ cookiecutter.underscored }}/graphql.py")
+        remove_file("{{ cookiecutter.underscored }}/graphql_cost.py")
+        remove_file("{{ cookiecutter.underscored }}/graphql_views.py")
         remove_file("{{ cookiecutter.underscored }}/tests/test_graphql.py")
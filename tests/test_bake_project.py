@@ -130,3 +130,18 @@ def test_bake_not_open_source(cookies):
         assert "setup.py" in found_toplevel_files
         assert "LICENSE" not in found_toplevel_files
         assert "License" not in result.project.join("README.rst").read()
+
+
+def test_bake_with_fulltext_search(cookies):
+    with bake_in_temp_dir(cookies, extra_context={"include_fulltext_search": "yes"}) as result:
+        package_dir = result.project.join("netbox_acl_plugin")
+        models = package_dir.join("models.py").read()
+        assert "search_vector = models.GeneratedField(" in models
+        assert '"search_mode": "fulltext"' in package_dir.join("__init__.py").read()
+
+
+def test_bake_without_fulltext_search(cookies):
+    with bake_in_temp_dir(cookies) as result:
+        package_dir = result.project.join("netbox_acl_plugin")
+        assert "search_vector" not in package_dir.join("models.py").read()
+        assert "search_mode" not in package_dir.join("filtersets.py").read()
@@ -10,7 +10,8 @@ Usage:
 
 import os
 
-# Database configuration
+# Database configuration. Tests run against test_<NAME>; with --parallel, Django
+# clones it once per worker process (test_<NAME>_1, test_<NAME>_2, ...).
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -23,7 +24,8 @@ DATABASES = {
     }
 }
 
-# Redis configuration
+# Redis configuration. Databases 0 and 1 are used by serial runs; with
+# {{ cookiecutter.underscored }}.testing.runner.ParallelTestRunner, worker N uses database N + 1.
 REDIS = {
     'tasks': {
         'HOST': os.getenv('REDIS_HOST', 'localhost'),
@@ -25,9 +25,72 @@ class {{ cookiecutter.__model_name }}Config(PluginConfig):
     base_url = "{{ cookiecutter.underscored }}"
     min_version = "4.5.0"
     max_version = "4.5.99"
+    default_settings = {
+        # Rows fetched and serialized per batch by the streaming export endpoint
+        "export_chunk_size": 2000,
+        # Rows per INSERT/UPDATE statement issued by the bulk upsert endpoint
+        "upsert_batch_size": 500,
+        # Records committed per transaction by the bulk import view
+        "bulk_import_chunk_size": 1000,
+        # Records written per transaction by the background import job
+        "import_job_batch_size": 1000,
+        # Seconds to cache REST API list and detail responses; 0 disables the cache
+        "api_cache_timeout": 0,
+        # Maximum number of objects returned by one GraphQL list field
+        "graphql_max_limit": 1000,
+        # Highest estimated cost and nesting depth accepted for a GraphQL query
+        "graphql_max_cost": 50000,
+        "graphql_max_depth": 10,
+        # Parsed and validated GraphQL documents kept per worker process
+        "graphql_query_cache_size": 256,
+        # List counts above this many rows are estimated instead of counted; 0 always counts
+        "approximate_count_threshold": 0,
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+        # How the "q" filter searches: "fulltext" (ranked, using the search_vector
+        # column) or "icontains" (substring match using the trigram indexes)
+        "search_mode": "fulltext",
+{%- endif %}
+        # Record per-view latency, SQL and rendering metrics, served at metrics/
+        "metrics_enabled": False,
+        # Let superusers profile single requests with ?_profile=1 or an X-Profile: 1 header
+        "profiling_enabled": False,
+        # Directory keeping the most recent profiles; None uses a directory in the system temp dir
+        "profiling_directory": None,
+        "profiling_max_profiles": 20,
+        # Record nested spans for plugin requests and pass them to tracing_exporter,
+        # a dotted path constructed with tracing_exporter_options as keyword arguments
+        "tracing_enabled": False,
+        "tracing_exporter": "{{ cookiecutter.underscored }}.tracing.ConsoleSpanExporter",
+        "tracing_exporter_options": {},
+    }
+    middleware = [
+        "{{ cookiecutter.underscored }}.metrics.MetricsMiddleware",
+        "{{ cookiecutter.underscored }}.tracing.TracingMiddleware",
+        "{{ cookiecutter.underscored }}.profiling.ProfilerMiddleware",
+    ]
 {%- if cookiecutter.include_graphql == "yes" %}
     graphql_schema = "graphql.schema"
 {%- endif %}
 
+    def ready(self):
+        super().ready()
+        from django.conf import settings
+
+        from . import instrumentation, metrics, tracing
+{%- if cookiecutter.include_rest_api == "yes" %}
+
+        # Connect the signal receivers that invalidate the API response cache
+        from .api import caching  # noqa: F401
+{%- endif %}
+
+        if metrics.metrics_enabled() or tracing.get_config("tracing_enabled"):
+            instrumentation.instrument_templates()
+
+        # NetBox redirects unauthenticated requests outside AUTH_EXEMPT_PATHS to
+        # the login page; Prometheus has no session, so metrics_view() checks
+        # API tokens itself
+        metrics_path = f"/{settings.BASE_PATH}plugins/{self.base_url or self.name}/metrics/"
+        settings.AUTH_EXEMPT_PATHS = (*getattr(settings, "AUTH_EXEMPT_PATHS", ()), metrics_path)
+
 
 config = {{ cookiecutter.__model_name }}Config
@@ -0,0 +1,203 @@
+{% if cookiecutter.include_rest_api == "yes" -%}
+"""
+Response caching for the {{ cookiecutter.project_name }} REST API.
+
+List and detail responses are stored in Django's default cache, which NetBox
+backs with the ``caching`` Redis database. Cache keys combine:
+
+* a generation token per object (detail views), for all lists, and for the
+  related models that appear in serialized output (tags and custom fields);
+  signal handlers replace these tokens whenever the data changes, so stale
+  entries are never read again and simply expire,
+* a fingerprint of the requesting user's view permissions for the model, so
+  users only share entries when their permission constraints are identical,
+* the request's host, renderer and query parameters.
+
+Caching is disabled unless ``api_cache_timeout`` is set in PLUGINS_CONFIG.
+
+For Django's cache framework, see:
+https://docs.djangoproject.com/en/stable/topics/cache/#the-low-level-cache-api
+"""
+
+import hashlib
+import json
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from extras.models import CustomField, Tag, TaggedItem
+from netbox.authentication import ObjectPermissionBackend
+from netbox.plugins.utils import get_plugin_config
+from rest_framework.response import Response
+from utilities.permissions import get_permission_for_model, permission_is_exempt
+
+from ..models import {{ cookiecutter.__model_name }}
+
+KEY_PREFIX = "{{ cookiecutter.underscored }}:api"
+RELATED_GENERATION_KEY = f"{KEY_PREFIX}:generation:related"
+LIST_GENERATION_KEY = f"{KEY_PREFIX}:generation:list"
+HITS_KEY = f"{KEY_PREFIX}:hits"
+MISSES_KEY = f"{KEY_PREFIX}:misses"
+
+
+def get_timeout():
+    """Return the configured cache timeout in seconds; 0 disables caching."""
+    return get_plugin_config("{{ cookiecutter.underscored }}", "api_cache_timeout")
+
+
+def object_generation_key(pk):
+    return f"{KEY_PREFIX}:generation:object:{pk}"
+
+
+def get_generations(*keys):
+    """Return the current generation tokens stored under keys, creating any that are missing."""
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, uuid.uuid4().hex, None)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+def bump_generations(*keys):
+    """Replace generation tokens, orphaning every entry built on them."""
+    cache.set_many({key: uuid.uuid4().hex for key in keys}, None)
+
+
+def invalidate(pk=None, related=False):
+    """
+    Invalidate cached lists, plus the detail entry for pk or every entry if related.
+
+    Invalidation runs immediately and again once the transaction commits, so a
+    response cached by a concurrent request before the commit is discarded too.
+    """
+    keys = [LIST_GENERATION_KEY]
+    if pk is not None:
+        keys.append(object_generation_key(pk))
+    if related:
+        keys.append(RELATED_GENERATION_KEY)
+    bump_generations(*keys)
+    transaction.on_commit(lambda: bump_generations(*keys))
+
+
+def permission_fingerprint(user, model):
+    """Return a digest of the view permission constraints that apply to user for model."""
+    permission = get_permission_for_model(model, "view")
+    if permission_is_exempt(permission):
+        return "exempt"
+    if user.is_superuser:
+        return "superuser"
+
+    constraints = ObjectPermissionBackend().get_all_permissions(user).get(permission, [])
+    encoded = json.dumps(constraints, sort_keys=True, default=str)
+    if "$user" in encoded:
+        # Constraints referencing $user resolve differently for every user
+        encoded += f":{user.pk}"
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def get_cache_key(request, model, pk=None):
+    """Build the cache key for a list (pk=None) or detail request."""
+    if pk is None:
+        scope, generation_key = "list", LIST_GENERATION_KEY
+    else:
+        scope, generation_key = f"detail:{pk}", object_generation_key(pk)
+    variant = json.dumps([
+        get_generations(RELATED_GENERATION_KEY, generation_key),
+        permission_fingerprint(request.user, model),
+        request.get_host(),
+        request.scheme,
+        request.accepted_renderer.format,
+        sorted(request.query_params.lists()),
+    ])
+    digest = hashlib.sha256(variant.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{scope}:{digest}"
+
+
+def count(key):
+    """Increment a hit/miss counter."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, None)
+
+
+def get_stats():
+    """Return the cache hit/miss counters."""
+    counters = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits, misses = counters.get(HITS_KEY, 0), counters.get(MISSES_KEY, 0)
+    return {
+        "enabled": bool(get_timeout()),
+        "timeout": get_timeout(),
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / (hits + misses) if hits + misses else None,
+    }
+
+
+class CachedResponseMixin:
+    """
+    Serve ``list()`` and ``retrieve()`` responses from the API response cache.
+
+    Permission checks still run for every request, before the cache is
+    consulted. Responses carry an ``X-Cache: HIT`` or ``X-Cache: MISS`` header.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, None, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return self.cached_response(request, pk, super().retrieve, *args, **kwargs)
+
+    def cached_response(self, request, pk, get_response, *args, **kwargs):
+        timeout = get_timeout()
+        if not timeout:
+            return get_response(request, *args, **kwargs)
+
+        key = get_cache_key(request, self.queryset.model, pk)
+        data = cache.get(key)
+        if data is not None:
+            count(HITS_KEY)
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        count(MISSES_KEY)
+        response = get_response(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout)
+        response["X-Cache"] = "MISS"
+        return response
+
+
+#
+# Invalidation. These receivers are connected by importing this module from
+# the plugin's ready() method, so they also run in RQ workers.
+#
+
+@receiver((post_save, post_delete), sender={{ cookiecutter.__model_name }})
+def invalidate_object(sender, instance, **kwargs):
+    invalidate(instance.pk)
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def invalidate_tagged_objects(sender, instance, action, reverse, model, pk_set, **kwargs):
+    # TaggedItem is shared by every tagged model, so ignore unrelated changes
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse and isinstance(instance, {{ cookiecutter.__model_name }}):
+        invalidate(instance.pk)
+    elif reverse and model is {{ cookiecutter.__model_name }}:
+        for pk in pk_set or ():
+            invalidate(pk)
+        if action == "post_clear":
+            invalidate(related=True)
+
+
+@receiver((post_save, post_delete), sender=Tag)
+@receiver((post_save, post_delete), sender=CustomField)
+def invalidate_related(sender, **kwargs):
+    # Tags and custom fields are serialized into every object
+    invalidate(related=True)
+{% endif %}
@@ -0,0 +1,73 @@
+{% if cookiecutter.include_rest_api == "yes" -%}
+"""
+Streaming exports for the {{ cookiecutter.project_name }} REST API.
+
+Rows are read with ``QuerySet.iterator()`` and serialized one chunk at a time,
+so memory use stays flat no matter how many rows are exported.
+
+For Django streaming responses, see:
+https://docs.djangoproject.com/en/stable/howto/outputting-csv/#streaming-large-csv-files
+"""
+
+import csv
+import json
+from itertools import batched
+
+from extras.models import CustomField
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class Echo:
+    """File-like object whose write() returns the value instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def serialized_chunks(queryset, serializer_class, context, chunk_size):
+    """Yield lists of serialized rows, fetching at most chunk_size rows at a time."""
+    for chunk in batched(queryset.iterator(chunk_size=chunk_size), chunk_size):
+        yield serializer_class(chunk, many=True, context=context).data
+
+
+def iter_ndjson(queryset, serializer_class, context, chunk_size):
+    """Yield the queryset as newline-delimited JSON, one object per line."""
+    for rows in serialized_chunks(queryset, serializer_class, context, chunk_size):
+        yield "".join(json.dumps(row, cls=JSONEncoder) + "\n" for row in rows)
+
+
+def iter_csv(queryset, serializer_class, context, chunk_size):
+    """
+    Yield the queryset as CSV.
+
+    Custom fields are expanded into one ``cf_<name>`` column each and related
+    objects are written using their display value.
+    """
+    fields = [name for name in serializer_class(context=context).fields if name != "custom_fields"]
+    custom_fields = [cf.name for cf in CustomField.objects.get_for_model(queryset.model)]
+
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields + [f"cf_{name}" for name in custom_fields])
+
+    for rows in serialized_chunks(queryset, serializer_class, context, chunk_size):
+        yield "".join(
+            writer.writerow(
+                [csv_value(row.get(name)) for name in fields]
+                + [csv_value(row.get("custom_fields", {}).get(name)) for name in custom_fields]
+            )
+            for row in rows
+        )
+
+
+def csv_value(value):
+    """Flatten a serialized value into a single CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ",".join(csv_value(item) for item in value)
+    if isinstance(value, dict):
+        if "display" in value:
+            return value["display"]
+        return json.dumps(value, cls=JSONEncoder)
+    return value
+{% endif %}
@@ -0,0 +1,108 @@
+{% if cookiecutter.include_rest_api == "yes" -%}
+"""
+API pagination for {{ cookiecutter.project_name }}.
+
+For more information on NetBox REST API pagination, see:
+https://docs.netbox.dev/en/stable/integrations/rest-api/#pagination
+
+For Django REST Framework pagination, see:
+https://www.django-rest-framework.org/api-guide/pagination/
+"""
+
+from django.conf import settings
+from netbox.api.pagination import OptionalLimitOffsetPagination
+from netbox.config import get_config
+from rest_framework.pagination import CursorPagination
+
+from ..counts import ApproximateCount, approximate_count
+
+
+class {{ cookiecutter.__model_name }}CursorPagination(CursorPagination):
+    """
+    Keyset pagination over (name, id), matching {{ cookiecutter.__model_name }}.Meta.ordering.
+
+    Each page is fetched with a WHERE clause on the last name seen rather than
+    an OFFSET, so the cost of a page does not grow with its position. Since
+    ``name`` is unique, the cursor identifies exactly one row.
+    """
+
+    ordering = ("name", "id")
+    page_size_query_param = "limit"
+
+    def __init__(self):
+        self.page_size = get_config().PAGINATE_COUNT
+        self.max_page_size = settings.MAX_PAGE_SIZE or None
+
+    def get_ordering(self, request, queryset, view):
+        # Cursors are only stable for the keyset ordering, so ?ordering is ignored
+        return self.ordering
+
+
+class {{ cookiecutter.__model_name }}Pagination(OptionalLimitOffsetPagination):
+    """
+    NetBox's limit/offset pagination with an opt-in cursor mode.
+
+    Requests carrying a ``cursor`` query parameter (empty for the first page)
+    are paginated by {{ cookiecutter.__model_name }}CursorPagination and return ``next``,
+    ``previous`` and ``results`` without a ``count``. All other requests get the
+    standard ``count``/``next``/``previous``/``results`` response plus
+    ``count_approximate``, which is true when ``count`` was estimated by
+    approximate_count().
+    """
+
+    cursor_pagination_class = {{ cookiecutter.__model_name }}CursorPagination
+
+    def __init__(self):
+        super().__init__()
+        self.cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_pagination_class.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        results = super().paginate_queryset(queryset, request, view)
+        if isinstance(self.count, ApproximateCount):
+            results = self.correct_estimate(queryset, results)
+        return results
+
+    def get_queryset_count(self, queryset):
+        return approximate_count(queryset)
+
+    def correct_estimate(self, queryset, results):
+        """
+        Adjust an estimated count to the page just fetched.
+
+        ``next`` links are derived from the count, so an estimate that is too
+        low would end a listing before its last rows. The count becomes exact
+        on the last page, and is raised past a full page that reaches it.
+        """
+        if self.offset > self.count:
+            # The base class skips the query when the offset is past the count
+            results = list(queryset[self.offset:self.offset + self.limit] if self.limit else queryset[self.offset:])
+        if not self.limit or len(results) < self.limit:
+            # The rows end on this page, or before it when it is empty
+            self.count = self.offset + len(results) if results or not self.offset else ApproximateCount(self.offset)
+        elif self.offset + self.limit >= self.count:
+            self.count = ApproximateCount(self.offset + self.limit + 1)
+        return results
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        response = super().get_paginated_response(data)
+        response.data = {
+            "count": self.count,
+            "count_approximate": isinstance(self.count, ApproximateCount),
+            **response.data,
+        }
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema["properties"] = {
+            "count": schema["properties"]["count"],
+            "count_approximate": {"type": "boolean", "example": False},
+            **schema["properties"],
+        }
+        return schema
+{% endif %}
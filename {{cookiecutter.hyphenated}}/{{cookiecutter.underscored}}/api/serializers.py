@@ -18,7 +18,9 @@ https://www.django-rest-framework.org/api-guide/serializers/
 from netbox.api.serializers import NetBoxModelSerializer
 from rest_framework import serializers
 
+from ..metrics import timed
 from ..models import {{ cookiecutter.__model_name }}
+from ..tracing import span
 
 
 class {{ cookiecutter.__model_name }}Serializer(NetBoxModelSerializer):
@@ -31,3 +33,8 @@ class {{ cookiecutter.__model_name }}Serializer(NetBoxModelSerializer):
     class Meta:
         model = {{ cookiecutter.__model_name }}
         fields = ("id", {% if cookiecutter.include_rest_api == "yes" %}"url", {% endif %}"display", "name", "tags", "custom_fields", "created", "last_updated")
+
+    def to_representation(self, instance):
+        # Counted towards the request's serializer time and traced when enabled
+        with timed("serializer"), span(f"{type(self).__name__}.to_representation", {"object.id": instance.pk}):
+            return super().to_representation(instance)
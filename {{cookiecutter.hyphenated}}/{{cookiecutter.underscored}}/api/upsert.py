@@ -0,0 +1,123 @@
+{% if cookiecutter.include_rest_api == "yes" -%}
+"""
+Bulk upsert support for the {{ cookiecutter.project_name }} REST API.
+
+Objects are matched to existing rows on their unique ``name``, validated with
+the regular API serializer and written with ``bulk_create()``/``bulk_update()``.
+Because bulk writes bypass ``Model.save()``, ``post_save`` is sent for every
+written object afterwards so NetBox still records change log entries and
+queues event rules exactly as it would for individual saves.
+"""
+
+import copy
+from collections import Counter
+
+from django.db import router
+from django.db.models.signals import post_save
+from django.utils import timezone
+from rest_framework.exceptions import PermissionDenied, ValidationError
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+
+
+def field_values(instance):
+    """Return a copy of the instance's concrete field values, keyed by field name."""
+    return {
+        field.name: copy.deepcopy(field.value_from_object(instance))
+        for field in instance._meta.concrete_fields
+    }
+
+
+def bulk_upsert(request, items, serializer_class, context, batch_size):
+    """
+    Create or update objects matched on ``name``.
+
+    Must be called inside a transaction. Returns a list with one
+    ``{"id", "name", "status"}`` entry per item, in request order.
+    """
+    model = serializer_class.Meta.model
+
+    names = [item.get("name") for item in items if isinstance(item, dict)]
+    duplicates = sorted(name for name, count in Counter(names).items() if count > 1)
+    if duplicates:
+        raise ValidationError({"name": [f"Duplicate names in request: {', '.join(map(str, duplicates))}"]})
+
+    # Resolve every existing object in a single query (plus one for tags). Matches
+    # are not restricted here, so the permission check below covers all of them.
+    existing = {
+        obj.name: obj
+        for obj in model.objects.filter(name__in=names).prefetch_related("tags")
+    }
+
+    results = []
+    errors = []
+    update_fields = set()
+    for item in items:
+        instance = existing.get(item.get("name")) if isinstance(item, dict) else None
+        if instance is not None:
+            # Record the pre-change state before validation modifies the instance
+            instance.snapshot()
+            before = field_values(instance)
+
+        serializer = serializer_class(instance, data=item, partial=instance is not None, context=context)
+        if not serializer.is_valid():
+            errors.append(serializer.errors)
+            continue
+        errors.append({})
+
+        data = dict(serializer.validated_data)
+        tags = data.pop("tags", None)
+
+        if instance is None:
+            results.append((model(**data), CREATED, tags))
+            continue
+
+        after = field_values(instance)
+        changed = {name for name in data if name in after and after[name] != before[name]}
+        tags_changed = tags is not None and {tag.pk for tag in tags} != {tag.pk for tag in instance.tags.all()}
+        update_fields |= changed
+        results.append((instance, UPDATED if changed or tags_changed else UNCHANGED, tags))
+
+    if any(errors):
+        raise ValidationError(errors)
+
+    created = [instance for instance, status, _ in results if status == CREATED]
+    updated = [instance for instance, status, _ in results if status == UPDATED]
+    matched = [instance for instance, status, _ in results if status != CREATED]
+
+    model.objects.bulk_create(created, batch_size=batch_size)
+    if updated:
+        # bulk_update() does not apply auto_now, so set last_updated explicitly
+        now = timezone.now()
+        for instance in updated:
+            instance.last_updated = now
+        model.objects.bulk_update(updated, [*update_fields, "last_updated"], batch_size=batch_size)
+
+    # Replay what Model.save() would have signalled: this creates the change log
+    # records and enqueues events. Tags are assigned afterwards, as the serializer
+    # does, so m2m_changed folds them into the same change record.
+    using = router.db_for_write(model)
+    for instance, status, tags in results:
+        if status == UNCHANGED:
+            continue
+        post_save.send(
+            sender=model, instance=instance, created=status == CREATED, update_fields=None, raw=False, using=using
+        )
+        if tags is not None:
+            instance.tags.set(tags)
+
+    # Enforce object-level permission constraints on the written objects, and on
+    # unchanged matches too, so their IDs are never returned to users who cannot
+    # change them
+    for action, instances in (("add", created), ("change", matched)):
+        pks = [instance.pk for instance in instances]
+        if pks and model.objects.restrict(request.user, action).filter(pk__in=pks).count() != len(pks):
+            raise PermissionDenied()
+
+    return [
+        {"id": instance.pk, "name": instance.name, "status": status}
+        for instance, status, _ in results
+    ]
+{% endif %}
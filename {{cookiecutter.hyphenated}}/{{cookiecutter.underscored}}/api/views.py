@@ -9,13 +9,98 @@ For Django REST Framework viewsets, see:
 https://www.django-rest-framework.org/api-guide/viewsets/
 """
 
+from core.api.serializers import JobSerializer
+from django.db import router, transaction
+from django.http import StreamingHttpResponse
 from netbox.api.viewsets import NetBoxModelViewSet
+from netbox.plugins.utils import get_plugin_config
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
 
+from ..conditional import ConditionalResponseMixin
+from ..filtersets import {{ cookiecutter.__model_name }}FilterSet
+from ..jobs import enqueue_import
 from ..models import {{ cookiecutter.__model_name }}
+from .caching import CachedResponseMixin, get_stats
+from .exports import iter_csv, iter_ndjson
+from .pagination import {{ cookiecutter.__model_name }}Pagination
 from .serializers import {{ cookiecutter.__model_name }}Serializer
+from .upsert import bulk_upsert
 
+EXPORT_FORMATS = {
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+    "csv": (iter_csv, "text/csv"),
+}
 
-class {{ cookiecutter.__model_name }}ViewSet(NetBoxModelViewSet):
+
+class {{ cookiecutter.__model_name }}ViewSet(ConditionalResponseMixin, CachedResponseMixin, NetBoxModelViewSet):
     queryset = {{ cookiecutter.__model_name }}.objects.all()
     serializer_class = {{ cookiecutter.__model_name }}Serializer
+    filterset_class = {{ cookiecutter.__model_name }}FilterSet
+    pagination_class = {{ cookiecutter.__model_name }}Pagination
+
+    @action(detail=False, url_path="cache-stats")
+    def cache_stats(self, request):
+        """Return the response cache configuration and its hit/miss counters."""
+        return Response(get_stats())
+
+    @action(detail=False, url_path=r"export/(?P<export_format>ndjson|csv)")
+    def export(self, request, export_format):
+        """
+        Stream every permitted object matching the request's filters.
+
+        Unlike the list endpoint the response is not paginated; rows are
+        fetched and serialized in chunks of PLUGINS_CONFIG["export_chunk_size"].
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        stream, content_type = EXPORT_FORMATS[export_format]
+        chunk_size = get_plugin_config("{{ cookiecutter.underscored }}", "export_chunk_size")
+
+        response = StreamingHttpResponse(
+            stream(queryset, self.get_serializer_class(), self.get_serializer_context(), chunk_size),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="{{ cookiecutter.__model_url }}s.{export_format}"'
+        return response
+
+    @action(detail=False, methods=["post"])
+    def upsert(self, request):
+        """
+        Create or update a list of objects in one request, matched on ``name``.
+
+        Requires both add and change permissions. Returns one entry per object
+        with its ``id``, ``name`` and a ``status`` of "created", "updated" or
+        "unchanged". The whole batch is applied in a single transaction.
+        """
+        if not isinstance(request.data, list):
+            raise ValidationError("Expected a list of objects.")
+
+        model = self.queryset.model
+        with transaction.atomic(using=router.db_for_write(model)):
+            results = bulk_upsert(
+                request,
+                request.data,
+                self.get_serializer_class(),
+                self.get_serializer_context(),
+                batch_size=get_plugin_config("{{ cookiecutter.underscored }}", "upsert_batch_size"),
+            )
+        return Response(results)
+
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser])
+    def import_job(self, request):
+        """
+        Queue a background import of the CSV file uploaded as ``file``.
+
+        Returns the queued job; its ``data`` holds the import progress and
+        per-record errors once it runs.
+        """
+        if "file" not in request.FILES:
+            raise ValidationError({"file": ["A CSV file is required."]})
+
+        job = enqueue_import(request.FILES["file"], request.user)
+        serializer = JobSerializer(job, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
 {% endif %}
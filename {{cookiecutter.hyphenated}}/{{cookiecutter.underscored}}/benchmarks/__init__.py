@@ -0,0 +1,23 @@
+"""
+Benchmarks for the hot paths of {{ cookiecutter.project_name }}.
+
+cases.py defines the benchmarked operations:
+
+* the {{ cookiecutter.__model_name }} list view
+{%- if cookiecutter.include_rest_api == "yes" %}
+* the REST API list and detail endpoints
+{%- endif %}
+{%- if cookiecutter.include_graphql == "yes" %}
+* the GraphQL ``{{ cookiecutter.__model_url_name }}_list`` query
+{%- endif %}
+* the filterset ``search()``
+* NetBox's global search
+
+runner.py runs them at several dataset sizes, reports latency percentiles,
+query counts and peak memory as JSON, and compares results with a stored
+baseline. Run them with the ``{{ cookiecutter.__model_url_name }}_benchmarks`` management command.
+"""
+
+from .runner import compare_results, run_benchmarks
+
+__all__ = ("compare_results", "run_benchmarks")
@@ -0,0 +1,100 @@
+"""
+Benchmark cases for {{ cookiecutter.project_name }}.
+
+Each case is a function that receives a BenchmarkContext and returns a
+callable performing one operation. The callable is timed repeatedly, so any
+setup belongs in the case function itself.
+"""
+
+from dataclasses import dataclass
+
+from django.test import Client
+from django.urls import reverse
+
+from ..filtersets import {{ cookiecutter.__model_name }}FilterSet
+from ..models import {{ cookiecutter.__model_name }}
+
+# Objects requested per page, matching a typical UI or API client
+PAGE_SIZE = 50
+
+cases = {}
+
+
+@dataclass
+class BenchmarkContext:
+    """State shared by the cases for one dataset size."""
+
+    # Logged in as a superuser
+    client: Client
+    size: int
+    # Name of an object in the middle of the dataset, matching that object only
+    search_term: str
+    object_pk: int
+
+
+def register(name):
+    """Register a benchmark case under name."""
+    def decorator(func):
+        cases[name] = func
+        return func
+    return decorator
+
+
+def check_status(response, name):
+    if response.status_code != 200:
+        raise AssertionError(f"{name} returned HTTP {response.status_code}")
+    return response
+
+
+@register("list_view")
+def list_view(context):
+    url = reverse("plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list")
+    return lambda: check_status(context.client.get(url, {"per_page": PAGE_SIZE}), "list_view")
+{%- if cookiecutter.include_rest_api == "yes" %}
+
+
+@register("api_list")
+def api_list(context):
+    url = reverse("plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-list")
+    return lambda: check_status(context.client.get(url, {"limit": PAGE_SIZE}), "api_list")
+
+
+@register("api_detail")
+def api_detail(context):
+    url = reverse(
+        "plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-detail", kwargs={"pk": context.object_pk}
+    )
+    return lambda: check_status(context.client.get(url), "api_detail")
+{%- endif %}
+{%- if cookiecutter.include_graphql == "yes" %}
+
+
+@register("graphql_list")
+def graphql_list(context):
+    url = reverse("graphql")
+    query = "query { {{ cookiecutter.__model_url_name }}_list(pagination: {limit: " + str(PAGE_SIZE) + "}) { id name tags { name } } }"
+
+    def operation():
+        response = check_status(
+            context.client.post(url, {"query": query}, content_type="application/json"), "graphql_list"
+        )
+        if response.json().get("errors"):
+            raise AssertionError(f"graphql_list returned errors: {response.json()['errors']}")
+
+    return operation
+{%- endif %}
+
+
+@register("filterset_search")
+def filterset_search(context):
+    def operation():
+        queryset = {{ cookiecutter.__model_name }}FilterSet({"q": context.search_term}, {{ cookiecutter.__model_name }}.objects.all()).qs
+        return list(queryset[:PAGE_SIZE])
+
+    return operation
+
+
+@register("global_search")
+def global_search(context):
+    url = reverse("search")
+    return lambda: check_status(context.client.get(url, {"q": context.search_term}), "global_search")
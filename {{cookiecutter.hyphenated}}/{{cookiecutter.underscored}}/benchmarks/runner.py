@@ -0,0 +1,175 @@
+"""
+Benchmark runner for {{ cookiecutter.project_name }}.
+
+run_benchmarks() seeds {{ cookiecutter.__model_name }} objects with seed_objects() up to each
+dataset size, indexes them for global search and measures every case. All
+data is created inside a transaction that is rolled back afterwards.
+
+Every case is measured in three separate passes so the measurements do not
+skew each other: timed requests, one request with its SQL queries captured
+and one request traced with tracemalloc. Peak memory therefore covers Python
+allocations only.
+
+For tracemalloc, see:
+https://docs.python.org/3/library/tracemalloc.html
+"""
+
+import math
+import platform
+import time
+import tracemalloc
+import uuid
+from datetime import UTC, datetime
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from .. import __version__
+from ..models import {{ cookiecutter.__model_name }}
+from ..reindex import reindex
+from ..seed import seed_objects
+from .cases import BenchmarkContext, cases
+
+# Latency increases smaller than this are treated as noise by compare_results()
+LATENCY_NOISE_MS = 2.0
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, math.ceil(pct / 100 * len(samples)) - 1)
+    return samples[index]
+
+
+def measure(operation, repeat):
+    """Return latency percentiles, query count and peak memory of operation."""
+    # Warm up caches so the first timed request is not an outlier
+    operation()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+
+    with CaptureQueriesContext(connection) as queries:
+        operation()
+
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "mean_ms": round(sum(samples) / len(samples), 3),
+        "queries": len(queries),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def seed(count, size, prefix):
+    """Create count objects and make them visible to the planner and global search."""
+    if count > 0:
+        seed_objects(count, seed=size, prefix=prefix)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE " + connection.ops.quote_name({{ cookiecutter.__model_name }}._meta.db_table))
+    # Other connections cannot see the uncommitted rows, so index inline
+    reindex(workers=1)
+
+
+def run_benchmarks(sizes=(1000, 10000, 100000), repeat=20, names=None, log=None):
+    """
+    Run the benchmark cases at each dataset size.
+
+    Args:
+        sizes: Numbers of seeded {{ cookiecutter.__model_name }} objects, in addition to
+            any that already exist
+        repeat: Number of timed runs per case and size
+        names: Names of the cases to run; all cases by default
+        log: Optional callable receiving progress messages
+
+    Returns:
+        JSON-serializable dict with the environment and, per case and size,
+        the measurements returned by measure()
+    """
+    log = log or (lambda message: None)
+    names = names or list(cases)
+    unknown = set(names) - set(cases)
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(sorted(unknown))}")
+
+    results = {name: {} for name in names}
+    with transaction.atomic():
+        user = get_user_model().objects.create_user(
+            username=f"benchmark-{uuid.uuid4().hex[:8]}",
+            is_superuser=True,
+        )
+        client = Client()
+        client.force_login(user)
+
+        prefix = f"bench-{uuid.uuid4().hex[:8]}"
+        seeded = 0
+        for size in sorted(sizes):
+            log(f"Seeding {size - seeded} objects for size {size}...")
+            seed(size - seeded, size, prefix)
+            seeded = size
+
+            middle = {{ cookiecutter.__model_name }}.objects.filter(name__startswith=prefix).order_by("pk")[size // 2]
+            context = BenchmarkContext(client=client, size=size, search_term=middle.name, object_pk=middle.pk)
+            for name in names:
+                results[name][str(size)] = measure(cases[name](context), repeat)
+                log(f"{name} @ {size}: p50 {results[name][str(size)]['p50_ms']:.1f}ms")
+
+        transaction.set_rollback(True)
+
+    return {
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "environment": {
+            "netbox": settings.VERSION,
+            "plugin": __version__,
+            "python": platform.python_version(),
+            "database": connection.pg_version,
+        },
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_results(current, baseline, threshold=0.2, log=None):
+    """
+    Return the regressions of current compared with baseline as messages.
+
+    A case regresses at a dataset size when its p50 or p95 latency or its
+    peak memory grew by more than threshold (a fraction), or when it runs
+    more SQL queries. Cases and sizes missing from the baseline cannot be
+    compared; each is reported to the optional log callable.
+    """
+    log = log or (lambda message: None)
+    regressions = []
+    for name, sizes in current["results"].items():
+        for size, result in sizes.items():
+            previous = baseline["results"].get(name, {}).get(size)
+            label = f"{name} @ {size}"
+            if previous is None:
+                log(f"{label}: not in the baseline, skipped")
+                continue
+            for metric in ("p50_ms", "p95_ms"):
+                if (
+                    result[metric] > previous[metric] * (1 + threshold)
+                    and result[metric] - previous[metric] > LATENCY_NOISE_MS
+                ):
+                    regressions.append(f"{label}: {metric} {previous[metric]:.1f} -> {result[metric]:.1f}")
+            if result["queries"] > previous["queries"]:
+                regressions.append(f"{label}: queries {previous['queries']} -> {result['queries']}")
+            if result["peak_memory_kib"] > previous["peak_memory_kib"] * (1 + threshold):
+                regressions.append(
+                    f"{label}: peak_memory_kib {previous['peak_memory_kib']:.1f} -> {result['peak_memory_kib']:.1f}"
+                )
+    return regressions
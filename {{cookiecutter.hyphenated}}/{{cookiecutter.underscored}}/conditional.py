@@ -0,0 +1,126 @@
+"""
+Conditional GET support for {{ cookiecutter.project_name }}.
+
+Responses carry a weak ``ETag`` (and ``Last-Modified`` where it is reliable)
+computed from ``last_updated`` with a single lightweight query, so requests
+with a matching ``If-None-Match`` or ``If-Modified-Since`` header are answered
+with ``304 Not Modified`` before any object is loaded or serialized.
+
+``tags.set()`` and other tag assignments do not touch ``last_updated``, so
+the validators also cover the number and the latest ID of the objects' tag
+assignments (TaggedItem IDs only grow, so any change moves one of the two).
+``Last-Modified`` does not reflect tag assignments; clients that need them
+must use ``If-None-Match``.
+The ETags are weak because changes to the related objects themselves, such
+as renaming a tag, are not covered.
+
+For Django's conditional view processing, see:
+https://docs.djangoproject.com/en/stable/topics/conditional-view-processing/
+"""
+
+import hashlib
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def make_etag(*parts):
+    """Return a weak ETag for the given JSON-serializable parts."""
+    digest = hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def get_tag_validators():
+    """Return aggregates changing whenever tags are assigned to or removed from the objects."""
+    return {"tag_count": Count("tagged_items"), "last_tagged": Max("tagged_items__pk")}
+
+
+def get_object_validators(queryset, pk, *variant):
+    """
+    Return (etag, last_modified) for one object, or (None, None) if it is not in queryset.
+
+    variant holds anything else the representation depends on, such as query
+    parameters or the renderer.
+    """
+    try:
+        row = (
+            queryset.filter(pk=pk)
+            .annotate(**get_tag_validators())
+            .values_list("last_updated", "tag_count", "last_tagged")
+            .first()
+        )
+    except (TypeError, ValueError, ValidationError):
+        # Leave invalid lookups to the view's own 404 handling
+        return None, None
+    if row is None:
+        return None, None
+    return make_etag(pk, *row, *variant), row[0]
+
+
+def get_list_validators(queryset, *variant):
+    """
+    Return (etag, last_modified) for every object in queryset using a single aggregate query.
+
+    The object count is part of the ETag so deletions change it too. A
+    deletion does not change the latest ``last_updated``, though, so
+    ``last_modified`` is only informational for lists.
+    """
+    aggregate = queryset.order_by().aggregate(
+        last_updated=Max("last_updated"), count=Count("pk", distinct=True), **get_tag_validators()
+    )
+    return make_etag(*aggregate.values(), *variant), aggregate["last_updated"]
+
+
+def conditional_response(request, get_response, etag, last_modified=None, header_last_modified=None):
+    """
+    Return 304 Not Modified if the request's validators match, else get_response().
+
+    ``last_modified`` is evaluated against If-Modified-Since; pass the
+    timestamp as ``header_last_modified`` instead to only advertise it.
+    """
+    if etag is None:
+        return get_response()
+
+    # HTTP dates have whole seconds, so If-Modified-Since is compared against whole seconds
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = get_response()
+        if response.status_code != 200:
+            return response
+
+    response.setdefault("ETag", etag)
+    if last_modified or header_last_modified:
+        response.setdefault("Last-Modified", http_date((last_modified or header_last_modified).timestamp()))
+    return response
+
+
+class ConditionalResponseMixin:
+    """Answer conditional ``list()`` and ``retrieve()`` requests on an API viewset with 304 Not Modified."""
+
+    def get_validator_variant(self, request):
+        return request.accepted_renderer.format, sorted(request.query_params.lists())
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        etag, last_modified = get_list_validators(queryset, *self.get_validator_variant(request))
+        return conditional_response(
+            request,
+            lambda: super(ConditionalResponseMixin, self).list(request, *args, **kwargs),
+            etag,
+            header_last_modified=last_modified,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        queryset = self.filter_queryset(self.get_queryset())
+        etag, last_modified = get_object_validators(queryset, pk, *self.get_validator_variant(request))
+        return conditional_response(
+            request,
+            lambda: super(ConditionalResponseMixin, self).retrieve(request, *args, **kwargs),
+            etag,
+            last_modified,
+        )
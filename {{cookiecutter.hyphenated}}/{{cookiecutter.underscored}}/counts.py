@@ -0,0 +1,94 @@
+"""
+Approximate row counts for {{ cookiecutter.project_name }} list views and REST API.
+
+Paginating a list runs an exact ``COUNT(*)`` over the filtered queryset, which
+on tables with tens of millions of rows costs more than fetching the page.
+Once ``approximate_count_threshold`` is set, approximate_count() instead:
+
+* estimates unfiltered lists from the table statistics PostgreSQL keeps in
+  ``pg_class.reltuples`` (refreshed by autovacuum and ``ANALYZE``),
+* counts filtered lists exactly up to the threshold, and uses the planner's
+  ``EXPLAIN`` row estimate for larger results.
+
+Counts at or below the threshold are always exact. Estimates are returned as
+ApproximateCount, which renders as "~1,234,567" in the UI; API responses flag
+them with ``count_approximate``.
+
+For PostgreSQL's row count estimates, see:
+https://wiki.postgresql.org/wiki/Count_estimate
+"""
+
+import json
+from functools import cached_property
+
+from django.db import connections
+from django.db.models import QuerySet
+from netbox.plugins.utils import get_plugin_config
+from utilities.paginator import EnhancedPaginator
+
+
+class ApproximateCount(int):
+    """A row count that is an estimate."""
+
+    def __str__(self):
+        return f"~{int(self):,}"
+
+
+def get_table_estimate(queryset):
+    """Return PostgreSQL's estimate of the rows in queryset's table, or None before it is first analyzed."""
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 (0 before PostgreSQL 14) until the table is analyzed
+    return row[0] if row and row[0] > 0 else None
+
+
+def get_plan_estimate(queryset):
+    """Return the planner's estimate of the rows queryset returns."""
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def approximate_count(queryset):
+    """Return the number of rows in queryset, estimated above approximate_count_threshold."""
+    threshold = get_plugin_config("{{ cookiecutter.underscored }}", "approximate_count_threshold")
+    if not threshold:
+        return queryset.count()
+
+    if not queryset.query.has_filters():
+        estimate = get_table_estimate(queryset)
+        if estimate is not None and estimate > threshold:
+            return ApproximateCount(estimate)
+        return queryset.count()
+
+    # Stops counting after threshold + 1 rows
+    count = queryset.order_by()[:threshold + 1].count()
+    if count <= threshold:
+        return count
+    return ApproximateCount(max(count, get_plan_estimate(queryset)))
+
+
+class ApproximateCountPaginator(EnhancedPaginator):
+    """
+    NetBox's UI paginator, counting with approximate_count().
+
+    Page links follow the estimate, so if it is too low the last rows of a
+    list are only reachable by narrowing it down with filters.
+    """
+
+    @cached_property
+    def count(self):
+        # django-tables2 paginates its rows; count the queryset behind them
+        queryset = getattr(getattr(self.object_list, "data", None), "data", self.object_list)
+        if isinstance(queryset, QuerySet):
+            return approximate_count(queryset)
+        return super().count
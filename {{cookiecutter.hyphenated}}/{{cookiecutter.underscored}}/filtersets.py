@@ -8,15 +8,80 @@ For django-filters documentation, see:
 https://django-filter.readthedocs.io/
 """
 
+{% if cookiecutter.include_fulltext_search == "yes" -%}
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Q
+from netbox.filtersets import NetBoxModelFilterSet
+from netbox.plugins.utils import get_plugin_config
+
+from .models import SEARCH_CONFIG, {{ cookiecutter.__model_name }}
+from .tracing import span
+{%- else -%}
+from django.db.models import Q
 from netbox.filtersets import NetBoxModelFilterSet
 
 from .models import {{ cookiecutter.__model_name }}
+from .tracing import span
+{%- endif %}
 
 
 class {{ cookiecutter.__model_name }}FilterSet(NetBoxModelFilterSet):
+    # Fields matched by the "q" search parameter. Give each one a trigram index
+    # in the model's Meta.indexes so the match can be served without a
+    # sequential scan.
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+    # They are only searched when the search_mode setting is "icontains";
+    # "fulltext" searches the model's search_vector column instead.
+{%- endif %}
+    search_fields = ("name",)
+
     class Meta:
         model = {{ cookiecutter.__model_name }}
         fields = ("id", "name")
 
+    @property
+    def qs(self):
+        # Filtering only builds the queryset; the span holds the queries validating
+        # the filter values, while the rows are fetched under the table's render span
+        with span(f"{type(self).__name__}.qs"):
+            return super().qs
+
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+
+    @staticmethod
+    def fulltext_enabled():
+        return get_plugin_config("{{ cookiecutter.underscored }}", "search_mode") == "fulltext"
+
+    @staticmethod
+    def fulltext_query(value):
+        """Parse value like a web search engine would ("quoted phrases", or, -excluded)."""
+        return SearchQuery(value, search_type="websearch", config=SEARCH_CONFIG)
+{%- endif %}
+
+    @classmethod
+    def search_query(cls, value, prefix=""):
+        """Return a Q object matching value in any of search_fields (shared with the GraphQL filter)."""
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+        if cls.fulltext_enabled():
+            return Q(**{f"{prefix}search_vector": cls.fulltext_query(value)})
+{%- endif %}
+        query = Q()
+        for field in cls.search_fields:
+            query |= Q(**{f"{prefix}{field}__icontains": value})
+        return query
+
     def search(self, queryset, name, value):
-        return queryset.filter(name__icontains=value)
+        value = value.strip()
+        if not value:
+            return queryset
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+        queryset = queryset.filter(self.search_query(value))
+        if not self.fulltext_enabled():
+            return queryset
+        # Best matches first, unless the client asks for another ordering
+        # (table sort or ?ordering=), which replaces this one
+        rank = SearchRank(F("search_vector"), self.fulltext_query(value))
+        return queryset.annotate(search_rank=rank).order_by("-search_rank", *self._meta.model._meta.ordering)
+{%- else %}
+        return queryset.filter(self.search_query(value))
+{%- endif %}
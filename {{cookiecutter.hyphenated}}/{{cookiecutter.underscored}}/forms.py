@@ -5,7 +5,8 @@ For more information on NetBox forms, see:
 https://docs.netbox.dev/en/stable/plugins/development/forms/
 """
 
-from netbox.forms import NetBoxModelForm
+from django import forms
+from netbox.forms import NetBoxModelBulkEditForm, NetBoxModelForm, NetBoxModelImportForm
 
 from .models import {{ cookiecutter.__model_name }}
 
@@ -14,3 +15,23 @@ class {{ cookiecutter.__model_name }}Form(NetBoxModelForm):
     class Meta:
         model = {{ cookiecutter.__model_name }}
         fields = ("name", "tags")
+
+
+class {{ cookiecutter.__model_name }}ImportForm(NetBoxModelImportForm):
+    class Meta:
+        model = {{ cookiecutter.__model_name }}
+        fields = ("name", "tags")
+
+
+class {{ cookiecutter.__model_name }}BulkEditForm(NetBoxModelBulkEditForm):
+    # name is unique, so the only bulk-editable attributes are the tags and
+    # custom fields provided by NetBoxModelBulkEditForm
+    model = {{ cookiecutter.__model_name }}
+    nullable_fields = ()
+
+
+class {{ cookiecutter.__model_name }}ImportJobForm(forms.Form):
+    file = forms.FileField(
+        label="CSV file",
+        help_text="Uses the same columns as the bulk import form. Rows with an id column update existing objects.",
+    )
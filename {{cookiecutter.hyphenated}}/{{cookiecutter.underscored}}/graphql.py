@@ -7,31 +7,109 @@ https://docs.netbox.dev/en/stable/plugins/development/graphql/
 
 For Strawberry GraphQL documentation, see:
 https://strawberry.rocks/
-"""
 
-from typing import List
+For strawberry-django filtering, ordering and pagination, see:
+https://strawberry.rocks/docs/django/guide/filters
+"""
 
 import strawberry
 import strawberry_django
+from django.db.models import Q
+from netbox.graphql.types import NetBoxObjectType
+from netbox.plugins.utils import get_plugin_config
+from strawberry_django.fields.field import StrawberryDjangoField
+from strawberry_django.pagination import OffsetPaginationInput
 
+from .filtersets import {{ cookiecutter.__model_name }}FilterSet
+from .graphql_cost import QueryCostExtension
+from .metrics import ResolverMetricsExtension
 from .models import {{ cookiecutter.__model_name }}
 
 
+@strawberry_django.filter_type({{ cookiecutter.__model_name }}, lookups=True)
+class {{ cookiecutter.__model_name }}Filter:
+    """Filters mirroring {{ cookiecutter.__model_name }}FilterSet, applied in SQL."""
+
+    id: strawberry_django.ComparisonFilterLookup[int] | None = strawberry_django.filter_field()
+    name: strawberry_django.FilterLookup[str] | None = strawberry_django.filter_field()
+
+    @strawberry_django.filter_field
+    def q(self, value: str, prefix: str) -> Q:
+        """Search like the REST API and UI "q" parameter."""
+        return {{ cookiecutter.__model_name }}FilterSet.search_query(value.strip(), prefix=prefix)
+
+
+@strawberry_django.order_type({{ cookiecutter.__model_name }})
+class {{ cookiecutter.__model_name }}Ordering:
+    id: strawberry.auto
+    name: strawberry.auto
+    created: strawberry.auto
+    last_updated: strawberry.auto
+
+
 @strawberry_django.type(
     {{ cookiecutter.__model_name }},
-    fields='__all__',
+    fields=("id", "name", "created", "last_updated"),
+    filters={{ cookiecutter.__model_name }}Filter,
+    ordering={{ cookiecutter.__model_name }}Ordering,
+    pagination=True,
 )
-class {{ cookiecutter.__model_name }}Type:
-    """GraphQL type for {{ cookiecutter.__model_name }} model."""
+class {{ cookiecutter.__model_name }}Type(NetBoxObjectType):
+    """
+    GraphQL type for {{ cookiecutter.__model_name }} model.
+
+    Fields are listed explicitly rather than with ``'__all__'``; tags, custom
+    fields, journal entries and the change log come from NetBoxObjectType,
+    whose resolvers NetBox's query optimizer knows how to prefetch. Add new
+    relations as typed fields so the optimizer can derive select_related(),
+    prefetch_related() and only() from the selection set instead of resolving
+    them lazily per row.
+    """
     pass
 
 
+class CappedListField(StrawberryDjangoField):
+    """
+    List field whose page size never exceeds PLUGINS_CONFIG["graphql_max_limit"].
+
+    Requests without a limit, or with a larger one, get the maximum, so a
+    single query can no longer load the whole table.
+    """
+
+    def apply_pagination(self, queryset, pagination=None, *, related_field_id=None):
+        max_limit = get_plugin_config("{{ cookiecutter.underscored }}", "graphql_max_limit")
+        limit = getattr(pagination, "limit", None)
+        if not isinstance(limit, int) or limit < 0 or limit > max_limit:
+            pagination = OffsetPaginationInput(offset=getattr(pagination, "offset", 0), limit=max_limit)
+        return super().apply_pagination(queryset, pagination, related_field_id=related_field_id)
+
+
 @strawberry.type(name="Query")
 class {{ cookiecutter.__model_name }}Query:
     """GraphQL queries for {{ cookiecutter.project_name }}."""
 
-    {{ cookiecutter.__model_url_name }}: {{ cookiecutter.__model_name }}Type = strawberry_django.field()
-    {{ cookiecutter.__model_url_name }}_list: List[{{ cookiecutter.__model_name }}Type] = strawberry_django.field()
+    {{ cookiecutter.__model_url_name }}: {{ cookiecutter.__model_name }}Type = strawberry_django.field(
+        extensions=[QueryCostExtension(), ResolverMetricsExtension()]
+    )
+
+    @strawberry_django.field(field_cls=CappedListField, extensions=[QueryCostExtension(), ResolverMetricsExtension()])
+    def {{ cookiecutter.__model_url_name }}_list(
+        self,
+        info: strawberry.Info,
+        after: strawberry.ID | None = None,
+    ) -> list[{{ cookiecutter.__model_name }}Type]:
+        """
+        List {{ cookiecutter.__model_name }}s.
+
+        Use ``pagination: {offset, limit}`` for offset pagination, or pass the
+        last ``id`` of the previous page as ``after`` to page through results
+        in ID order without an OFFSET (do not combine with ``ordering``).
+        Filters are applied in the database before paginating.
+        """
+        queryset = {{ cookiecutter.__model_name }}.objects.restrict(info.context.request.user, "view")
+        if after is not None:
+            queryset = queryset.filter(pk__gt=after).order_by("pk")
+        return queryset
 
 
 schema = [
@@ -0,0 +1,122 @@
+{% if cookiecutter.include_graphql == "yes" -%}
+"""
+Query cost analysis for the {{ cookiecutter.project_name }} GraphQL schema.
+
+QueryCostExtension is attached to the plugin's root query fields. Before a
+field is resolved it scores the field's selection set, logs the score and
+rejects the query if it is too deep or too expensive, so no SQL is run for
+rejected queries.
+
+Each selected field costs 1 per object it is resolved for. List fields
+multiply the cost of their selections by the number of objects they can
+return: the requested ``pagination.limit`` (capped at ``graphql_max_limit``),
+``graphql_max_limit`` when no limit is given on a root field, and
+LIST_SIZE_ESTIMATE for nested lists without pagination.
+
+For Strawberry field extensions, see:
+https://strawberry.rocks/docs/guides/field-extensions
+"""
+
+import logging
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    InlineFragmentNode,
+    get_named_type,
+    get_nullable_type,
+    is_composite_type,
+)
+from graphql.execution.values import get_argument_values
+from netbox.plugins.utils import get_plugin_config
+from strawberry.extensions import FieldExtension
+
+logger = logging.getLogger(__name__)
+
+# Assumed number of objects returned by a nested list field without pagination
+LIST_SIZE_ESTIMATE = 10
+
+
+def get_config(name):
+    return get_plugin_config("{{ cookiecutter.underscored }}", name)
+
+
+def list_size(field_def, node, info, nested):
+    """Return the number of objects a list field is expected to return."""
+    max_limit = get_config("graphql_max_limit")
+    arguments = get_argument_values(field_def, node, info.variable_values)
+    limit = (arguments.get("pagination") or {}).get("limit")
+    if isinstance(limit, int) and 0 <= limit <= max_limit:
+        return limit
+    return LIST_SIZE_ESTIMATE if nested and limit is None else max_limit
+
+
+def selection_cost(parent_type, selection_set, info, depth):
+    """Return (cost, depth) of the fields selected on parent_type."""
+    cost, max_depth = 0, depth
+    for selection in selection_set.selections if selection_set else ():
+        if isinstance(selection, FieldNode):
+            if selection.name.value.startswith("__"):
+                continue
+            field_def = parent_type.fields[selection.name.value]
+            field_cost, field_depth = field_cost_and_depth(field_def, selection, info, depth + 1, nested=True)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = info.fragments[selection.name.value]
+            fragment_type = info.schema.get_type(fragment.type_condition.name.value)
+            field_cost, field_depth = selection_cost(fragment_type, fragment.selection_set, info, depth)
+        elif isinstance(selection, InlineFragmentNode):
+            fragment_type = (
+                info.schema.get_type(selection.type_condition.name.value) if selection.type_condition else parent_type
+            )
+            field_cost, field_depth = selection_cost(fragment_type, selection.selection_set, info, depth)
+        else:
+            continue
+        cost += field_cost
+        max_depth = max(max_depth, field_depth)
+    return cost, max_depth
+
+
+def field_cost_and_depth(field_def, node, info, depth, nested):
+    """Return (cost, depth) of one selected field, including its selections."""
+    field_type = get_nullable_type(field_def.type)
+    multiplier = list_size(field_def, node, info, nested) if isinstance(field_type, GraphQLList) else 1
+
+    named_type = get_named_type(field_type)
+    if not is_composite_type(named_type) or not hasattr(named_type, "fields"):
+        return multiplier, depth
+
+    cost, max_depth = selection_cost(named_type, node.selection_set, info, depth)
+    return multiplier * (1 + cost), max_depth
+
+
+def get_query_cost(info):
+    """Return (cost, depth) of the root field being resolved."""
+    raw_info = info._raw_info
+    field_def = raw_info.parent_type.fields[raw_info.field_name]
+    cost, depth = 0, 0
+    for node in raw_info.field_nodes:
+        node_cost, node_depth = field_cost_and_depth(field_def, node, raw_info, 1, nested=False)
+        cost, depth = cost + node_cost, max(depth, node_depth)
+    return cost, depth
+
+
+class QueryCostExtension(FieldExtension):
+    """Reject root fields whose estimated cost or depth exceed the configured limits."""
+
+    def resolve(self, next_, source, info, **kwargs):
+        cost, depth = get_query_cost(info)
+        max_cost, max_depth = get_config("graphql_max_cost"), get_config("graphql_max_depth")
+        user = getattr(info.context.request, "user", None)
+        logger.info(f"GraphQL field {info.field_name} cost={cost} depth={depth} user={user}")
+
+        if depth > max_depth:
+            raise GraphQLError(f"Query depth {depth} exceeds the maximum of {max_depth} for {info.field_name}.")
+        if cost > max_cost:
+            raise GraphQLError(
+                f"Query cost {cost} exceeds the maximum of {max_cost} for {info.field_name}. "
+                "Select fewer fields or request smaller pages."
+            )
+        return next_(source, info, **kwargs)
+{% endif %}
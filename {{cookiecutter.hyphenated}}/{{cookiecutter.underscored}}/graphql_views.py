@@ -0,0 +1,108 @@
+{% if cookiecutter.include_graphql == "yes" -%}
+"""
+Persisted query GraphQL endpoint for {{ cookiecutter.project_name }}.
+
+PersistedQueryGraphQLView serves NetBox's full GraphQL schema with two
+additions for clients that send the same documents over and over:
+
+* Persisted queries, following the Apollo "automatic persisted queries"
+  protocol. A client sends ``extensions: {"persistedQuery": {"version": 1,
+  "sha256Hash": "<hash>"}}`` together with the query once to register it, and
+  afterwards only the hash and variables. An unknown hash is answered with
+  the protocol's ``PersistedQueryNotFound`` GraphQL error (HTTP 200), on which
+  clients resend the full document. Registered documents are kept in Django's
+  cache (NetBox's ``caching`` Redis database).
+* Parsed and validated documents are kept in a bounded in-process LRU cache
+  of ``graphql_query_cache_size`` entries, so repeated documents skip parsing
+  and validation.
+
+For Strawberry's parser and validation caches, see:
+https://strawberry.rocks/docs/extensions/parser-cache
+"""
+
+import dataclasses
+import functools
+import hashlib
+
+import strawberry
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from netbox.graphql.views import NetBoxGraphQLView
+from netbox.plugins.utils import get_plugin_config
+from strawberry.extensions import ParserCache, ValidationCache
+from strawberry.http.exceptions import HTTPException
+
+# Registered documents expire if they are not registered again within 30 days
+PERSISTED_QUERY_TIMEOUT = 60 * 60 * 24 * 30
+
+
+class PersistedQueryNotFound(Exception):
+    """The client sent a hash without its document, and the hash is not registered."""
+
+
+def persisted_query_key(sha256_hash):
+    return f"{{ cookiecutter.underscored }}:graphql:persisted:{sha256_hash}"
+
+
+@functools.cache
+def get_schema():
+    """
+    Return NetBox's GraphQL schema extended with parser and validation caches.
+
+    Built on first use, once every plugin has registered its GraphQL types.
+    """
+    from netbox.graphql.schema import schema
+
+    size = get_plugin_config("{{ cookiecutter.underscored }}", "graphql_query_cache_size")
+    return strawberry.Schema(
+        query=schema.query,
+        config=schema.config,
+        extensions=[*schema.extensions, ParserCache(maxsize=size), ValidationCache(maxsize=size)],
+    )
+
+
+class PersistedQueryGraphQLView(NetBoxGraphQLView):
+    """NetBox's GraphQL view with persisted queries and cached parsing/validation."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("schema", get_schema())
+        super().__init__(**kwargs)
+
+    @method_decorator(csrf_exempt)
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except PersistedQueryNotFound:
+            # Apollo clients only resend the full document on this exact GraphQL
+            # error; on an HTTP error they stop using persisted queries
+            return JsonResponse({
+                "errors": [{
+                    "message": "PersistedQueryNotFound",
+                    "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                }],
+            })
+
+    def parse_http_body(self, request):
+        request_data = super().parse_http_body(request)
+        persisted_query = (getattr(request_data, "extensions", None) or {}).get("persistedQuery")
+        if not persisted_query:
+            return request_data
+
+        sha256_hash = persisted_query.get("sha256Hash")
+        if persisted_query.get("version") != 1 or not isinstance(sha256_hash, str):
+            raise HTTPException(400, "Unsupported persisted query version or missing sha256Hash")
+
+        if request_data.query:
+            # Registration: the client sent the document along with its hash
+            if hashlib.sha256(request_data.query.encode()).hexdigest() != sha256_hash:
+                raise HTTPException(400, "provided sha does not match query")
+            cache.set(persisted_query_key(sha256_hash), request_data.query, PERSISTED_QUERY_TIMEOUT)
+            return request_data
+
+        query = cache.get(persisted_query_key(sha256_hash))
+        if query is None:
+            raise PersistedQueryNotFound
+        return dataclasses.replace(request_data, query=query)
+{% endif %}
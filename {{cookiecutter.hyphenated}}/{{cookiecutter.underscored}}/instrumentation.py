@@ -0,0 +1,62 @@
+"""
+Template rendering instrumentation for {{ cookiecutter.project_name }}.
+
+Metrics and tracing both need to see templates being rendered. They share a
+single wrapper around django.template.base.Template.render, which view
+templates, includes, inclusion tags and table templates all go through:
+
+* for metrics, the time spent rendering counts towards the request's
+  "template" section, with nested renders counted once;
+* for tracing, every named template becomes a span. Anonymous templates,
+  such as inline table column templates, are not recorded.
+
+Tracing also wraps django_tables2's render_table tag, which NetBox's list
+views use to render their table, so the queries fetching the table's rows
+land in a "<Table>.render" span.
+
+For Django's template API, see:
+https://docs.djangoproject.com/en/stable/ref/templates/api/
+"""
+
+import functools
+from contextlib import nullcontext
+
+from django.template.base import Template
+from django_tables2.templatetags.django_tables2 import RenderTableNode
+
+from .metrics import timed
+from .tracing import current_span, span
+
+
+def instrument_templates():
+    """
+    Wrap Template.render and the render_table tag for metrics and tracing.
+
+    Called once from the plugin's ready() when metrics or tracing are
+    enabled. Outside plugin requests the wrapper only adds two context
+    variable lookups.
+    """
+    render = Template.render
+    if getattr(render, "instrumented", False):
+        return
+
+    @functools.wraps(render)
+    def instrumented_render(self, context):
+        name = self.origin.template_name
+        traced = span("template.render", {"template.name": name}) if name and current_span.get() else nullcontext()
+        with timed("template"), traced:
+            return render(self, context)
+
+    instrumented_render.instrumented = True
+    Template.render = instrumented_render
+
+    render_table = RenderTableNode.render
+
+    @functools.wraps(render_table)
+    def traced_render_table(self, context):
+        if not current_span.get():
+            return render_table(self, context)
+        with span(f"{type(self.table.resolve(context)).__name__}.render"):
+            return render_table(self, context)
+
+    RenderTableNode.render = traced_render_table
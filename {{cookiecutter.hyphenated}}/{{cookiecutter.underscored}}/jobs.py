@@ -0,0 +1,162 @@
+"""
+Background jobs for {{ cookiecutter.project_name }}.
+
+For more information on NetBox background jobs, see:
+https://docs.netbox.dev/en/stable/plugins/development/background-jobs/
+"""
+
+import copy
+import csv
+import io
+import uuid
+from contextlib import ExitStack
+from itertools import batched
+
+from django.core.files.storage import default_storage
+from django.db import router, transaction
+from netbox.context import events_queue
+from netbox.jobs import JobRunner
+from netbox.plugins.utils import get_plugin_config
+from netbox.registry import registry
+from utilities.exceptions import PermissionsViolation
+from utilities.request import NetBoxFakeRequest
+
+from .forms import {{ cookiecutter.__model_name }}ImportForm
+from .models import {{ cookiecutter.__model_name }}
+from .reindex import reindex
+
+# Per-record errors kept on the job; further errors are only counted
+MAX_RECORDED_ERRORS = 1000
+
+
+def enqueue_import(file, user):
+    """Store an uploaded CSV file and enqueue a {{ cookiecutter.__model_name }}ImportJob for it."""
+    path = default_storage.save(f"{{ cookiecutter.underscored }}/imports/{uuid.uuid4().hex}.csv", file)
+    return {{ cookiecutter.__model_name }}ImportJob.enqueue(user=user, path=path)
+
+
+class {{ cookiecutter.__model_name }}ImportJob(JobRunner):
+    """
+    Import {{ cookiecutter.__model_name }}s from a CSV file in the background.
+
+    The file is read from storage one row at a time and written in batches of
+    ``import_job_batch_size`` records, each in its own transaction. Rows that
+    fail validation are skipped and reported in ``job.data["errors"]``; the
+    counters in ``job.data`` are saved after every batch so progress can be
+    followed on the job page or through ``/api/core/jobs/<id>/``.
+
+    As with the bulk import view, rows that contain an ``id`` column update
+    the existing object with that ID; all other rows create new objects.
+    """
+
+    class Meta:
+        name = "{{ cookiecutter.__model_name }} import"
+
+    def run(self, path, *args, **kwargs):
+        user = self.job.user
+        batch_size = get_plugin_config("{{ cookiecutter.underscored }}", "import_job_batch_size")
+        self.job.data = {"processed": 0, "created": 0, "updated": 0, "failed": 0, "errors": []}
+
+        # Attribute change log records and events to the user who enqueued the job
+        request = NetBoxFakeRequest({
+            "META": {},
+            "POST": {},
+            "GET": {},
+            "FILES": {},
+            "user": user,
+            "path": "",
+            "id": self.job.job_id,
+        })
+
+        try:
+            with default_storage.open(path, "rb") as file, ExitStack() as stack:
+                for request_processor in registry["request_processors"]:
+                    stack.enter_context(request_processor(request))
+
+                reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+                for batch in batched(enumerate(reader, start=1), batch_size):
+                    self.import_batch(batch, user)
+                    self.job.save(update_fields=["data"])
+        finally:
+            default_storage.delete(path)
+
+        self.logger.info(
+            f"Imported {self.job.data['created']} new and {self.job.data['updated']} updated objects, "
+            f"{self.job.data['failed']} records failed"
+        )
+
+    def import_batch(self, batch, user):
+        """Validate and save one batch of (record number, row) pairs in a single transaction."""
+        model = {{ cookiecutter.__model_name }}
+        pks = [int(row["id"]) for _, row in batch if (row.get("id") or "").isdigit()]
+        instances = model.objects.restrict(user, "change").in_bulk(pks)
+
+        data_before = copy.deepcopy(self.job.data)
+        queued_events = dict(events_queue.get())
+        saved = {"add": [], "change": []}
+        try:
+            with transaction.atomic(using=router.db_for_write(model)):
+                for number, row in batch:
+                    self.job.data["processed"] += 1
+                    if None in row.values():
+                        # csv.DictReader fills the missing trailing columns of short rows with None
+                        self.record_error(number, {"__all__": ["Record has fewer columns than the header."]})
+                        continue
+
+                    instance = None
+                    if pk := row.get("id") or "":
+                        instance = instances.get(int(pk)) if pk.isdigit() else None
+                        if instance is None:
+                            self.record_error(number, {"id": [f"No object with ID {pk} found."]})
+                            continue
+                        instance.snapshot()
+
+                    form = {{ cookiecutter.__model_name }}ImportForm(data=row, instance=instance)
+                    if instance:
+                        # Like NetBox's bulk import, only update the fields present in the
+                        # record, so missing columns don't clear tags or custom fields
+                        for name in [name for name in form.fields if name not in row]:
+                            del form.fields[name]
+                    if not form.is_valid():
+                        self.record_error(number, form.errors.get_json_data())
+                        continue
+
+                    saved["change" if instance else "add"].append(form.save().pk)
+
+                # Enforce object-level permissions
+                for action, saved_pks in saved.items():
+                    if model.objects.restrict(user, action).filter(pk__in=saved_pks).count() != len(saved_pks):
+                        raise PermissionsViolation
+        except PermissionsViolation as e:
+            # The whole batch was rolled back, so report each of its records as failed
+            events_queue.set(queued_events)
+            self.job.data = data_before
+            self.job.data["processed"] += len(batch)
+            for number, _ in batch:
+                self.record_error(number, {"__all__": [e.message]})
+            return
+
+        self.job.data["created"] += len(saved["add"])
+        self.job.data["updated"] += len(saved["change"])
+
+    def record_error(self, number, errors):
+        """Record the validation errors for one record on the job."""
+        self.job.data["failed"] += 1
+        if len(self.job.data["errors"]) < MAX_RECORDED_ERRORS:
+            self.job.data["errors"].append({"record": number, "errors": errors})
+
+
+class {{ cookiecutter.__model_name }}ReindexJob(JobRunner):
+    """
+    Rebuild the plugin's cached global search values in the background.
+
+    Accepts the same ``full``, ``batch_size`` and ``workers`` arguments as
+    reindex(); the number of objects reindexed per model is stored in
+    ``job.data``.
+    """
+
+    class Meta:
+        name = "{{ cookiecutter.project_name }} search reindex"
+
+    def run(self, full=False, batch_size=1000, workers=4, *args, **kwargs):
+        self.job.data = reindex(full=full, batch_size=batch_size, workers=workers, log=self.logger.info)
@@ -0,0 +1,6 @@
+"""
+Management commands for {{ cookiecutter.project_name }}.
+
+For more information on custom management commands, see:
+https://docs.djangoproject.com/en/stable/howto/custom-management-commands/
+"""
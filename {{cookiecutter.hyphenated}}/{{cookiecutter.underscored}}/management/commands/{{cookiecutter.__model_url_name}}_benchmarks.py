@@ -0,0 +1,81 @@
+"""
+Run the {{ cookiecutter.project_name }} benchmark suite.
+
+Measures the plugin's hot paths at several dataset sizes and writes latency
+percentiles, query counts and peak memory as JSON. With --compare, the results
+are checked against a baseline file and the command fails if any case
+regressed. All seeded data is rolled back when the command finishes.
+
+Usage:
+    export NETBOX_CONFIGURATION=testing.configuration
+    python manage.py {{ cookiecutter.__model_url_name }}_benchmarks --output baseline.json
+    python manage.py {{ cookiecutter.__model_url_name }}_benchmarks --sizes 1000 10000 --compare baseline.json
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...benchmarks import compare_results, run_benchmarks
+from ...benchmarks.cases import cases
+
+
+class Command(BaseCommand):
+    help = "Benchmark {{ cookiecutter.project_name }} hot paths and compare the results with a baseline"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+            help="Dataset sizes to benchmark (default: 1000 10000 100000)",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=20,
+            help="Number of timed runs per case and size (default: 20)",
+        )
+        parser.add_argument(
+            "--case", action="append", dest="cases", choices=sorted(cases),
+            help="Case to run (may be given multiple times; default: all)",
+        )
+        parser.add_argument(
+            "--output",
+            help="File to write the JSON results to (default: standard output)",
+        )
+        parser.add_argument(
+            "--compare", metavar="BASELINE",
+            help="JSON results of an earlier run to check for regressions",
+        )
+        parser.add_argument(
+            "--threshold", type=float, default=0.2,
+            help="Allowed relative increase of latency and memory before a case counts as regressed (default: 0.2)",
+        )
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1 or min(options["sizes"]) < 1:
+            raise CommandError("--repeat and --sizes must be at least 1")
+
+        baseline = None
+        if options["compare"]:
+            try:
+                baseline = json.loads(Path(options["compare"]).read_text())
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Cannot read baseline {options['compare']}: {e}") from e
+
+        results = run_benchmarks(
+            sizes=options["sizes"], repeat=options["repeat"], names=options["cases"], log=self.stderr.write
+        )
+
+        output = json.dumps(results, indent=2)
+        if options["output"]:
+            Path(options["output"]).write_text(output + "\n")
+            self.stderr.write(f"Results written to {options['output']}")
+        else:
+            self.stdout.write(output)
+
+        if baseline is not None:
+            regressions = compare_results(results, baseline, options["threshold"], log=self.stderr.write)
+            if regressions:
+                raise CommandError(
+                    f"{len(regressions)} regression(s) against {options['compare']}:\n" + "\n".join(regressions)
+                )
+            self.stderr.write(self.style.SUCCESS(f"No regressions against {options['compare']}"))
@@ -0,0 +1,155 @@
+"""
+Benchmark {{ cookiecutter.__model_name }} list view search latency.
+
+Seeds a large number of {{ cookiecutter.__model_name }} rows inside a transaction, times
+``?q=`` requests against the list view with and without the trigram indexes
+declared on the model, and rolls everything back when done.
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+
+The indexed substring search (search_mode "icontains") is also compared with
+the ranked full-text search (search_mode "fulltext"). The two modes match
+differently: full-text search matches whole words, not substrings.
+{%- endif %}
+
+Unlike the {{ cookiecutter.__model_url_name }}_benchmarks suite, which tracks every hot path
+across releases, this command compares search configurations on one dataset.
+
+Usage:
+    python manage.py {{ cookiecutter.__model_url_name }}_search_benchmark --rows 1000000
+    python manage.py {{ cookiecutter.__model_url_name }}_search_benchmark --rows 100000 --query 4242 --query 99999
+"""
+
+import time
+import uuid
+
+{% if cookiecutter.include_fulltext_search == "yes" -%}
+from django.conf import settings
+{% endif -%}
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client{% if cookiecutter.include_fulltext_search == "yes" %}, override_settings{% endif %}
+from django.urls import reverse
+
+from ...benchmarks.runner import percentile
+from ...models import {{ cookiecutter.__model_name }}
+
+# Seeded names are "bench-<token>-<8 digit row number>", so these terms match
+# exactly one row, a handful of rows and no rows respectively.
+DEFAULT_QUERIES = ("00042421", "42424", "no-such-row")
+
+
+class Command(BaseCommand):
+    help = "Benchmark {{ cookiecutter.__model_name }} list view search with and without the trigram indexes{% if cookiecutter.include_fulltext_search == "yes" %}, and against full-text search{% endif %}"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=1_000_000,
+            help="Number of rows to seed (default: 1000000)",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=10,
+            help="Number of timed requests per search term (default: 10)",
+        )
+        parser.add_argument(
+            "--query", action="append", dest="queries",
+            help="Search term to benchmark (may be given multiple times)",
+        )
+
+    def handle(self, *args, **options):
+        queries = options["queries"] or DEFAULT_QUERIES
+        repeat = options["repeat"]
+        if repeat < 1:
+            raise CommandError("--repeat must be at least 1")
+
+        url = reverse("plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list")
+
+        # Everything below is rolled back, including the dropped indexes.
+        with transaction.atomic():
+            self.stdout.write(f"Seeding {options['rows']} rows...")
+            self.seed(options["rows"])
+
+            user = get_user_model().objects.create_user(
+                username=f"benchmark-{uuid.uuid4().hex[:8]}",
+                is_superuser=True,
+            )
+            client = Client()
+            client.force_login(user)
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+
+            with self.search_mode("fulltext"):
+                fulltext = self.time_queries(client, url, queries, repeat)
+            with self.search_mode("icontains"):
+                indexed = self.time_queries(client, url, queries, repeat)
+                with connection.schema_editor() as schema_editor:
+                    for index in {{ cookiecutter.__model_name }}._meta.indexes:
+                        schema_editor.remove_index({{ cookiecutter.__model_name }}, index)
+                unindexed = self.time_queries(client, url, queries, repeat)
+{%- else %}
+
+            indexed = self.time_queries(client, url, queries, repeat)
+            with connection.schema_editor() as schema_editor:
+                for index in {{ cookiecutter.__model_name }}._meta.indexes:
+                    schema_editor.remove_index({{ cookiecutter.__model_name }}, index)
+            unindexed = self.time_queries(client, url, queries, repeat)
+{%- endif %}
+
+            transaction.set_rollback(True)
+
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+
+        self.stdout.write("Substring search without (before) and with (after) the trigram indexes")
+        self.report(queries, unindexed, indexed)
+        self.stdout.write("\nIndexed substring search (before) and full-text search (after)")
+        self.report(queries, indexed, fulltext)
+
+    def search_mode(self, mode):
+        """Return a context manager that switches the plugin's search_mode setting."""
+        plugins_config = settings.PLUGINS_CONFIG
+        plugin_config = {**plugins_config.get("{{ cookiecutter.underscored }}", {}), "search_mode": mode}
+        return override_settings(PLUGINS_CONFIG={**plugins_config, "{{ cookiecutter.underscored }}": plugin_config})
+{%- else %}
+
+        self.report(queries, unindexed, indexed)
+{%- endif %}
+
+    def seed(self, rows):
+        """Insert rows server-side with generate_series() and refresh planner statistics."""
+        table = connection.ops.quote_name({{ cookiecutter.__model_name }}._meta.db_table)
+        prefix = f"bench-{uuid.uuid4().hex[:8]}-"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO " + table + " (name, custom_field_data, created, last_updated) "
+                "SELECT %s || lpad(g::text, 8, '0'), %s::jsonb, now(), now() "
+                "FROM generate_series(1, %s) AS g",
+                [prefix, "{}", rows],
+            )
+            cursor.execute("ANALYZE " + table)
+
+    def time_queries(self, client, url, queries, repeat):
+        """Return a mapping of search term to request latencies in milliseconds."""
+        timings = {}
+        for query in queries:
+            # Warm up caches so the first timed request is not an outlier
+            client.get(url, {"q": query})
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                response = client.get(url, {"q": query})
+                samples.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    raise CommandError(f"List view returned HTTP {response.status_code} for q={query!r}")
+            timings[query] = sorted(samples)
+        return timings
+
+    def report(self, queries, before, after):
+        self.stdout.write(
+            f"{'query':<16} {'p50 before':>12} {'p50 after':>12} {'p95 before':>12} {'p95 after':>12} {'speedup':>9}"
+        )
+        for query in queries:
+            p50_before, p50_after = percentile(before[query], 50), percentile(after[query], 50)
+            p95_before, p95_after = percentile(before[query], 95), percentile(after[query], 95)
+            self.stdout.write(
+                f"{query:<16} {p50_before:>10.1f}ms {p50_after:>10.1f}ms "
+                f"{p95_before:>10.1f}ms {p95_after:>10.1f}ms {p50_before / p50_after:>8.1f}x"
+            )
@@ -0,0 +1,216 @@
+"""
+Prometheus metrics for {{ cookiecutter.project_name }} views.
+
+MetricsMiddleware times every request handled by one of the plugin's views
+and records, per view (URL name):
+
+* request latency and the number of requests by response status,
+* the number of SQL queries and the time spent running them,
+* the time spent in the plugin's serializers and rendering templates.
+{%- if cookiecutter.include_graphql == "yes" %}
+
+ResolverMetricsExtension additionally times the plugin's GraphQL root fields,
+whichever GraphQL endpoint serves them.
+{%- endif %}
+
+metrics_view() exposes the metrics in the Prometheus text format. Scrapers
+have no session, so it accepts NetBox API tokens, and requires one when
+LOGIN_REQUIRED is set. Everything is disabled unless ``metrics_enabled`` is
+set in PLUGINS_CONFIG. Metrics use prometheus_client, which NetBox installs
+for its own /metrics endpoint, and honour PROMETHEUS_MULTIPROC_DIR when
+NetBox runs in several worker processes.
+
+For prometheus_client, see:
+https://prometheus.github.io/client_python/
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connection
+from django.http import Http404, HttpResponse
+from django.urls import Resolver404, resolve
+from netbox.api.authentication import TokenAuthentication
+from netbox.plugins.utils import get_plugin_config
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+from rest_framework.exceptions import AuthenticationFailed
+{%- if cookiecutter.include_graphql == "yes" %}
+from strawberry.extensions import FieldExtension
+{%- endif %}
+
+# URL namespaces of the plugin's views
+VIEW_NAMESPACES = ("plugins:{{ cookiecutter.underscored }}", "plugins-api:{{ cookiecutter.underscored }}-api")
+
+registry = CollectorRegistry()
+
+REQUEST_DURATION = Histogram(
+    "request_duration_seconds", "Request latency", ["view", "method"],
+    namespace="{{ cookiecutter.underscored }}", registry=registry,
+)
+REQUESTS = Counter(
+    "requests", "Requests by response status", ["view", "method", "status"],
+    namespace="{{ cookiecutter.underscored }}", registry=registry,
+)
+DB_QUERIES = Histogram(
+    "db_queries", "SQL queries per request", ["view"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+    namespace="{{ cookiecutter.underscored }}", registry=registry,
+)
+DB_DURATION = Histogram(
+    "db_duration_seconds", "Time spent running SQL queries per request", ["view"],
+    namespace="{{ cookiecutter.underscored }}", registry=registry,
+)
+SERIALIZER_DURATION = Histogram(
+    "serializer_duration_seconds", "Time spent serializing objects per request", ["view"],
+    namespace="{{ cookiecutter.underscored }}", registry=registry,
+)
+TEMPLATE_DURATION = Histogram(
+    "template_render_duration_seconds", "Time spent rendering templates per request", ["view"],
+    namespace="{{ cookiecutter.underscored }}", registry=registry,
+)
+{%- if cookiecutter.include_graphql == "yes" %}
+GRAPHQL_RESOLVER_DURATION = Histogram(
+    "graphql_resolver_duration_seconds", "GraphQL root field resolver latency", ["field"],
+    namespace="{{ cookiecutter.underscored }}", registry=registry,
+)
+{%- endif %}
+
+# Timings of the plugin request being handled, if any
+current_timings = ContextVar("{{ cookiecutter.underscored }}_metrics_timings", default=None)
+
+
+def metrics_enabled():
+    return get_plugin_config("{{ cookiecutter.underscored }}", "metrics_enabled")
+
+
+class RequestTimings:
+    """Query counts and section durations accumulated while handling one request."""
+
+    def __init__(self):
+        self.queries = 0
+        self.durations = {"db": 0.0, "serializer": 0.0, "template": 0.0}
+        self.depth = dict.fromkeys(self.durations, 0)
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """Database execute wrapper counting and timing every query."""
+        self.queries += 1
+        with self.section("db"):
+            return execute(sql, params, many, context)
+
+    @contextmanager
+    def section(self, name):
+        """Add the time spent in the block to name, ignoring nested blocks of the same name."""
+        self.depth[name] += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.depth[name] -= 1
+            if not self.depth[name]:
+                self.durations[name] += time.perf_counter() - start
+
+    def observe(self, view, method, status, duration):
+        REQUEST_DURATION.labels(view, method).observe(duration)
+        REQUESTS.labels(view, method, status).inc()
+        DB_QUERIES.labels(view).observe(self.queries)
+        DB_DURATION.labels(view).observe(self.durations["db"])
+        if self.durations["serializer"]:
+            SERIALIZER_DURATION.labels(view).observe(self.durations["serializer"])
+        if self.durations["template"]:
+            TEMPLATE_DURATION.labels(view).observe(self.durations["template"])
+
+
+@contextmanager
+def timed(name):
+    """Time the block as section name of the current plugin request, if one is being measured."""
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+    with timings.section(name):
+        yield
+
+
+def get_request_user(request):
+    """
+    Return the user making request, or None if it is not authenticated.
+
+    Session users are known to every middleware and view; API token users are
+    only authenticated by REST framework views, so their token is checked here.
+    """
+    if request.user.is_authenticated:
+        return request.user
+    try:
+        result = TokenAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+def get_view_name(request):
+    """Return the URL name of the plugin view handling request, or None for other views."""
+    try:
+        match = resolve(request.path_info)
+    except Resolver404:
+        return None
+    if match.namespace not in VIEW_NAMESPACES:
+        return None
+    return match.view_name
+
+
+class MetricsMiddleware:
+    """Record latency, SQL and rendering metrics for requests handled by plugin views."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        view = get_view_name(request) if metrics_enabled() else None
+        if view is None:
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(timings.execute_wrapper):
+                response = self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        timings.observe(view, request.method, response.status_code, time.perf_counter() - start)
+        return response
+{%- if cookiecutter.include_graphql == "yes" %}
+
+
+class ResolverMetricsExtension(FieldExtension):
+    """Record the latency of a GraphQL field's resolver, including its SQL queries."""
+
+    def resolve(self, next_, source, info, **kwargs):
+        if not metrics_enabled():
+            return next_(source, info, **kwargs)
+        start = time.perf_counter()
+        try:
+            return next_(source, info, **kwargs)
+        finally:
+            GRAPHQL_RESOLVER_DURATION.labels(info.field_name).observe(time.perf_counter() - start)
+{%- endif %}
+
+
+def metrics_view(request):
+    """Return the plugin's metrics in the Prometheus text format."""
+    if not metrics_enabled():
+        raise Http404("Metrics are disabled")
+    if settings.LOGIN_REQUIRED and get_request_user(request) is None:
+        response = HttpResponse("Authentication credentials were not provided.", status=401)
+        response["WWW-Authenticate"] = "Bearer"
+        return response
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # Aggregate the metrics written by every worker process
+        output_registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(output_registry)
+    else:
+        output_registry = registry
+    return HttpResponse(generate_latest(output_registry), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,19 @@
+"""
+Enable the PostgreSQL pg_trgm extension.
+
+The trigram GIN indexes declared in {{ cookiecutter.__model_name }}.Meta.indexes use the
+``gin_trgm_ops`` operator class provided by this extension, so it must be
+installed before the model migration is applied. Running ``makemigrations``
+for a new plugin places the initial model migration after this one.
+"""
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = []
+
+    operations = [
+        TrigramExtension(),
+    ]
@@ -8,18 +8,80 @@ For NetBox model features (tags, custom fields, change logging, etc.), see:
 https://docs.netbox.dev/en/stable/development/models/#netbox-model-features
 """
 
+{% if cookiecutter.include_fulltext_search == "yes" -%}
+import functools
+import operator
+
+{% endif -%}
+from django.contrib.postgres.indexes import GinIndex, OpClass
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+{%- endif %}
 from django.db import models
+from django.db.models.functions import Upper
 from django.urls import reverse
 from netbox.models import NetBoxModel
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+
+# Text search configuration of {{ cookiecutter.__model_name }}.search_vector. Queries must use the
+# same configuration to match; changing it requires a new migration.
+SEARCH_CONFIG = "english"
+
+# Fields indexed by NetBox's global search ({{ cookiecutter.__model_name }}Index in search.py) and by
+# {{ cookiecutter.__model_name }}.search_vector, with their SearchIndex weights.
+SEARCH_FIELDS = (
+    ("name", 100),
+    # ("description", 500),  # Uncomment if your model has a description field
+    # ("comments", 5000),    # Uncomment if your model has a comments field
+)
+
+
+def search_weight(weight):
+    """Map a SearchIndex weight (lower ranks higher) to a PostgreSQL tsvector weight."""
+    for limit, label in ((100, "A"), (300, "B"), (1000, "C")):
+        if weight <= limit:
+            return label
+    return "D"
+
+
+def search_vector(fields):
+    """Return the weighted tsvector expression over fields."""
+    return functools.reduce(
+        operator.add,
+        (SearchVector(field, weight=search_weight(weight), config=SEARCH_CONFIG) for field, weight in fields),
+    )
+{%- endif %}
 
 
 class {{ cookiecutter.__model_name }}(NetBoxModel):
     name = models.CharField(max_length=100, unique=True)
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+    # Maintained by PostgreSQL on every write; searched by {{ cookiecutter.__model_name }}FilterSet
+    # when search_mode is "fulltext". Not serialized into change records.
+    search_vector = models.GeneratedField(
+        expression=search_vector(SEARCH_FIELDS),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        serialize=False,
+    )
+{%- endif %}
 
     class Meta:
         app_label = "{{ cookiecutter.underscored }}"
         ordering = ("name",)
         verbose_name_plural = "{{ cookiecutter.__model_name }}s"
+        indexes = (
+            # Trigram index for the case-insensitive substring match done by
+            # {{ cookiecutter.__model_name }}FilterSet.search(). It indexes UPPER(name) because that
+            # is the expression Django emits for ``icontains`` on PostgreSQL.
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="{{ cookiecutter.__model_url_name }}_name_trgm",
+            ),
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+            GinIndex(fields=("search_vector",), name="{{ cookiecutter.__model_url_name }}_search_vector"),
+{%- endif %}
+        )
 
     def __str__(self):
         return self.name
@@ -12,7 +12,12 @@ plugin_buttons = [
         link="plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_add",
         title="Add",
         icon_class="mdi mdi-plus-thick",
-    )
+    ),
+    PluginMenuButton(
+        link="plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_bulk_import",
+        title="Import",
+        icon_class="mdi mdi-upload",
+    ),
 ]
 
 menu_items = (
@@ -21,4 +26,13 @@ menu_items = (
         link_text="{{ cookiecutter.plugin_name }}",
         buttons=plugin_buttons,
     ),
+    PluginMenuItem(
+        link="plugins:{{ cookiecutter.underscored }}:request_profile_list",
+        link_text="Request profiles",
+        # The profile views are superuser-only. Menu items have no such flag, so
+        # require a permission on a model that does not exist: no ObjectPermission
+        # can grant it, superusers implicitly hold every permission, and as it is
+        # not a view permission EXEMPT_VIEW_PERMISSIONS does not apply.
+        permissions=["{{ cookiecutter.underscored }}.download_requestprofile"],
+    ),
 )
@@ -0,0 +1,254 @@
+"""
+On-demand profiling of {{ cookiecutter.project_name }} requests.
+
+When ``profiling_enabled`` is set, a superuser can profile a single request to
+any plugin view or API endpoint by adding ``?_profile=1`` to the URL or sending
+an ``X-Profile: 1`` header. ProfilerMiddleware runs that request under cProfile
+and records every SQL query with its start offset, duration and the line of
+code that issued it. The text report (request summary, SQL timeline, SQL time
+per issuing function next to that function's profiled time, and the hottest
+functions) and the raw pstats data are written to
+``profiling_directory``, which keeps the ``profiling_max_profiles`` most
+recent profiles and deletes older ones.
+
+Superusers can list and download profiles at ``profiles/``. The profile
+covers the view only; streamed response bodies are generated afterwards.
+Only one request per process is profiled at a time, as Python allows a
+single active profiler; concurrent requests are served unprofiled.
+
+For cProfile and pstats, see:
+https://docs.python.org/3/library/profile.html
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import re
+import tempfile
+import threading
+import time
+import traceback
+from datetime import UTC, datetime
+from pathlib import Path
+
+from django.db import connection
+from django.urls import reverse
+from netbox.plugins.utils import get_plugin_config
+
+from .metrics import get_request_user, get_view_name
+
+PROFILE_PARAMETER = "_profile"
+PROFILE_HEADER = "HTTP_X_PROFILE"
+
+# Number of functions listed in the report
+REPORT_FUNCTIONS = 60
+
+# Profile names are generated by save_profile(); anything else is rejected
+PROFILE_NAME_RE = re.compile(r"^\d{8}T\d{12}-[\w.-]+$")
+
+# Held while a request is profiled; since Python 3.12 cProfile uses sys.monitoring,
+# which refuses to enable a second profiler in the same process
+PROFILER_LOCK = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+def get_config(name):
+    return get_plugin_config("{{ cookiecutter.underscored }}", name)
+
+
+def get_profile_directory():
+    """Return the directory holding saved profiles."""
+    directory = get_config("profiling_directory")
+    return Path(directory) if directory else Path(tempfile.gettempdir()) / "{{ cookiecutter.underscored }}-profiles"
+
+
+def profiling_requested(request):
+    value = request.GET.get(PROFILE_PARAMETER) or request.META.get(PROFILE_HEADER) or ""
+    return value.lower() in ("1", "true", "yes")
+
+
+def get_caller():
+    """Return the innermost stack frame outside Django and this module, or None."""
+    for frame in reversed(traceback.extract_stack()[:-1]):
+        if "/django/" not in frame.filename and frame.filename != __file__:
+            return frame
+    return None
+
+
+def format_caller(frame):
+    return f"{frame.filename}:{frame.lineno} {frame.name}" if frame else "?"
+
+
+def get_function_key(stats, frame):
+    """Return the pstats key of the function containing frame, or None if it was not profiled."""
+    lines = [
+        line for (filename, line, name) in stats.stats
+        if filename == frame.filename and name == frame.name and line <= frame.lineno
+    ]
+    return (frame.filename, max(lines), frame.name) if lines else None
+
+
+def format_sql_by_function(queries, stats):
+    """Return report lines with the SQL time of each issuing function next to its cumulative time."""
+    functions = {}
+    for query in queries:
+        frame = query["caller"]
+        key = get_function_key(stats, frame) if frame else None
+        function = functions.setdefault(key or format_caller(frame), {"key": key, "queries": 0, "duration": 0.0})
+        function["queries"] += 1
+        function["duration"] += query["duration"]
+
+    lines = []
+    for location, function in sorted(functions.items(), key=lambda item: -item[1]["duration"]):
+        if key := function["key"]:
+            # Same columns as pstats: cumulative time, then filename:lineno(function)
+            cumulative = f"{stats.stats[key][3] * 1000:9.1f} ms"
+            location = pstats.func_std_string(key)
+        else:
+            cumulative = f"{'?':>12}"
+        lines.append(
+            f"  {function['duration'] * 1000:9.1f} ms in {function['queries']:4} queries of {cumulative}  {location}"
+        )
+    return lines
+
+
+class SQLRecorder:
+    """Database execute wrapper recording the offset, duration and origin of every query."""
+
+    def __init__(self, start):
+        self.start = start
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                "offset": started - self.start,
+                "duration": time.perf_counter() - started,
+                "sql": sql,
+                "caller": get_caller(),
+            })
+
+
+def format_report(request, view, status, duration, profiler, queries):
+    """Return the text report of a profiled request."""
+    sql_time = sum(query["duration"] for query in queries)
+    lines = [
+        f"{request.method} {request.get_full_path()}",
+        f"View: {view}",
+        f"Status: {status}",
+        f"Profiled at: {datetime.now(UTC).isoformat(timespec='seconds')}",
+        f"Total: {duration * 1000:.1f} ms, {len(queries)} SQL queries in {sql_time * 1000:.1f} ms",
+        "",
+        "SQL timeline (start offset, duration, caller):",
+    ]
+    for query in queries:
+        lines.append(
+            f"  +{query['offset'] * 1000:9.1f} ms {query['duration'] * 1000:8.1f} ms  {format_caller(query['caller'])}"
+        )
+        lines.append(f"      {query['sql']}")
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    lines += ["", "SQL time by issuing function, of the function's cumulative time:"]
+    lines += format_sql_by_function(queries, stats)
+
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(REPORT_FUNCTIONS)
+    lines += ["", f"Profile (top {REPORT_FUNCTIONS} functions by cumulative time):", stream.getvalue()]
+    return "\n".join(lines)
+
+
+def save_profile(view, report, profiler):
+    """Write a profile's report and pstats data, delete the oldest profiles and return its name."""
+    directory = get_profile_directory()
+    directory.mkdir(parents=True, exist_ok=True)
+    slug = re.sub(r"[^\w.-]", "_", view)
+    name = f"{datetime.now(UTC):%Y%m%dT%H%M%S%f}-{slug}"
+    (directory / f"{name}.txt").write_text(report)
+    profiler.dump_stats(directory / f"{name}.prof")
+
+    for old in list_profiles()[get_config("profiling_max_profiles"):]:
+        for suffix in (".txt", ".prof"):
+            (directory / f"{old['name']}{suffix}").unlink(missing_ok=True)
+    return name
+
+
+def list_profiles():
+    """Return the saved profiles, newest first."""
+    directory = get_profile_directory()
+    if not directory.is_dir():
+        return []
+    profiles = []
+    for path in sorted(directory.glob("*.txt"), reverse=True):
+        if PROFILE_NAME_RE.match(path.stem):
+            stat = path.stat()
+            profiles.append({
+                "name": path.stem,
+                "created": datetime.fromtimestamp(stat.st_mtime, UTC),
+                "size": stat.st_size,
+            })
+    return profiles
+
+
+def get_profile_path(name, suffix):
+    """Return the path of a saved profile file, or None if there is no such profile."""
+    if not PROFILE_NAME_RE.match(name):
+        return None
+    path = get_profile_directory() / f"{name}{suffix}"
+    return path if path.is_file() else None
+
+
+class ProfilerMiddleware:
+    """Profile plugin requests that a superuser asked to profile."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not get_config("profiling_enabled") or not profiling_requested(request):
+            return self.get_response(request)
+        view = get_view_name(request)
+        user = get_request_user(request) if view else None
+        if user is None or not user.is_superuser:
+            return self.get_response(request)
+
+        profiled = self.profile(request)
+        if profiled is None:
+            logger.warning(f"Not profiling {request.get_full_path()}: another profiler is active")
+            return self.get_response(request)
+        response, profiler, queries, duration = profiled
+
+        report = format_report(request, view, response.status_code, duration, profiler, queries)
+        name = save_profile(view, report, profiler)
+        response["X-Profile"] = reverse("plugins:{{ cookiecutter.underscored }}:request_profile", kwargs={"name": name})
+        return response
+
+    def profile(self, request):
+        """
+        Handle request under cProfile and return (response, profiler, queries, duration).
+
+        Returns None without handling the request if another request or tool is
+        already profiling this process.
+        """
+        if not PROFILER_LOCK.acquire(blocking=False):
+            return None
+        try:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                return None
+            start = time.perf_counter()
+            recorder = SQLRecorder(start)
+            try:
+                with connection.execute_wrapper(recorder):
+                    response = self.get_response(request)
+            finally:
+                profiler.disable()
+            return response, profiler, recorder.queries, time.perf_counter() - start
+        finally:
+            PROFILER_LOCK.release()
@@ -7,7 +7,7 @@ global search. See: https://docs.netbox.dev/en/stable/plugins/development/search
 
 from netbox.search import SearchIndex
 
-from .models import {{ cookiecutter.__model_name }}
+from .models import {% if cookiecutter.include_fulltext_search == "yes" %}SEARCH_FIELDS, {% endif %}{{ cookiecutter.__model_name }}
 
 
 class {{ cookiecutter.__model_name }}Index(SearchIndex):
@@ -21,7 +21,7 @@ class {{ cookiecutter.__model_name }}Index(SearchIndex):
     model = {{ cookiecutter.__model_name }}
 
     # Fields to index for search with their weights
-    # Higher weight = higher priority in search results
+    # Lower weight = higher priority in search results
     #
     # Weight Guidelines:
     #   50   - Unique serialized attribute (e.g., asset_tag)
@@ -34,12 +34,18 @@ class {{ cookiecutter.__model_name }}Index(SearchIndex):
     #   1000 - Custom field default
     #   2000 - Other discrete attributes
     #   5000 - Comments field
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+    # Shared with the model's full-text search_vector column, so edit
+    # SEARCH_FIELDS in models.py (and run makemigrations) to change them
+    fields = SEARCH_FIELDS
+{%- else %}
     fields = (
         ('name', 100),          # Primary identifier
         # ('slug', 110),        # Uncomment if your model has a slug field
         # ('description', 500), # Uncomment if your model has a description field
         # ('comments', 5000),   # Uncomment if your model has a comments field
     )
+{%- endif %}
 
     # Optional: Fields to display in search results (not indexed, just shown)
     # These help users identify the correct result
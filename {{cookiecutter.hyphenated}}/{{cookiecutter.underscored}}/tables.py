@@ -9,15 +9,72 @@ https://django-tables2.readthedocs.io/
 """
 
 import django_tables2 as tables
-from netbox.tables import NetBoxTable
+from django.core.exceptions import FieldDoesNotExist
+from django_tables2.data import TableQuerysetData
+from netbox.tables import NetBoxTable, columns
 
+from .counts import ApproximateCountPaginator
 from .models import {{ cookiecutter.__model_name }}
 
 
 class {{ cookiecutter.__model_name }}Table(NetBoxTable):
     name = tables.Column(linkify=True)
+    tags = columns.TagColumn(url_name="plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list")
 
     class Meta(NetBoxTable.Meta):
         model = {{ cookiecutter.__model_name }}
-        fields = ("pk", "id", "name", "actions")
+        fields = ("pk", "id", "name", "tags", "actions")
         default_columns = ("name",)
+
+    def configure(self, request):
+        # Exports may render columns the user has hidden, so they load every field
+        self.optimize_queryset = "export" not in request.GET
+        super().configure(request)
+
+    def paginate(self, *args, **kwargs):
+        # configure() calls this once the visible columns are known, before any
+        # page is fetched, so the page is read from the optimized queryset
+        if getattr(self, "optimize_queryset", False) and isinstance(self.data, TableQuerysetData):
+            self.data.data = self.get_optimized_queryset(self.data.data)
+        # Replaces NetBox's EnhancedPaginator, which always counts exactly
+        kwargs["paginator_class"] = ApproximateCountPaginator
+        super().paginate(*args, **kwargs)
+
+    def get_optimized_queryset(self, queryset):
+        """
+        Restrict queryset to what the visible columns render.
+
+        Only the concrete fields of the visible columns are loaded, the foreign
+        keys they show are joined with select_related() and the many-to-many
+        and reverse relations they show are prefetched. If a visible column is
+        not backed by a model field (such as a custom link or template column),
+        what it reads is unknown and queryset is returned unchanged.
+        """
+        meta = self.Meta.model._meta
+        fields = {meta.pk.name}
+        select_related = set()
+        prefetch_related = set()
+        for column in self.columns:
+            # Both only need the primary key
+            if not column.visible or column.name in ("pk", "actions"):
+                continue
+            try:
+                field = meta.get_field(column.accessor.bits[0])
+            except FieldDoesNotExist:
+                return queryset
+            if field.many_to_many or field.one_to_many:
+                prefetch_related.add(field.name)
+            elif field.many_to_one or field.one_to_one:
+                select_related.add(field.name)
+                if field.concrete:
+                    fields.add(field.name)
+            elif field.concrete:
+                fields.add(field.name)
+            else:
+                return queryset
+
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(prefetch_related))
+        return queryset.only(*fields)
@@ -8,15 +8,18 @@ from contextlib import contextmanager
 from typing import Any
 
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.db import connection, transaction
 from django.test import Client
 from django.test import TestCase as DjangoTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 from users.constants import TOKEN_PREFIX
 from users.models import ObjectPermission, Token
 from utilities.permissions import resolve_permission_type
 
+from .utils import format_queries, get_random_string
+
 User = get_user_model()
 
 
@@ -25,36 +28,56 @@ class PluginTestCase(DjangoTestCase):
     Base test case for plugin tests with common setup and utilities.
 
     Provides:
-    - Test user creation with configurable permissions
+    - A test user with configurable permissions, created once per class
     - Permission management helpers
     - Enhanced HTTP status assertions
+    - Query budget assertions
     - Transaction-based subtests with automatic cleanup
+
+    The test user and user_permissions are set up in setUpTestData(), so
+    subclasses overriding it must call super().setUpTestData(). Each test runs
+    in a savepoint, so permissions added by a test are rolled back after it,
+    and self.user is a fresh copy of the class's user in every test.
     """
 
     user_permissions: list[str] = []
 
+    # Maximum number of SQL queries per URL name, checked by assertQueryBudgets()
+    query_budgets: dict[str, int] = {}
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user with user_permissions once for all tests of the class."""
+        super().setUpTestData()
+        cls.user = cls.create_test_user()
+        cls.grant_permissions(cls.user, *cls.user_permissions)
+
     def setUp(self):
-        """Create a test user with optional permissions."""
-        self.user = self.create_test_user()
+        """Log the test user in."""
+        if "user" not in vars(type(self)):
+            # setUpTestData() was overridden without calling super() (or the
+            # user belongs to a parent class); fall back to per-test setup
+            self.user = self.create_test_user()
+            self.grant_permissions(self.user, *self.user_permissions)
         self.client = Client()
         self.client.force_login(self.user)
 
-        # Add permissions if specified
-        if self.user_permissions:
-            self.add_permissions(*self.user_permissions)
-
-    def create_test_user(self, username: str = "testuser",
+    @classmethod
+    def create_test_user(cls, username: str | None = None,
                         is_superuser: bool = False) -> User:
         """
         Create a test user with sensible defaults.
 
         Args:
-            username: Username for the test user
+            username: Username for the test user; random if not given, so
+                users of different test classes never collide
             is_superuser: Whether user is a superuser
 
         Returns:
             User instance
         """
+        if username is None:
+            username = f"testuser_{get_random_string(8)}"
         return User.objects.create_user(
             username=username,
             email=f"{username}@example.com",
@@ -76,11 +99,22 @@ class PluginTestCase(DjangoTestCase):
                 "{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}",
             )
         """
+        self.grant_permissions(self.user, *permissions)
+
+    @classmethod
+    def grant_permissions(cls, user, *permissions: str):
+        """
+        Assign permissions to user using NetBox's ObjectPermission system.
+
+        Args:
+            user: User to grant the permissions to
+            *permissions: Permission names in format "app.action_model"
+        """
         for name in permissions:
             object_type, action = resolve_permission_type(name)
             obj_perm = ObjectPermission(name=name, actions=[action])
             obj_perm.save()
-            obj_perm.users.add(self.user)
+            obj_perm.users.add(user)
             obj_perm.object_types.add(object_type)
 
     def remove_permissions(self, *permissions: str):
@@ -124,6 +158,71 @@ class PluginTestCase(DjangoTestCase):
 
             self.fail(error_msg)
 
+    def assertQueryBudget(self, url: str, budget: int, create_objects, count: int = 5):
+        """
+        Assert that GET url runs at most budget SQL queries, however many objects it shows.
+
+        create_objects(count) is called and url is requested once to warm up
+        caches and once to count its queries. Then create_objects(9 * count)
+        brings the total to ten times as many objects and the queries are
+        counted again. The assertion fails if the count grew (a query runs per
+        object) or exceeds budget, listing repeated queries and all SQL run.
+
+        Args:
+            url: URL to request
+            budget: Maximum number of queries
+            create_objects: Callable creating the given number of objects shown at url
+            count: Number of objects created for the first measurement
+
+        Example:
+            self.assertQueryBudget(
+                reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list'),
+                20,
+                lambda n: [{{ cookiecutter.__model_name }}.objects.create(name=f'Budget {i}') for i in range(n)],
+            )
+        """
+        create_objects(count)
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+
+        create_objects(9 * count)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+
+        problems = []
+        if len(large) > len(small):
+            problems.append(
+                f"query count grew from {len(small)} with {count} objects to {len(large)} with {10 * count}"
+            )
+        if len(large) > budget:
+            problems.append(f"{len(large)} queries exceed the budget of {budget}")
+        if problems:
+            self.fail(f"GET {url}: {'; '.join(problems)}\n{format_queries(large.captured_queries)}")
+
+    def assertQueryBudgets(self, create_objects, count: int = 5):
+        """
+        Run assertQueryBudget() for every URL name in query_budgets.
+
+        Each URL is checked in its own subtest, with the objects it created
+        rolled back afterwards.
+
+        Example:
+            class {{ cookiecutter.__model_name }}ViewTestCase(PluginViewTestCase):
+                query_budgets = {'plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list': 20}
+
+                def test_query_budgets(self):
+                    self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+                    self.assertQueryBudgets(
+                        lambda n: [{{ cookiecutter.__model_name }}.objects.create(name=get_random_string()) for _ in range(n)]
+                    )
+        """
+        for url_name, budget in self.query_budgets.items():
+            with self.cleanupSubTest(url=url_name):
+                self.assertQueryBudget(reverse(url_name), budget, create_objects, count)
+
     @contextmanager
     def cleanupSubTest(self, **params):
         """
@@ -240,17 +339,31 @@ class PluginAPITestCase(PluginModelTestCase):
     Base test case for REST API endpoint testing.
 
     Provides:
-    - APIClient with token authentication
+    - APIClient with token authentication, the token created once per class
     - URL generation helpers
     - Common API test patterns
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create the API token once for all tests of the class."""
+        super().setUpTestData()
+        cls.token, cls.authorization = cls.create_token(cls.user)
+
+    @classmethod
+    def create_token(cls, user):
+        """Create an API token for user and return it with its Authorization header value."""
+        token = Token.objects.create(user=user)
+        # The plaintext token is only available on the instance that created it
+        return token, f'Bearer {TOKEN_PREFIX}{token.key}.{token.token}'
+
     def setUp(self):
         """Set up API client with token authentication."""
         super().setUp()
-        self.token = Token.objects.create(user=self.user)
+        if "authorization" not in vars(type(self)):
+            self.token, self.authorization = self.create_token(self.user)
         self.client = APIClient()
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {TOKEN_PREFIX}{self.token.key}.{self.token.token}')
+        self.client.credentials(HTTP_AUTHORIZATION=self.authorization)
 
     def _get_list_url(self) -> str:
         """
@@ -383,6 +496,7 @@ class PluginGraphQLTestCase(PluginTestCase):
     Provides:
     - GraphQL query execution helpers
     - Query result validation
+    - N+1 query detection
     """
 
     def execute_query(self, query: str, variables: dict | None = None):
@@ -410,6 +524,41 @@ class PluginGraphQLTestCase(PluginTestCase):
         self.assertEqual(response.status_code, 200)
         return response.json()
 
+    def assertQueryCountConstant(self, query: str, add_rows, variables: dict | None = None):
+        """
+        Assert that a query issues the same number of SQL queries after more rows are added.
+
+        The query is run once to warm up caches, once to count its SQL queries,
+        then add_rows() is called and the count is taken again. A count that
+        grows with the returned rows means a relation is resolved per row
+        (N+1) instead of being prefetched.
+
+        Args:
+            query: GraphQL query string
+            add_rows: Callable that creates additional objects returned by the query
+            variables: Optional query variables
+
+        Example:
+            self.assertQueryCountConstant(
+                'query { {{ cookiecutter.__model_url_name }}_list { name tags { name } } }',
+                lambda: {{ cookiecutter.__model_name }}.objects.create(name='Another'),
+            )
+        """
+        self.execute_query(query, variables)
+        with CaptureQueriesContext(connection) as before:
+            response = self.execute_query(query, variables)
+        self.assertNotIn('errors', response, f"GraphQL query failed: {response.get('errors')}")
+
+        add_rows()
+        with CaptureQueriesContext(connection) as after:
+            self.execute_query(query, variables)
+
+        if len(after) != len(before):
+            self.fail(
+                f"Query count grew from {len(before)} to {len(after)} after adding rows:\n"
+                f"{format_queries(after.captured_queries)}"
+            )
+
     def assertGraphQLSuccess(self, response):
         """Assert that GraphQL query succeeded without errors."""
         json_data = response.json()
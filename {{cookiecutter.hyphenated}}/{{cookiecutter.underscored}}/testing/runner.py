@@ -0,0 +1,116 @@
+"""
+Parallel test runner for {{ cookiecutter.project_name }}.
+
+``manage.py test --parallel`` already gives every worker process its own clone
+of the PostgreSQL test database (``test_netbox_1``, ``test_netbox_2``, ...).
+Everything else NetBox talks to is shared, so ParallelTestRunner additionally
+points each worker at:
+
+* its own Redis database for the cache and the RQ queues, as tests call
+  ``cache.clear()``, which flushes the whole database,
+* its own MEDIA_ROOT subdirectory for uploaded files,
+* a freshly seeded ``random`` module, as forked workers would otherwise
+  generate the same "random" names.
+
+Worker N uses Redis database ``FIRST_WORKER_DATABASE + N - 1``, so the number
+of workers is capped at the number of databases Redis is configured with
+(``REDIS_DATABASES``, default 16) minus the two used by serial runs.
+
+``make test-parallel`` selects it with ``--testrunner``:
+``{{ cookiecutter.underscored }}.testing.runner.ParallelTestRunner``.
+
+For Django's parallel test runner, see:
+https://docs.djangoproject.com/en/stable/ref/django-admin/#cmdoption-test-parallel
+"""
+
+import multiprocessing
+import os
+import random
+import re
+
+from django.conf import settings
+from django.test import override_settings, runner
+
+# Redis databases 0 and 1 hold the tasks and cache of serial runs
+FIRST_WORKER_DATABASE = 2
+
+
+def get_max_workers():
+    """Return the number of workers that can each have a Redis database of their own."""
+    return int(os.getenv("REDIS_DATABASES", 16)) - FIRST_WORKER_DATABASE
+
+
+def use_supported_start_method():
+    """
+    Replace the forkserver start method, which Django's parallel runner does not support, with fork.
+
+    Python 3.14 defaults to forkserver on Linux, which makes --parallel auto
+    run a single process. Other defaults are kept: macOS uses spawn, as fork
+    is unsafe there.
+    """
+    if multiprocessing.get_start_method() == "forkserver":
+        multiprocessing.set_start_method("fork", force=True)
+
+
+def configure_worker(worker_id):
+    """
+    Point the cache, RQ queues and MEDIA_ROOT of the current process at worker_id's own resources.
+
+    Returns the enabled settings override, which workers keep for their lifetime.
+    """
+    database = FIRST_WORKER_DATABASE + worker_id - 1
+
+    caches = {}
+    for alias, config in settings.CACHES.items():
+        caches[alias] = {**config, "LOCATION": re.sub(r"/\d+$", f"/{database}", config["LOCATION"])}
+
+    # django_rq keeps references to the queue dicts, so they are updated in place
+    for config in settings.RQ_QUEUES.values():
+        config["DB"] = database
+
+    # Setting CACHES and MEDIA_ROOT resets the cache and storage handlers
+    worker_settings = override_settings(
+        CACHES=caches,
+        MEDIA_ROOT=os.path.join(settings.MEDIA_ROOT, f"worker-{worker_id}"),
+    )
+    worker_settings.enable()
+    random.seed()
+    return worker_settings
+
+
+def init_worker(*args, **kwargs):
+    """
+    Set up a worker process: Django's database setup, then configure_worker().
+
+    Lives at module level because of the multiprocessing module's requirements.
+    """
+    runner._init_worker(*args, **kwargs)
+    configure_worker(runner._worker_id)
+
+
+class ParallelTestSuite(runner.ParallelTestSuite):
+    init_worker = init_worker
+
+
+class ParallelTestRunner(runner.DiscoverRunner):
+    """DiscoverRunner giving each parallel worker its own Redis database and MEDIA_ROOT."""
+
+    parallel_test_suite = ParallelTestSuite
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        # The test command adds the runner's arguments before resolving
+        # --parallel auto, which counts no processes under forkserver
+        use_supported_start_method()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        max_workers = get_max_workers()
+        if self.parallel > max_workers:
+            self.log(
+                f"Running {max_workers} of {self.parallel} test processes, one per free Redis database. "
+                f"Start Redis with --databases {self.parallel + FIRST_WORKER_DATABASE} and set "
+                f"REDIS_DATABASES to use them all."
+            )
+            self.parallel = max_workers
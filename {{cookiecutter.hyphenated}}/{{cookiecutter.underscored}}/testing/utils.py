@@ -5,12 +5,22 @@ These helpers assist with common testing operations like creating test data,
 handling forms, and managing test state.
 """
 
+import difflib
+import json
+import os
 import random
+import re
 import string
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 User = get_user_model()
 
@@ -238,6 +248,31 @@ def create_tags(names: list[str]):
     return tags
 
 
+def create_tagged_objects(model, count: int, tags: list, prefix: str = 'Tagged') -> list:
+    """
+    Create objects with random names, each assigned the given tags.
+
+    Args:
+        model: Model class with a name field and tags
+        count: Number of objects to create
+        tags: Tag instances to assign to every object
+        prefix: Prefix of the object names
+
+    Returns:
+        List of created instances
+
+    Example:
+        >>> tags = create_tags(['budget-a', 'budget-b'])
+        >>> self.assertQueryBudgets(lambda count: create_tagged_objects(MyModel, count, tags))
+    """
+    objects = []
+    for _ in range(count):
+        instance = model.objects.create(name=f'{prefix} {get_random_string()}')
+        instance.tags.set(tags)
+        objects.append(instance)
+    return objects
+
+
 def get_deletable_objects(instances):
     """
     Get related objects that will be deleted along with the given instances.
@@ -340,6 +375,182 @@ def assert_object_changes(test_case, instance, action: str,
         pass
 
 
+# String and numeric literals, and parenthesized lists of them
+SQL_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+SQL_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+
+def sql_fingerprint(sql: str) -> str:
+    """
+    Normalize a SQL statement so that statements differing only in literal values compare equal.
+
+    Args:
+        sql: SQL statement, as captured by CaptureQueriesContext
+
+    Returns:
+        The statement with every literal replaced by "?" and value lists by "(?)"
+
+    Example:
+        >>> sql_fingerprint("SELECT * FROM tag WHERE id IN (1, 2) AND name = 'a'")
+        'SELECT * FROM tag WHERE id IN (?) AND name = ?'
+    """
+    return SQL_LIST_RE.sub('(?)', SQL_LITERAL_RE.sub('?', sql))
+
+
+def repeated_queries(captured_queries: list[dict]) -> list[tuple[int, str]]:
+    """
+    Find SQL statements that were run more than once, with the same or different values.
+
+    Repeated fingerprints are the signature of an N+1 problem: the same query
+    run once per row instead of once per page.
+
+    Args:
+        captured_queries: CaptureQueriesContext.captured_queries
+
+    Returns:
+        (count, fingerprint) pairs, most repeated first
+    """
+    counts = Counter(sql_fingerprint(query['sql']) for query in captured_queries)
+    return sorted(((count, fingerprint) for fingerprint, count in counts.items() if count > 1), reverse=True)
+
+
+def format_queries(captured_queries: list[dict]) -> str:
+    """
+    Describe captured queries for an assertion message.
+
+    Lists the repeated fingerprints first, then every statement in order.
+
+    Args:
+        captured_queries: CaptureQueriesContext.captured_queries
+
+    Returns:
+        Multi-line report
+    """
+    lines = []
+    if repeated := repeated_queries(captured_queries):
+        lines.append('Repeated queries:')
+        lines.extend(f'  {count}x {fingerprint}' for count, fingerprint in repeated)
+    lines.append(f'All {len(captured_queries)} queries:')
+    lines.extend(f'  {i}. {query["sql"]}' for i, query in enumerate(captured_queries, start=1))
+    return '\n'.join(lines)
+
+
+# Transaction control statements issued by the test framework, not the code under test
+SQL_SNAPSHOT_IGNORED_RE = re.compile(r'^\s*(SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\b', re.IGNORECASE)
+
+
+def get_snapshot_path(test_case, name: str | None = None) -> Path:
+    """
+    Return the SQL snapshot file of a test.
+
+    Snapshots are stored in a ``snapshots`` directory next to the test module,
+    named after the test class and method (and name, if given).
+    """
+    module_dir = Path(sys.modules[type(test_case).__module__].__file__).parent
+    test_name = f"{type(test_case).__name__}.{test_case._testMethodName}"
+    if name:
+        test_name += f".{name}"
+    return module_dir / 'snapshots' / f'{test_name}.sql'
+
+
+def iter_plan_nodes(plan: dict):
+    """Yield a plan node from EXPLAIN (FORMAT JSON) and all nodes below it."""
+    yield plan
+    for child in plan.get('Plans', ()):
+        yield from iter_plan_nodes(child)
+
+
+def find_seq_scans(statements: list[str], threshold: int) -> list[str]:
+    """
+    EXPLAIN each SELECT statement and describe sequential scans over tables with more than threshold rows.
+
+    Args:
+        statements: SQL statements with their values inlined, as captured
+        threshold: Largest number of rows a table may have to be scanned sequentially
+
+    Returns:
+        One description, with the statement, per offending scan
+    """
+    problems = []
+    with connection.cursor() as cursor:
+        for sql in statements:
+            if not sql.lstrip().upper().startswith('SELECT'):
+                continue
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            for node in iter_plan_nodes(plan[0]['Plan']):
+                if node['Node Type'] != 'Seq Scan':
+                    continue
+                table = node['Relation Name']
+                cursor.execute(f'SELECT COUNT(*) FROM {connection.ops.quote_name(table)}')
+                rows = cursor.fetchone()[0]
+                if rows > threshold:
+                    problems.append(f'Sequential scan over {table} ({rows} rows) in:\n  {sql}')
+    return problems
+
+
+@contextmanager
+def assert_sql_snapshot(test_case, name: str | None = None, explain: bool = False, seq_scan_threshold: int = 1000):
+    """
+    Context manager asserting that the SQL run inside it matches a recorded snapshot.
+
+    The statements are normalized with sql_fingerprint() and compared with
+    the test's snapshot file (see get_snapshot_path()), failing with a diff
+    if they differ. This catches rewrites that keep the query count but change
+    the plan, such as a lost select_related() or a new ORDER BY. A missing
+    snapshot is recorded instead; commit it along with the test, as nothing is
+    checked until it is. With the REQUIRE_SQL_SNAPSHOTS environment variable
+    set, a missing snapshot fails instead. Set UPDATE_SQL_SNAPSHOTS to
+    re-record snapshots after an intended change.
+
+    With explain=True, every SELECT is also run through EXPLAIN, failing on
+    sequential scans over tables with more than seq_scan_threshold rows.
+
+    Args:
+        test_case: TestCase instance (for assertions)
+        name: Optional suffix distinguishing several snapshots in one test
+        explain: Check the statements' plans for sequential scans
+        seq_scan_threshold: Largest table, in rows, allowed to be scanned sequentially
+
+    Example:
+        >>> with assert_sql_snapshot(self, explain=True):
+        ...     self.client.get(url)
+    """
+    with CaptureQueriesContext(connection) as captured:
+        yield
+
+    statements = [query['sql'] for query in captured.captured_queries]
+    statements = [sql for sql in statements if not SQL_SNAPSHOT_IGNORED_RE.match(sql)]
+    recorded = ''.join(f'{sql_fingerprint(sql)}\n' for sql in statements)
+
+    path = get_snapshot_path(test_case, name)
+    if not path.exists() and not os.environ.get('UPDATE_SQL_SNAPSHOTS') and os.environ.get('REQUIRE_SQL_SNAPSHOTS'):
+        test_case.fail(f'SQL snapshot {path} is missing; run the test locally and commit the recorded file.')
+    if os.environ.get('UPDATE_SQL_SNAPSHOTS') or not path.exists():
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(recorded)
+    else:
+        expected = path.read_text()
+        if recorded != expected:
+            diff = difflib.unified_diff(
+                expected.splitlines(keepends=True),
+                recorded.splitlines(keepends=True),
+                fromfile=f'{path.name} (recorded)',
+                tofile=f'{path.name} (this run)',
+            )
+            test_case.fail(
+                f'SQL differs from the snapshot {path}; set UPDATE_SQL_SNAPSHOTS=1 to re-record it '
+                f'if the change is intended.\n{"".join(diff)}'
+            )
+
+    if explain:
+        problems = find_seq_scans(statements, seq_scan_threshold)
+        if problems:
+            test_case.fail('\n'.join(problems))
+
+
 __all__ = [
     'get_random_string',
     'create_test_user',
@@ -347,6 +558,11 @@ __all__ = [
     'extract_form_errors',
     'disable_warnings',
     'create_tags',
+    'create_tagged_objects',
     'get_deletable_objects',
     'assert_object_changes',
+    'sql_fingerprint',
+    'repeated_queries',
+    'format_queries',
+    'assert_sql_snapshot',
 ]
@@ -2,17 +2,45 @@
 Test cases for {{ cookiecutter.project_name }} REST API.
 """
 {% if cookiecutter.include_rest_api == "yes" -%}
+import csv
+import io
+import json
+
+from core.choices import JobStatusChoices
+from core.models import Job, ObjectType
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from users.models import ObjectPermission
+
+from ..api.caching import permission_fingerprint
 from ..models import {{ cookiecutter.__model_name }}
 from ..testing import PluginAPITestCase
-from ..testing.utils import disable_warnings, get_random_string
+from ..testing.utils import (
+    assert_object_changes,
+    assert_sql_snapshot,
+    create_tagged_objects,
+    create_tags,
+    disable_warnings,
+    get_random_string,
+)
 
 
 class {{ cookiecutter.__model_name }}APITestCase(PluginAPITestCase):
     """Test {{ cookiecutter.__model_name }} API endpoints."""
 
+    # Generous ceilings; lower them towards the current counts to catch regressions early
+    query_budgets = {
+        'plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-list': 20,
+    }
+
     @classmethod
     def setUpTestData(cls):
         """Set up test data for all tests."""
+        super().setUpTestData()
         {{ cookiecutter.__model_name }}.objects.create(name='API Test 1')
         {{ cookiecutter.__model_name }}.objects.create(name='API Test 2')
         {{ cookiecutter.__model_name }}.objects.create(name='API Test 3')
@@ -22,6 +50,17 @@ class {{ cookiecutter.__model_name }}APITestCase(PluginAPITestCase):
         super().setUp()
         self.list_url_name = 'plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-list'
         self.detail_url_name = 'plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-detail'
+        self.export_url_name = 'plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-export'
+        self.upsert_url_name = 'plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-upsert'
+        self.import_job_url_name = 'plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-import-job'
+
+    def test_query_budgets(self):
+        """Test that list queries stay within budget however many objects are listed."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        tags = create_tags(['budget-a', 'budget-b'])
+        self.assertQueryBudgets(
+            lambda count: create_tagged_objects({{ cookiecutter.__model_name }}, count, tags, prefix='Budget')
+        )
 
     def test_list_{{ cookiecutter.__model_url_name }}s(self):
         """Test GET request to list {{ cookiecutter.__model_name }}s."""
@@ -34,6 +73,18 @@ class {{ cookiecutter.__model_name }}APITestCase(PluginAPITestCase):
         self.assertEqual(response.data['count'], 3)
         self.assertIn('results', response.data)
 
+    def test_list_{{ cookiecutter.__model_url_name }}s_sql_snapshot(self):
+        """Test that the list SQL matches its recorded snapshot and avoids large sequential scans."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        url = self._get_list_url()
+
+        # Warm up caches so the snapshot does not depend on which tests ran before
+        self.client.get(url)
+        with assert_sql_snapshot(self, explain=True):
+            response = self.client.get(url)
+
+        self.assertHttpStatus(response, 200)
+
     def test_list_{{ cookiecutter.__model_url_name }}s_without_permission(self):
         """Test GET request without permission."""
         url = self._get_list_url()
@@ -42,6 +93,101 @@ class {{ cookiecutter.__model_name }}APITestCase(PluginAPITestCase):
             response = self.client.get(url)
             self.assertHttpStatus(response, 403)
 
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'approximate_count_threshold': 2}})
+    def test_list_{{ cookiecutter.__model_url_name }}s_approximate_count(self):
+        """Test that large counts are estimated and flagged as approximate."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE ' + connection.ops.quote_name({{ cookiecutter.__model_name }}._meta.db_table))
+
+        response = self.client.get(self._get_list_url(), {'limit': 1})
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response.data['count_approximate'])
+        self.assertEqual(response.data['count'], 3)
+
+        response = self.client.get(self._get_list_url(), {'q': 'API Test', 'limit': 1})
+        self.assertTrue(response.data['count_approximate'])
+        self.assertGreaterEqual(response.data['count'], 3)
+
+        response = self.client.get(self._get_list_url(), {'q': 'API Test 1'})
+        self.assertFalse(response.data['count_approximate'])
+        self.assertEqual(response.data['count'], 1)
+
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'approximate_count_threshold': 2}})
+    def test_list_{{ cookiecutter.__model_url_name }}s_approximate_count_too_low(self):
+        """Test that following next links returns every object when the estimate is too low."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE ' + connection.ops.quote_name({{ cookiecutter.__model_name }}._meta.db_table))
+        for i in range(4, 9):
+            {{ cookiecutter.__model_name }}.objects.create(name=f'API Test {i}')
+
+        names = []
+        url = f'{self._get_list_url()}?limit=2'
+        while url:
+            response = self.client.get(url)
+            self.assertHttpStatus(response, 200)
+            names.extend(obj['name'] for obj in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(names, [f'API Test {i}' for i in range(1, 9)])
+        self.assertFalse(response.data['count_approximate'])
+        self.assertEqual(response.data['count'], 8)
+
+    def test_list_{{ cookiecutter.__model_url_name }}s_with_cursor(self):
+        """Test walking the list endpoint with cursor pagination."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        response = self.client.get(self._get_list_url(), {'cursor': '', 'limit': 2})
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn('count', response.data)
+        self.assertEqual(
+            [obj['name'] for obj in response.data['results']],
+            ['API Test 1', 'API Test 2']
+        )
+        self.assertIsNone(response.data['previous'])
+
+        response = self.client.get(response.data['next'])
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            [obj['name'] for obj in response.data['results']],
+            ['API Test 3']
+        )
+        self.assertIsNone(response.data['next'])
+        self.assertIsNotNone(response.data['previous'])
+
+    def test_export_{{ cookiecutter.__model_url_name }}s_ndjson(self):
+        """Test streaming export as NDJSON with a filter applied."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        url = reverse(self.export_url_name, kwargs={'export_format': 'ndjson'})
+        response = self.client.get(url, {'name': ['API Test 1', 'API Test 3']})
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([row['name'] for row in rows], ['API Test 1', 'API Test 3'])
+
+    def test_export_{{ cookiecutter.__model_url_name }}s_csv(self):
+        """Test streaming export as CSV."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        url = reverse(self.export_url_name, kwargs={'export_format': 'csv'})
+        response = self.client.get(url)
+
+        self.assertHttpStatus(response, 200)
+        content = b''.join(response.streaming_content).decode('utf-8')
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual([row['name'] for row in rows], ['API Test 1', 'API Test 2', 'API Test 3'])
+
+    def test_export_{{ cookiecutter.__model_url_name }}s_without_permission(self):
+        """Test streaming export without permission."""
+        url = reverse(self.export_url_name, kwargs={'export_format': 'ndjson'})
+
+        with disable_warnings('django.request'):
+            response = self.client.get(url)
+            self.assertHttpStatus(response, 403)
+
     def test_get_{{ cookiecutter.__model_url_name }}(self):
         """Test GET request for a single {{ cookiecutter.__model_name }}."""
         self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
@@ -54,6 +200,60 @@ class {{ cookiecutter.__model_name }}APITestCase(PluginAPITestCase):
         self.assertEqual(response.data['id'], instance.pk)
         self.assertEqual(response.data['name'], instance.name)
 
+    def test_get_{{ cookiecutter.__model_url_name }}_conditional(self):
+        """Test conditional GET requests for a single {{ cookiecutter.__model_name }}."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        instance = {{ cookiecutter.__model_name }}.objects.first()
+        url = self._get_detail_url(instance)
+        response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertHttpStatus(response, 304)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertHttpStatus(response, 304)
+
+        etag = response['ETag']
+        instance.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertHttpStatus(response, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        # Tag assignments do not touch last_updated but change the ETag
+        etag = response['ETag']
+        instance.tags.set(create_tags(['conditional']))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertHttpStatus(response, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_list_{{ cookiecutter.__model_url_name }}s_conditional(self):
+        """Test that conditional list requests are answered with one query."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        url = self._get_list_url()
+        etag = self.client.get(url)['ETag']
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertHttpStatus(response, 304)
+
+        # Authentication aside, only the aggregate query touches the table
+        table = {{ cookiecutter.__model_name }}._meta.db_table
+        queries = [query['sql'] for query in context.captured_queries if table in query['sql']]
+        self.assertEqual(len(queries), 1)
+        self.assertIn('MAX', queries[0].upper())
+
+        {{ cookiecutter.__model_name }}.objects.first().tags.set(create_tags(['conditional']))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertHttpStatus(response, 200)
+
+        etag = response['ETag']
+        {{ cookiecutter.__model_name }}.objects.last().delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data['count'], 2)
+
     def test_create_{{ cookiecutter.__model_url_name }}(self):
         """Test POST request to create a {{ cookiecutter.__model_name }}."""
         self.add_permissions('{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}')
@@ -100,6 +300,105 @@ class {{ cookiecutter.__model_name }}APITestCase(PluginAPITestCase):
                 {{ cookiecutter.__model_name }}.objects.filter(name=item['name']).exists()
             )
 
+    def test_upsert_{{ cookiecutter.__model_url_name }}s(self):
+        """Test creating, updating and skipping objects through the upsert endpoint."""
+        self.add_permissions(
+            '{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}',
+            '{{ cookiecutter.underscored }}.change_{{ cookiecutter.__model_url_name }}'
+        )
+        tags = create_tags(['upsert'])
+
+        url = reverse(self.upsert_url_name)
+        data = [
+            {'name': 'API Test 1'},
+            {'name': 'API Test 2', 'tags': [tags[0].pk]},
+            {'name': 'Upserted'},
+        ]
+
+        response = self.client.post(url, data, format='json')
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            [(item['name'], item['status']) for item in response.data],
+            [('API Test 1', 'unchanged'), ('API Test 2', 'updated'), ('Upserted', 'created')]
+        )
+
+        updated = {{ cookiecutter.__model_name }}.objects.get(name='API Test 2')
+        created = {{ cookiecutter.__model_name }}.objects.get(name='Upserted')
+        self.assertEqual(list(updated.tags.all()), tags)
+        self.assertEqual(response.data[2]['id'], created.pk)
+        assert_object_changes(self, updated, 'update', user=self.user)
+        assert_object_changes(self, created, 'create', user=self.user)
+
+    def test_upsert_{{ cookiecutter.__model_url_name }}s_invalid(self):
+        """Test that one invalid object rejects the whole batch."""
+        self.add_permissions(
+            '{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}',
+            '{{ cookiecutter.underscored }}.change_{{ cookiecutter.__model_url_name }}'
+        )
+
+        url = reverse(self.upsert_url_name)
+        data = [{'name': 'Upserted'}, {'name': 'x' * 101}]
+
+        response = self.client.post(url, data, format='json')
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('name', response.data[1])
+        self.assertFalse({{ cookiecutter.__model_name }}.objects.filter(name='Upserted').exists())
+
+    def test_upsert_{{ cookiecutter.__model_url_name }}s_without_change_permission(self):
+        """Test that updating existing objects requires change permission."""
+        self.add_permissions('{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}')
+        tags = create_tags(['upsert'])
+
+        url = reverse(self.upsert_url_name)
+        data = [{'name': 'API Test 1', 'tags': [tags[0].pk]}]
+
+        with disable_warnings('django.request'):
+            response = self.client.post(url, data, format='json')
+            self.assertHttpStatus(response, 403)
+
+    def test_upsert_{{ cookiecutter.__model_url_name }}s_unchanged_without_permission(self):
+        """Test that unchanged objects outside the user's permission constraints are refused, not returned."""
+        self.add_permissions('{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}')
+        permission = ObjectPermission.objects.create(
+            name='upsert', actions=['view', 'change'], constraints={'name': 'API Test 2'}
+        )
+        permission.users.add(self.user)
+        permission.object_types.add(ObjectType.objects.get_for_model({{ cookiecutter.__model_name }}))
+
+        url = reverse(self.upsert_url_name)
+        for data in ([{'name': 'API Test 1'}], [{'name': 'API Test 2'}, {'name': 'API Test 1'}]):
+            with self.subTest(data=data), disable_warnings('django.request'):
+                response = self.client.post(url, data, format='json')
+                self.assertHttpStatus(response, 403)
+                self.assertNotIn('id', response.content.decode())
+
+        response = self.client.post(url, [{'name': 'API Test 2'}], format='json')
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data[0]['status'], 'unchanged')
+
+    def test_import_job_{{ cookiecutter.__model_url_name }}s(self):
+        """Test queueing a background import."""
+        self.add_permissions('{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}')
+
+        url = reverse(self.import_job_url_name)
+        upload = SimpleUploadedFile('import.csv', b'name\nQueued 1\n', content_type='text/csv')
+        response = self.client.post(url, {'file': upload}, format='multipart')
+
+        self.assertHttpStatus(response, 202)
+        job = Job.objects.get(pk=response.data['id'])
+        self.assertEqual(job.status, JobStatusChoices.STATUS_PENDING)
+        self.assertEqual(job.user, self.user)
+
+    def test_import_job_{{ cookiecutter.__model_url_name }}s_without_permission(self):
+        """Test queueing a background import without permission."""
+        url = reverse(self.import_job_url_name)
+        upload = SimpleUploadedFile('import.csv', b'name\nQueued 1\n', content_type='text/csv')
+
+        with disable_warnings('django.request'):
+            response = self.client.post(url, {'file': upload}, format='multipart')
+            self.assertHttpStatus(response, 403)
+
     def test_update_{{ cookiecutter.__model_url_name }}(self):
         """Test PATCH request to update a {{ cookiecutter.__model_name }}."""
         self.add_permissions('{{ cookiecutter.underscored }}.change_{{ cookiecutter.__model_url_name }}')
@@ -196,6 +495,94 @@ class {{ cookiecutter.__model_name }}APIValidationTestCase(PluginAPITestCase):
         response = self.client.post(url, data, format='json')
         self.assertHttpStatus(response, 400)
         self.assertIn('name', response.data)
+
+
+@override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'api_cache_timeout': 60}})
+class {{ cookiecutter.__model_name }}APICacheTestCase(PluginAPITestCase):
+    """Test the {{ cookiecutter.__model_name }} API response cache."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for all tests."""
+        super().setUpTestData()
+        {{ cookiecutter.__model_name }}.objects.create(name='Cache Test 1')
+        {{ cookiecutter.__model_name }}.objects.create(name='Cache Test 2')
+
+    def setUp(self):
+        """Set up each test."""
+        super().setUp()
+        cache.clear()
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        self.list_url_name = 'plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-list'
+        self.detail_url_name = 'plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-detail'
+
+    def test_detail_invalidated_on_save(self):
+        """Test that saving an object invalidates its cached detail response."""
+        instance = {{ cookiecutter.__model_name }}.objects.get(name='Cache Test 1')
+        url = self._get_detail_url(instance)
+
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+        instance.name = 'Cache Test Renamed'
+        instance.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['name'], 'Cache Test Renamed')
+
+    def test_list_invalidated_on_tag_change(self):
+        """Test that tagging an object invalidates cached lists."""
+        url = self._get_list_url()
+        tags = create_tags(['cached'])
+
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+        self.assertEqual(self.client.get(url, {'limit': 1})['X-Cache'], 'MISS')
+
+        {{ cookiecutter.__model_name }}.objects.get(name='Cache Test 2').tags.set(tags)
+
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][1]['tags'][0]['id'], tags[0].pk)
+
+    def test_other_objects_stay_cached(self):
+        """Test that saving one object leaves other cached detail responses intact."""
+        first, second = {{ cookiecutter.__model_name }}.objects.order_by('name')
+        self.client.get(self._get_detail_url(first))
+        self.client.get(self._get_detail_url(second))
+
+        second.save()
+
+        self.assertEqual(self.client.get(self._get_detail_url(first))['X-Cache'], 'HIT')
+        self.assertEqual(self.client.get(self._get_detail_url(second))['X-Cache'], 'MISS')
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_permission_fingerprint(self):
+        """Test that users only share cache entries when their constraints match."""
+        model = {{ cookiecutter.__model_name }}
+        users = [self.create_test_user(username=f'cache{i}') for i in range(3)]
+        for user, constraints in zip(users, [{'name': 'Cache Test 1'}, {'name': 'Cache Test 1'}, None], strict=True):
+            permission = ObjectPermission.objects.create(name=user.username, actions=['view'], constraints=constraints)
+            permission.users.add(user)
+            permission.object_types.add(ObjectType.objects.get_for_model(model))
+
+        fingerprints = [permission_fingerprint(user, model) for user in users]
+        self.assertEqual(fingerprints[0], fingerprints[1])
+        self.assertNotEqual(fingerprints[0], fingerprints[2])
+
+    def test_cache_stats(self):
+        """Test the hit/miss counters."""
+        url = self._get_list_url()
+        self.client.get(url)
+        self.client.get(url)
+        self.client.get(url)
+
+        response = self.client.get(reverse('plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-cache-stats'))
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response.data['enabled'])
+        self.assertEqual((response.data['hits'], response.data['misses']), (2, 1))
+
 {% else -%}
 # REST API not enabled for this plugin
 # To enable API support, regenerate the plugin with include_rest_api=yes
@@ -0,0 +1,73 @@
+"""
+Test cases for the {{ cookiecutter.project_name }} benchmark suite.
+"""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from ..benchmarks import compare_results, run_benchmarks
+from ..benchmarks.cases import cases
+from ..models import {{ cookiecutter.__model_name }}
+from ..testing import PluginTestCase
+
+
+def make_results(**metrics):
+    """Return benchmark results for one case and size with the given metrics."""
+    result = {'p50_ms': 10.0, 'p95_ms': 20.0, 'p99_ms': 30.0, 'mean_ms': 12.0, 'queries': 5, 'peak_memory_kib': 100.0}
+    return {'results': {'list_view': {'1000': {**result, **metrics}}}}
+
+
+class BenchmarkTestCase(PluginTestCase):
+    """Test running benchmarks and comparing them with a baseline."""
+
+    def test_run_benchmarks(self):
+        """Test that every case is measured at every size and the seeded data is rolled back."""
+        results = run_benchmarks(sizes=(3, 6), repeat=2)
+
+        self.assertEqual(set(results['results']), set(cases))
+        for sizes in results['results'].values():
+            self.assertEqual(set(sizes), {'3', '6'})
+            self.assertGreater(sizes['6']['queries'], 0)
+            self.assertLessEqual(sizes['6']['p50_ms'], sizes['6']['p95_ms'])
+        self.assertFalse({{ cookiecutter.__model_name }}.objects.filter(name__startswith='bench-').exists())
+
+    def test_compare_results(self):
+        """Test that slower, more query-heavy and more memory-hungry runs are flagged."""
+        baseline = make_results()
+
+        self.assertEqual(compare_results(make_results(p50_ms=11.0), baseline), [])
+        # Large relative increases below the noise floor are ignored
+        self.assertEqual(compare_results(make_results(p50_ms=1.0), make_results(p50_ms=0.5)), [])
+
+        regressions = compare_results(make_results(p95_ms=40.0, queries=6, peak_memory_kib=200.0), baseline)
+        self.assertEqual(len(regressions), 3)
+        self.assertIn('list_view @ 1000: queries 5 -> 6', regressions)
+
+        # Cases missing from the baseline are reported, not silently passed
+        messages = []
+        self.assertEqual(compare_results(make_results(), {'results': {}}, log=messages.append), [])
+        self.assertEqual(messages, ['list_view @ 1000: not in the baseline, skipped'])
+
+    def test_benchmarks_command(self):
+        """Test writing results and failing on regressions against a baseline."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'baseline.json'
+            call_command(
+                '{{ cookiecutter.__model_url_name }}_benchmarks', '--sizes', '3', '--repeat', '1', '--case', 'list_view',
+                '--output', str(path), stderr=StringIO(),
+            )
+            baseline = json.loads(path.read_text())
+            self.assertIn('list_view', baseline['results'])
+
+            baseline['results']['list_view']['3']['queries'] = 0
+            path.write_text(json.dumps(baseline))
+            with self.assertRaisesRegex(CommandError, 'regression'):
+                call_command(
+                    '{{ cookiecutter.__model_url_name }}_benchmarks', '--sizes', '3', '--repeat', '1', '--case', 'list_view',
+                    '--compare', str(path), stdout=StringIO(), stderr=StringIO(),
+                )
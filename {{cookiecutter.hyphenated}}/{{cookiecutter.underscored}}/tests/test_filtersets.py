@@ -0,0 +1,90 @@
+"""
+Test cases for {{ cookiecutter.project_name }} filtersets.
+"""
+
+from django.db import connection
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+from django.test import override_settings
+{%- endif %}
+
+from ..filtersets import {{ cookiecutter.__model_name }}FilterSet
+from ..models import {{ cookiecutter.__model_name }}
+from ..testing import PluginTestCase
+
+
+class {{ cookiecutter.__model_name }}FilterSetTestCase(PluginTestCase):
+    """Test {{ cookiecutter.__model_name }}FilterSet."""
+
+    queryset = {{ cookiecutter.__model_name }}.objects.all()
+    filterset = {{ cookiecutter.__model_name }}FilterSet
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for all tests."""
+        super().setUpTestData()
+        {{ cookiecutter.__model_name }}.objects.create(name='Filter Alpha')
+        {{ cookiecutter.__model_name }}.objects.create(name='Filter Beta')
+        {{ cookiecutter.__model_name }}.objects.create(name='Filter Gamma Alpha')
+
+    def test_q(self):
+        """Test case-insensitive substring search."""
+        params = {'q': 'alpha'}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
+    def test_q_blank(self):
+        """Test that a blank search returns everything."""
+        params = {'q': '  '}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 3)
+
+    def test_name(self):
+        """Test filtering by exact name."""
+        params = {'name': ['Filter Alpha', 'Filter Beta']}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
+{% if cookiecutter.include_fulltext_search == "yes" %}    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'search_mode': 'icontains'}})
+{% endif %}    def test_q_uses_trigram_index(self):
+        """Test that the search can be answered from the trigram index."""
+        queryset = self.filterset({'q': 'alpha'}, self.queryset).qs
+
+        # The test table is tiny, so steer the planner away from a sequential
+        # scan and check that the trigram index is a usable alternative.
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = queryset.explain()
+
+        self.assertIn('{{ cookiecutter.__model_url_name }}_name_trgm', plan)
+{%- if cookiecutter.include_fulltext_search == "yes" %}
+
+    def test_q_fulltext_websearch(self):
+        """Test web search syntax in full-text search mode."""
+        params = {'q': 'alpha -gamma'}
+        names = self.filterset(params, self.queryset).qs.values_list('name', flat=True)
+        self.assertEqual(list(names), ['Filter Alpha'])
+
+    def test_q_fulltext_ranking(self):
+        """Test that full-text results are ordered by rank."""
+        params = {'q': 'alpha or gamma'}
+        names = self.filterset(params, self.queryset).qs.values_list('name', flat=True)
+        self.assertEqual(list(names), ['Filter Gamma Alpha', 'Filter Alpha'])
+
+    def test_q_fulltext_whole_words(self):
+        """Test that full-text search matches words, not substrings."""
+        params = {'q': 'alph'}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 0)
+
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'search_mode': 'icontains'}})
+    def test_q_icontains_mode(self):
+        """Test substring search when search_mode is icontains."""
+        params = {'q': 'alph'}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
+    def test_q_uses_search_vector_index(self):
+        """Test that full-text search can be answered from the search_vector index."""
+        queryset = self.filterset({'q': 'alpha'}, self.queryset).qs
+
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = queryset.explain()
+
+        self.assertIn('{{ cookiecutter.__model_url_name }}_search_vector', plan)
+{%- endif %}
@@ -2,8 +2,17 @@
 Test cases for {{ cookiecutter.project_name }} GraphQL API.
 """
 {% if cookiecutter.include_graphql == "yes" -%}
+import hashlib
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from strawberry.extensions import ParserCache, ValidationCache
+
+from ..graphql_views import get_schema, persisted_query_key
 from ..models import {{ cookiecutter.__model_name }}
 from ..testing import PluginGraphQLTestCase
+from ..testing.utils import create_tags
 
 
 class {{ cookiecutter.__model_name }}GraphQLTestCase(PluginGraphQLTestCase):
@@ -12,6 +21,7 @@ class {{ cookiecutter.__model_name }}GraphQLTestCase(PluginGraphQLTestCase):
     @classmethod
     def setUpTestData(cls):
         """Set up test data for all tests."""
+        super().setUpTestData()
         {{ cookiecutter.__model_name }}.objects.create(name='GraphQL Test 1')
         {{ cookiecutter.__model_name }}.objects.create(name='GraphQL Test 2')
         {{ cookiecutter.__model_name }}.objects.create(name='GraphQL Test 3')
@@ -58,6 +68,101 @@ class {{ cookiecutter.__model_name }}GraphQLTestCase(PluginGraphQLTestCase):
         self.assertIn('id', data[0])
         self.assertIn('name', data[0])
 
+    def query_names(self, arguments):
+        """Run a {{ cookiecutter.__model_url_name }}_list query with the given arguments and return the names."""
+        arguments = f'({arguments})' if arguments else ''
+        query = 'query { {{ cookiecutter.__model_url_name }}_list' + arguments + ' { id name } }'
+        response = self.execute_query(query)
+        self.assertIsNone(response.get('errors'))
+        return [item['name'] for item in response['data']['{{ cookiecutter.__model_url_name }}_list']]
+
+    def test_query_{{ cookiecutter.__model_url_name }}_list_filters(self):
+        """Test filtering the list in the database."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        self.assertEqual(self.query_names('filters: {q: "test 2"}'), ['GraphQL Test 2'])
+        self.assertEqual(
+            self.query_names('filters: {name: {in_list: ["GraphQL Test 1", "GraphQL Test 3"]}}'),
+            ['GraphQL Test 1', 'GraphQL Test 3']
+        )
+
+    def test_query_{{ cookiecutter.__model_url_name }}_list_pagination(self):
+        """Test offset pagination and ordering."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        self.assertEqual(
+            self.query_names('ordering: {name: DESC}, pagination: {offset: 1, limit: 1}'),
+            ['GraphQL Test 2']
+        )
+
+    def test_query_{{ cookiecutter.__model_url_name }}_list_after(self):
+        """Test cursor pagination with the after argument."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        first = {{ cookiecutter.__model_name }}.objects.order_by('pk').first()
+
+        self.assertEqual(
+            self.query_names('after: "' + str(first.pk) + '", pagination: {limit: 1}'),
+            ['GraphQL Test 2']
+        )
+
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'graphql_max_limit': 2}})
+    def test_query_{{ cookiecutter.__model_url_name }}_list_max_limit(self):
+        """Test that the page size is capped."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        self.assertEqual(len(self.query_names('')), 2)
+        self.assertEqual(len(self.query_names('pagination: {limit: 100}')), 2)
+        self.assertEqual(len(self.query_names('pagination: {offset: 2}')), 1)
+
+    def test_query_{{ cookiecutter.__model_url_name }}_list_query_count(self):
+        """Test that listing objects with their tags does not issue a query per row."""
+        self.add_permissions(
+            '{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}',
+            'extras.view_tag'
+        )
+        tags = create_tags(['alpha', 'beta'])
+        for instance in {{ cookiecutter.__model_name }}.objects.all():
+            instance.tags.set(tags)
+
+        def add_rows():
+            for i in range(10):
+                {{ cookiecutter.__model_name }}.objects.create(name=f'GraphQL Extra {i}').tags.set(tags)
+
+        self.assertQueryCountConstant(
+            'query { {{ cookiecutter.__model_url_name }}_list { id name tags { id name } } }',
+            add_rows,
+        )
+
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {
+        'graphql_max_limit': 1000, 'graphql_max_cost': 100, 'graphql_max_depth': 10,
+    }})
+    def test_query_{{ cookiecutter.__model_url_name }}_list_cost(self):
+        """Test that queries over the cost budget are rejected and costs are logged."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        # 10 objects * (1 + 2 fields) = 30
+        with self.assertLogs('{{ cookiecutter.underscored }}.graphql_cost', 'INFO') as logs:
+            response = self.execute_query('query { {{ cookiecutter.__model_url_name }}_list(pagination: {limit: 10}) { id name } }')
+        self.assertIsNone(response.get('errors'))
+        self.assertIn('cost=30 ', logs.output[0])
+
+        # No limit means up to graphql_max_limit objects
+        response = self.execute_query('query { {{ cookiecutter.__model_url_name }}_list { id name } }')
+        self.assertIn('cost', response['errors'][0]['message'])
+
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {
+        'graphql_max_limit': 1000, 'graphql_max_cost': 50000, 'graphql_max_depth': 2,
+    }})
+    def test_query_{{ cookiecutter.__model_url_name }}_depth(self):
+        """Test that queries over the depth limit are rejected."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        instance = {{ cookiecutter.__model_name }}.objects.first()
+
+        response = self.execute_query(
+            'query { {{ cookiecutter.__model_url_name }}(id: ' + str(instance.pk) + ') { tags { id } } }'
+        )
+        self.assertIn('depth', response['errors'][0]['message'])
+
     def test_query_{{ cookiecutter.__model_url_name }}_with_all_fields(self):
         """Test GraphQL query with all available fields."""
         self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
@@ -80,6 +185,75 @@ class {{ cookiecutter.__model_name }}GraphQLTestCase(PluginGraphQLTestCase):
         self.assertEqual(data['name'], instance.name)
         self.assertIsNotNone(data['created'])
         self.assertIsNotNone(data['last_updated'])
+
+
+class {{ cookiecutter.__model_name }}PersistedQueryTestCase(PluginGraphQLTestCase):
+    """Test the persisted query GraphQL endpoint."""
+
+    query = 'query { {{ cookiecutter.__model_url_name }}_list { name } }'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for all tests."""
+        super().setUpTestData()
+        {{ cookiecutter.__model_name }}.objects.create(name='Persisted Test')
+
+    def setUp(self):
+        """Set up each test."""
+        super().setUp()
+        cache.clear()
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        self.url = reverse('plugins:{{ cookiecutter.underscored }}:graphql')
+        self.sha256_hash = hashlib.sha256(self.query.encode()).hexdigest()
+
+    def post(self, data):
+        """POST a GraphQL request to the persisted query endpoint."""
+        return self.client.post(self.url, data=data, content_type='application/json')
+
+    def persisted(self, sha256_hash=None):
+        """Return the persisted query extension for a hash."""
+        return {'persistedQuery': {'version': 1, 'sha256Hash': sha256_hash or self.sha256_hash}}
+
+    def test_register_and_execute(self):
+        """Test registering a document and executing it by hash."""
+        response = self.post({'query': self.query, 'extensions': self.persisted()})
+        self.assertHttpStatus(response, 200)
+
+        response = self.post({'extensions': self.persisted()})
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            response.json()['data']['{{ cookiecutter.__model_url_name }}_list'],
+            [{'name': 'Persisted Test'}]
+        )
+
+    def test_unknown_hash(self):
+        """Test that an unregistered hash asks the client to send the document."""
+        response = self.post({'extensions': self.persisted()})
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.json(), {
+            'errors': [{
+                'message': 'PersistedQueryNotFound',
+                'extensions': {'code': 'PERSISTED_QUERY_NOT_FOUND'},
+            }],
+        })
+
+        # The client's retry with the full document registers and executes it
+        response = self.post({'query': self.query, 'extensions': self.persisted()})
+        self.assertHttpStatus(response, 200)
+        self.assertIn('data', response.json())
+
+    def test_hash_mismatch(self):
+        """Test that a document is not registered under the wrong hash."""
+        response = self.post({'query': self.query, 'extensions': self.persisted('0' * 64)})
+        self.assertHttpStatus(response, 400)
+        self.assertIsNone(cache.get(persisted_query_key('0' * 64)))
+
+    def test_schema_caches_documents(self):
+        """Test that the endpoint's schema caches parsing and validation."""
+        extensions = [type(extension) for extension in get_schema().extensions]
+        self.assertIn(ParserCache, extensions)
+        self.assertIn(ValidationCache, extensions)
+
 {% else -%}
 # GraphQL not enabled for this plugin
 # To enable GraphQL support, regenerate the plugin with include_graphql=yes
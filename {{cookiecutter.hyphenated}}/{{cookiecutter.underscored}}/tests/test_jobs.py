@@ -0,0 +1,97 @@
+"""
+Test cases for {{ cookiecutter.project_name }} background jobs.
+"""
+
+from core.models import ObjectType
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from extras.choices import CustomFieldTypeChoices
+from extras.models import CustomField
+
+from ..jobs import {{ cookiecutter.__model_name }}ImportJob
+from ..models import {{ cookiecutter.__model_name }}
+from ..testing import PluginTestCase
+from ..testing.utils import assert_object_changes, create_tags
+
+
+@override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'import_job_batch_size': 2}})
+class {{ cookiecutter.__model_name }}ImportJobTestCase(PluginTestCase):
+    """Test {{ cookiecutter.__model_name }}ImportJob."""
+
+    def run_import(self, content):
+        """Store a CSV file and run the import job for it synchronously."""
+        path = default_storage.save('{{ cookiecutter.underscored }}/imports/test.csv', ContentFile(content.encode()))
+        job = {{ cookiecutter.__model_name }}ImportJob.enqueue(user=self.user, path=path, immediate=True)
+        job.refresh_from_db()
+        self.assertFalse(default_storage.exists(path))
+        return job
+
+    def test_import(self):
+        """Test importing new and existing objects across several batches."""
+        self.add_permissions(
+            '{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}',
+            '{{ cookiecutter.underscored }}.change_{{ cookiecutter.__model_url_name }}'
+        )
+        existing = {{ cookiecutter.__model_name }}.objects.create(name='Job Test')
+
+        job = self.run_import(f'id,name\n,Job 1\n,Job 2\n{existing.pk},Job Renamed\n')
+
+        self.assertEqual(job.data['processed'], 3)
+        self.assertEqual(job.data['created'], 2)
+        self.assertEqual(job.data['updated'], 1)
+        self.assertEqual(job.data['errors'], [])
+        existing.refresh_from_db()
+        self.assertEqual(existing.name, 'Job Renamed')
+        assert_object_changes(self, {{ cookiecutter.__model_name }}.objects.get(name='Job 1'), 'create', user=self.user)
+
+    def test_import_update_keeps_missing_columns(self):
+        """Test that updating an object leaves the fields without a column untouched."""
+        self.add_permissions('{{ cookiecutter.underscored }}.change_{{ cookiecutter.__model_url_name }}')
+        field = CustomField.objects.create(name='job_field', type=CustomFieldTypeChoices.TYPE_TEXT)
+        field.object_types.set([ObjectType.objects.get_for_model({{ cookiecutter.__model_name }})])
+        tags = create_tags(['Job Tag 1', 'Job Tag 2'])
+        existing = {{ cookiecutter.__model_name }}.objects.create(name='Job Test', custom_field_data={'job_field': 'Kept'})
+        existing.tags.set(tags)
+
+        job = self.run_import(f'id,name\n{existing.pk},Job Renamed\n')
+
+        self.assertEqual(job.data['updated'], 1)
+        self.assertEqual(job.data['errors'], [])
+        existing.refresh_from_db()
+        self.assertEqual(existing.name, 'Job Renamed')
+        self.assertEqual(existing.custom_field_data, {'job_field': 'Kept'})
+        self.assertEqual(set(existing.tags.all()), set(tags))
+
+    def test_import_invalid_records(self):
+        """Test that invalid records are reported and skipped."""
+        self.add_permissions('{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}')
+        {{ cookiecutter.__model_name }}.objects.create(name='Job Test')
+
+        job = self.run_import('name\nJob 1\nJob Test\n\nJob 2\n')
+
+        self.assertEqual(job.data['created'], 2)
+        self.assertEqual(job.data['failed'], 1)
+        self.assertEqual([error['record'] for error in job.data['errors']], [2])
+        self.assertIn('name', job.data['errors'][0]['errors'])
+
+    def test_import_short_records(self):
+        """Test that records with missing trailing columns are reported and skipped."""
+        self.add_permissions('{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}')
+
+        job = self.run_import('name,id\nJob 1,\nJob 2\n')
+
+        self.assertEqual(job.data['processed'], 2)
+        self.assertEqual(job.data['created'], 1)
+        self.assertEqual(job.data['failed'], 1)
+        self.assertEqual([error['record'] for error in job.data['errors']], [2])
+        self.assertIn('__all__', job.data['errors'][0]['errors'])
+        self.assertFalse({{ cookiecutter.__model_name }}.objects.filter(name='Job 2').exists())
+
+    def test_import_without_permission(self):
+        """Test that records are not saved without add permission."""
+        job = self.run_import('name\nJob 1\n')
+
+        self.assertEqual(job.data['created'], 0)
+        self.assertEqual(job.data['failed'], 1)
+        self.assertFalse({{ cookiecutter.__model_name }}.objects.filter(name='Job 1').exists())
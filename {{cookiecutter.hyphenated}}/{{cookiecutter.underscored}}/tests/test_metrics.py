@@ -0,0 +1,115 @@
+"""
+Test cases for {{ cookiecutter.project_name }} Prometheus metrics.
+"""
+
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from ..instrumentation import instrument_templates
+from ..metrics import registry
+from ..models import {{ cookiecutter.__model_name }}
+from ..testing import PluginAPITestCase, PluginTestCase
+from ..testing.utils import disable_warnings
+
+LIST_VIEW = 'plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list'
+METRICS_VIEW = 'plugins:{{ cookiecutter.underscored }}:metrics'
+
+
+def sample(name, **labels):
+    """Return the current value of a metric sample, or 0 if it has not been recorded yet."""
+    return registry.get_sample_value(f'{{ cookiecutter.underscored }}_{name}', labels) or 0
+
+
+@override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'metrics_enabled': True}})
+class MetricsTestCase(PluginTestCase):
+    """Test per-view metrics and the metrics endpoint."""
+
+    user_permissions = ['{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}']
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for all tests."""
+        super().setUpTestData()
+        {{ cookiecutter.__model_name }}.objects.create(name='Metrics Test 1')
+        {{ cookiecutter.__model_name }}.objects.create(name='Metrics Test 2')
+
+    def setUp(self):
+        """Set up each test."""
+        super().setUp()
+        instrument_templates()
+
+    def test_list_view_metrics(self):
+        """Test that latency, SQL and template metrics are recorded for the list view."""
+        requests = sample('request_duration_seconds_count', view=LIST_VIEW, method='GET')
+        queries = sample('db_queries_sum', view=LIST_VIEW)
+        renders = sample('template_render_duration_seconds_count', view=LIST_VIEW)
+
+        response = self.client.get(reverse(LIST_VIEW))
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(sample('request_duration_seconds_count', view=LIST_VIEW, method='GET'), requests + 1)
+        self.assertEqual(sample('requests_total', view=LIST_VIEW, method='GET', status='200'), requests + 1)
+        self.assertGreater(sample('db_queries_sum', view=LIST_VIEW), queries)
+        self.assertEqual(sample('template_render_duration_seconds_count', view=LIST_VIEW), renders + 1)
+{%- if cookiecutter.include_rest_api == "yes" %}
+
+    def test_api_serializer_metrics(self):
+        """Test that serializer time is recorded for the REST API list endpoint."""
+        view = 'plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-list'
+        serializations = sample('serializer_duration_seconds_count', view=view)
+
+        response = self.client.get(reverse(view))
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(sample('serializer_duration_seconds_count', view=view), serializations + 1)
+{%- endif %}
+
+    def test_metrics_endpoint(self):
+        """Test that metrics are served in the Prometheus text format."""
+        self.client.get(reverse(LIST_VIEW))
+
+        response = self.client.get(reverse(METRICS_VIEW))
+
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn(
+            '{{ cookiecutter.underscored }}_request_duration_seconds_bucket{le="0.005",method="GET",view="' + LIST_VIEW + '"}',
+            response.content.decode(),
+        )
+
+    @override_settings(LOGIN_REQUIRED=True)
+    def test_metrics_endpoint_requires_token(self):
+        """Test that scrapers without a session are refused without an API token and allowed with one."""
+        _, authorization = PluginAPITestCase.create_token(self.user)
+        client = Client()
+
+        with disable_warnings('django.request'):
+            response = client.get(reverse(METRICS_VIEW))
+        self.assertHttpStatus(response, 401)
+        self.assertEqual(response['WWW-Authenticate'], 'Bearer')
+
+        with disable_warnings('django.request'):
+            response = client.get(reverse(METRICS_VIEW), HTTP_AUTHORIZATION='Bearer invalid')
+        self.assertHttpStatus(response, 401)
+
+        response = client.get(reverse(METRICS_VIEW), HTTP_AUTHORIZATION=authorization)
+        self.assertHttpStatus(response, 200)
+
+    @override_settings(LOGIN_REQUIRED=False)
+    def test_metrics_endpoint_anonymous(self):
+        """Test that metrics are served without credentials when LOGIN_REQUIRED is off."""
+        response = Client().get(reverse(METRICS_VIEW))
+
+        self.assertHttpStatus(response, 200)
+
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'metrics_enabled': False}})
+    def test_metrics_disabled(self):
+        """Test that nothing is recorded or served while metrics are disabled."""
+        requests = sample('request_duration_seconds_count', view=LIST_VIEW, method='GET')
+
+        self.client.get(reverse(LIST_VIEW))
+
+        self.assertEqual(sample('request_duration_seconds_count', view=LIST_VIEW, method='GET'), requests)
+        with disable_warnings('django.request'):
+            response = self.client.get(reverse(METRICS_VIEW))
+        self.assertHttpStatus(response, 404)
@@ -15,6 +15,7 @@ class {{ cookiecutter.__model_name }}TestCase(PluginModelTestCase):
     @classmethod
     def setUpTestData(cls):
         """Set up test data for all tests."""
+        super().setUpTestData()
         # Create test instances
         {{ cookiecutter.__model_name }}.objects.create(name='Test 1')
         {{ cookiecutter.__model_name }}.objects.create(name='Test 2')
@@ -0,0 +1,116 @@
+"""
+Test cases for {{ cookiecutter.project_name }} request profiling.
+"""
+
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+
+from ..models import {{ cookiecutter.__model_name }}
+from ..navigation import menu_items
+from ..profiling import PROFILER_LOCK, list_profiles
+from ..testing import PluginTestCase
+from ..testing.utils import disable_warnings
+
+LIST_VIEW = 'plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list'
+
+
+class RequestProfilingTestCase(PluginTestCase):
+    """Test on-demand profiling of plugin requests."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for all tests."""
+        super().setUpTestData()
+        {{ cookiecutter.__model_name }}.objects.create(name='Profiling Test 1')
+
+    def setUp(self):
+        """Enable profiling into a temporary directory and make the test user a superuser."""
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {
+            'profiling_enabled': True, 'profiling_directory': directory.name, 'profiling_max_profiles': 2,
+        }})
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.user.is_superuser = True
+        self.user.save()
+
+    def test_profile_request(self):
+        """Test that a requested profile is saved with its SQL timings and can be downloaded."""
+        response = self.client.get(reverse(LIST_VIEW), {'_profile': '1'})
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(list_profiles()), 1)
+        report = self.client.get(response['X-Profile'])
+        self.assertHttpStatus(report, 200)
+        content = b''.join(report.streaming_content).decode()
+        self.assertIn('SQL timeline', content)
+        self.assertIn('SELECT', content)
+        self.assertIn("SQL time by issuing function, of the function's cumulative time", content)
+        self.assertIn('function calls', content)
+
+    def test_profile_header(self):
+        """Test that the X-Profile header triggers profiling too."""
+        response = self.client.get(reverse(LIST_VIEW), HTTP_X_PROFILE='1')
+
+        self.assertIn('X-Profile', response)
+
+    def test_profile_concurrent(self):
+        """Test that requests are served unprofiled while another profiler is active."""
+        with PROFILER_LOCK, self.assertLogs('{{ cookiecutter.underscored }}.profiling', 'WARNING'):
+            response = self.client.get(reverse(LIST_VIEW), {'_profile': '1'})
+
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn('X-Profile', response)
+
+        with mock.patch('cProfile.Profile') as profile, self.assertLogs('{{ cookiecutter.underscored }}.profiling', 'WARNING'):
+            profile.return_value.enable.side_effect = ValueError('Another profiling tool is already active')
+            response = self.client.get(reverse(LIST_VIEW), {'_profile': '1'})
+
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn('X-Profile', response)
+        self.assertEqual(list_profiles(), [])
+        self.assertFalse(PROFILER_LOCK.locked())
+
+    def test_profile_ring_buffer(self):
+        """Test that only the most recent profiles are kept."""
+        names = [self.client.get(reverse(LIST_VIEW), {'_profile': '1'})['X-Profile'] for _ in range(3)]
+
+        self.assertEqual(len(list_profiles()), 2)
+        response = self.client.get(reverse('plugins:{{ cookiecutter.underscored }}:request_profile_list'))
+        self.assertHttpStatus(response, 200)
+        self.assertNotContains(response, names[0].rstrip('/').rsplit('/', 1)[-1])
+        self.assertContains(response, names[2].rstrip('/').rsplit('/', 1)[-1])
+
+    def test_profile_requires_superuser(self):
+        """Test that other users can neither trigger profiling nor download profiles."""
+        self.client.get(reverse(LIST_VIEW), {'_profile': '1'})
+        self.user.is_superuser = False
+        self.user.save()
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        response = self.client.get(reverse(LIST_VIEW), {'_profile': '1'})
+
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn('X-Profile', response)
+        self.assertEqual(len(list_profiles()), 1)
+        with disable_warnings('django.request'):
+            response = self.client.get(reverse('plugins:{{ cookiecutter.underscored }}:request_profile_list'))
+        self.assertHttpStatus(response, 403)
+
+    def test_profile_menu_item_superuser_only(self):
+        """Test that the Request profiles menu item is shown to superusers only, like its views."""
+        item = next(item for item in menu_items if item.link.endswith(':request_profile_list'))
+        self.assertTrue(self.user.has_perms(item.permissions))
+
+        self.user.is_superuser = False
+        self.user.is_staff = True
+        self.user.save()
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        self.assertFalse(get_user_model().objects.get(pk=self.user.pk).has_perms(item.permissions))
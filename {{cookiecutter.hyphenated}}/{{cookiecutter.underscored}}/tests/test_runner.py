@@ -0,0 +1,62 @@
+"""
+Test cases for the {{ cookiecutter.project_name }} parallel test runner.
+"""
+
+import argparse
+import copy
+import os
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.test import override_settings
+
+from ..testing import PluginTestCase
+from ..testing.runner import ParallelTestRunner, configure_worker
+
+
+class ParallelTestRunnerTestCase(PluginTestCase):
+    """Test the per-worker resources and worker cap of ParallelTestRunner."""
+
+    def test_configure_worker(self):
+        """Test that a worker's cache, RQ queues and MEDIA_ROOT are moved to its own Redis database and directory."""
+        caches, media_root = settings.CACHES, settings.MEDIA_ROOT
+
+        with override_settings(RQ_QUEUES=copy.deepcopy(settings.RQ_QUEUES)):
+            worker_settings = configure_worker(3)
+            try:
+                self.assertTrue(all(config['LOCATION'].endswith('/4') for config in settings.CACHES.values()))
+                self.assertTrue(all(config['DB'] == 4 for config in settings.RQ_QUEUES.values()))
+                self.assertEqual(settings.MEDIA_ROOT, os.path.join(media_root, 'worker-3'))
+            finally:
+                worker_settings.disable()
+
+        self.assertEqual(settings.CACHES, caches)
+        self.assertEqual(settings.MEDIA_ROOT, media_root)
+
+    @mock.patch.dict(os.environ, {'REDIS_DATABASES': '8'})
+    def test_worker_cap(self):
+        """Test that the runner starts no more workers than there are free Redis databases."""
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            runner = ParallelTestRunner(parallel=10)
+
+        self.assertEqual(runner.parallel, 6)
+        self.assertIn('Running 6 of 10 test processes', stdout.getvalue())
+        self.assertEqual(ParallelTestRunner(parallel=6).parallel, 6)
+
+    def test_start_method(self):
+        """Test that only the forkserver start method is replaced with fork."""
+        for default, replaced in (('forkserver', True), ('spawn', False), ('fork', False)):
+            with (
+                self.subTest(default=default),
+                mock.patch('multiprocessing.get_start_method', return_value=default),
+                mock.patch('multiprocessing.set_start_method') as set_start_method,
+            ):
+                ParallelTestRunner.add_arguments(argparse.ArgumentParser())
+
+                if replaced:
+                    set_start_method.assert_called_once_with('fork', force=True)
+                else:
+                    set_start_method.assert_not_called()
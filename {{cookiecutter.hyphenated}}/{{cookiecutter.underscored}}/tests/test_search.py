@@ -0,0 +1,82 @@
+"""
+Test cases for {{ cookiecutter.project_name }} search reindexing.
+"""
+
+from io import StringIO
+
+from core.models import ObjectType
+from django.core.management import call_command
+from django.utils import timezone
+from extras.models import CachedValue
+
+from ..models import {{ cookiecutter.__model_name }}
+from ..reindex import reindex
+from ..testing import PluginTestCase
+
+
+class {{ cookiecutter.__model_name }}ReindexTestCase(PluginTestCase):
+    """Test the incremental search reindex."""
+
+    label = {{ cookiecutter.__model_name }}._meta.label
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for all tests."""
+        super().setUpTestData()
+        for i in range(5):
+            {{ cookiecutter.__model_name }}.objects.create(name=f'Search Test {i}')
+
+    def cached_values(self):
+        """Return the cached search values of {{ cookiecutter.__model_name }} objects."""
+        object_type = ObjectType.objects.get_for_model({{ cookiecutter.__model_name }})
+        return CachedValue.objects.filter(object_type=object_type)
+
+    def test_reindex_missing(self):
+        """Test that objects without cached values are reindexed in ranges."""
+        self.cached_values().delete()
+
+        results = reindex(batch_size=2, workers=1)
+
+        self.assertEqual(results[self.label], 5)
+        self.assertEqual(self.cached_values().filter(field='name').count(), 5)
+
+    def test_reindex_incremental(self):
+        """Test that only objects changed since the last indexing are reindexed."""
+        reindex(full=True, workers=1)
+        self.assertEqual(reindex(workers=1)[self.label], 0)
+
+        # Simulate a write that bypassed the search cache signal handlers
+        {{ cookiecutter.__model_name }}.objects.filter(name='Search Test 3').update(
+            name='Search Renamed', last_updated=timezone.now()
+        )
+
+        self.assertEqual(reindex(workers=1)[self.label], 1)
+        self.assertTrue(self.cached_values().filter(value='Search Renamed').exists())
+        self.assertFalse(self.cached_values().filter(value='Search Test 3').exists())
+
+    def test_reindex_bulk_update(self):
+        """Test that bulk-updated objects stay stale after a later save of another object is indexed."""
+        reindex(full=True, workers=1)
+
+        # Bulk updates bypass the search cache signal handlers
+        for i in (1, 2):
+            {{ cookiecutter.__model_name }}.objects.filter(name=f'Search Test {i}').update(
+                name=f'Search Bulk {i}', last_updated=timezone.now()
+            )
+        # A regular save indexes its object with a newer timestamp than the bulk updates
+        instance = {{ cookiecutter.__model_name }}.objects.get(name='Search Test 4')
+        instance.name = 'Search Saved'
+        instance.save()
+
+        self.assertEqual(reindex(workers=1)[self.label], 2)
+        self.assertTrue(self.cached_values().filter(value='Search Bulk 1').exists())
+        self.assertTrue(self.cached_values().filter(value='Search Bulk 2').exists())
+
+    def test_reindex_command(self):
+        """Test the reindex management command."""
+        self.cached_values().delete()
+        stdout = StringIO()
+
+        call_command('{{ cookiecutter.__model_url_name }}_reindex', '--workers', '1', stdout=stdout)
+
+        self.assertIn('Reindexed 5 objects', stdout.getvalue())
@@ -0,0 +1,79 @@
+"""
+Test cases for {{ cookiecutter.project_name }} benchmark data seeding.
+"""
+
+from io import StringIO
+
+from core.models import ObjectType
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from extras.choices import CustomFieldTypeChoices
+from extras.models import CustomField
+
+from ..models import {{ cookiecutter.__model_name }}
+from ..seed import seed_objects
+from ..testing import PluginTestCase
+
+
+class {{ cookiecutter.__model_name }}SeedTestCase(PluginTestCase):
+    """Test the deterministic bulk seeding of {{ cookiecutter.__model_name }} objects."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for all tests."""
+        super().setUpTestData()
+        object_type = ObjectType.objects.get_for_model({{ cookiecutter.__model_name }})
+        for name, field_type in (
+            ('seed_text', CustomFieldTypeChoices.TYPE_TEXT),
+            ('seed_int', CustomFieldTypeChoices.TYPE_INTEGER),
+        ):
+            field = CustomField.objects.create(name=name, type=field_type)
+            field.object_types.set([object_type])
+
+    def snapshot(self, prefix):
+        """Return the generated names, tag names and custom field data, with the prefix removed."""
+        queryset = {{ cookiecutter.__model_name }}.objects.filter(name__startswith=prefix).prefetch_related('tags')
+        return [
+            (
+                obj.name.removeprefix(prefix),
+                sorted(tag.name.removeprefix(prefix) for tag in obj.tags.all()),
+                obj.custom_field_data,
+            )
+            for obj in queryset.order_by('name')
+        ]
+
+    def test_seed_objects(self):
+        """Test that objects, tags and custom field data are created in batches."""
+        stats = seed_objects(25, batch_size=10, max_tags=2)
+
+        self.assertEqual(stats['objects'], 25)
+        self.assertEqual({{ cookiecutter.__model_name }}.objects.filter(name__startswith='seed-').count(), 25)
+        obj = {{ cookiecutter.__model_name }}.objects.get(name='seed-0-00000007')
+        self.assertIsInstance(obj.custom_field_data['seed_text'], str)
+        self.assertIsInstance(obj.custom_field_data['seed_int'], int)
+        self.assertLessEqual(obj.tags.count(), 2)
+        self.assertEqual(
+            sum({{ cookiecutter.__model_name }}.objects.get(name=f'seed-0-{i:08d}').tags.count() for i in range(25)),
+            stats['tagged_items'],
+        )
+
+    def test_seed_objects_deterministic(self):
+        """Test that the same seed generates the same data regardless of the batch size."""
+        seed_objects(20, seed=7, prefix='a', batch_size=20)
+        seed_objects(20, seed=7, prefix='b', batch_size=3)
+        seed_objects(20, seed=8, prefix='c', batch_size=20)
+
+        self.assertEqual(self.snapshot('a'), self.snapshot('b'))
+        self.assertNotEqual(self.snapshot('a')[0][2], self.snapshot('c')[0][2])
+
+    def test_seed_command(self):
+        """Test the seed management command."""
+        stdout = StringIO()
+
+        call_command('{{ cookiecutter.__model_url_name }}_seed', '12', '--batch-size', '5', stdout=stdout)
+
+        self.assertEqual({{ cookiecutter.__model_name }}.objects.filter(name__startswith='seed-').count(), 12)
+        self.assertIn('rows/s', stdout.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command('{{ cookiecutter.__model_url_name }}_seed', '12', stdout=StringIO())
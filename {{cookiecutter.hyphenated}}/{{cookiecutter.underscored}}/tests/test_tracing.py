@@ -0,0 +1,141 @@
+"""
+Test cases for {{ cookiecutter.project_name }} request tracing.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from django.test import override_settings
+from django.urls import reverse
+
+from ..instrumentation import instrument_templates
+from ..models import {{ cookiecutter.__model_name }}
+from ..testing import PluginTestCase
+from ..tracing import exporters, get_exporter
+
+LIST_VIEW = 'plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list'
+
+
+def tracing_settings(exporter='MemorySpanExporter', **options):
+    """Return settings enabling tracing with one of the plugin's exporters."""
+    return override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {
+        'tracing_enabled': True,
+        'tracing_exporter': f'{{ cookiecutter.underscored }}.tracing.{exporter}',
+        'tracing_exporter_options': options,
+    }})
+
+
+@tracing_settings()
+class TracingTestCase(PluginTestCase):
+    """Test the spans recorded for plugin requests."""
+
+    user_permissions = ['{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}']
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data for all tests."""
+        super().setUpTestData()
+        {{ cookiecutter.__model_name }}.objects.create(name='Tracing Test 1')
+        {{ cookiecutter.__model_name }}.objects.create(name='Tracing Test 2')
+
+    def setUp(self):
+        """Set up each test."""
+        super().setUp()
+        instrument_templates()
+        exporters.clear()
+
+    def get_spans(self):
+        """Return the exported spans by name."""
+        spans = {}
+        for span in get_exporter().spans:
+            spans.setdefault(span.name, []).append(span)
+        return spans
+
+    def get_descendants(self, span_id):
+        """Return the exported spans nested below span_id."""
+        children = {}
+        for span in get_exporter().spans:
+            children.setdefault(span.parent_span_id, []).append(span)
+        descendants, parents = [], [span_id]
+        while parents:
+            for span in children.get(parents.pop(), []):
+                descendants.append(span)
+                parents.append(span.span_id)
+        return descendants
+
+    def test_list_view_spans(self):
+        """Test that filterset, table, template and SQL spans are nested below the request span."""
+        response = self.client.get(reverse(LIST_VIEW), {'q': 'Tracing'})
+
+        self.assertHttpStatus(response, 200)
+        spans = self.get_spans()
+        root = spans[f'GET {LIST_VIEW}'][0]
+        self.assertIsNone(root.parent_span_id)
+        self.assertEqual(root.attributes['http.status_code'], 200)
+        self.assertIn('{{ cookiecutter.__model_name }}FilterSet.qs', spans)
+        self.assertIn('{{ cookiecutter.__model_name }}Table.configure', spans)
+        self.assertIn('template.render', spans)
+
+        # The table's rows are fetched while rendering it
+        table = spans['{{ cookiecutter.__model_name }}Table.render'][0]
+        self.assertIn(table, self.get_descendants(root.span_id))
+        self.assertTrue(any(
+            {{ cookiecutter.__model_name }}._meta.db_table in span.attributes['db.statement']
+            for span in self.get_descendants(table.span_id) if span.name == 'db.query'
+        ))
+        self.assertTrue(all(span.trace_id == root.trace_id for span in get_exporter().spans))
+
+        # SQL statements become children of the span that ran them
+        span_ids = {span.span_id for span in get_exporter().spans}
+        queries = spans['db.query']
+        self.assertTrue(any('SELECT' in span.attributes['db.statement'] for span in queries))
+        self.assertTrue(all(span.parent_span_id in span_ids for span in queries))
+        self.assertTrue(any(span.parent_span_id != root.span_id for span in queries))
+{%- if cookiecutter.include_rest_api == "yes" %}
+
+    def test_serializer_spans(self):
+        """Test that every serialized object gets a span."""
+        response = self.client.get(
+            reverse('plugins-api:{{ cookiecutter.underscored }}-api:{{ cookiecutter.__model_url_name }}-list')
+        )
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(self.get_spans()['{{ cookiecutter.__model_name }}Serializer.to_representation']), 2)
+{%- endif %}
+
+    def test_traceparent(self):
+        """Test that a W3C traceparent header continues the caller's trace."""
+        trace_id, parent_id = '4bf92f3577b34da6a3ce929d0e0e4736', '00f067aa0ba902b7'
+
+        self.client.get(reverse(LIST_VIEW), HTTP_TRACEPARENT=f'00-{trace_id}-{parent_id}-01')
+
+        root = self.get_spans()[f'GET {LIST_VIEW}'][0]
+        self.assertEqual(root.trace_id, trace_id)
+        self.assertEqual(root.parent_span_id, parent_id)
+
+    def test_file_exporter(self):
+        """Test that the file exporter appends one JSON object per span."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'spans.jsonl'
+            with tracing_settings('FileSpanExporter', path=str(path)):
+                self.client.get(reverse(LIST_VIEW))
+
+            spans = [json.loads(line) for line in path.read_text().splitlines()]
+        self.assertEqual(spans[-1]['name'], f'GET {LIST_VIEW}')
+        self.assertIn('start_time_unix_nano', spans[0])
+
+    def test_console_exporter(self):
+        """Test that the console exporter logs the span tree."""
+        with tracing_settings('ConsoleSpanExporter'), self.assertLogs('{{ cookiecutter.underscored }}.tracing', 'INFO') as logs:
+            self.client.get(reverse(LIST_VIEW))
+
+        self.assertIn(f'GET {LIST_VIEW}', logs.output[0])
+        self.assertIn('db.query', logs.output[0])
+
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'tracing_enabled': False}})
+    def test_tracing_disabled(self):
+        """Test that nothing is exported while tracing is disabled."""
+        self.client.get(reverse(LIST_VIEW))
+
+        self.assertEqual(exporters, {})
@@ -2,19 +2,39 @@
 Test cases for {{ cookiecutter.project_name }} views.
 """
 
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
+from core.models import Job
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from utilities.forms.choices import CSVDelimiterChoices, ImportFormatChoices
 
 from ..models import {{ cookiecutter.__model_name }}
+from ..tables import {{ cookiecutter.__model_name }}Table
 from ..testing import PluginViewTestCase
-from ..testing.utils import disable_warnings, get_random_string
+from ..testing.utils import assert_sql_snapshot, create_tagged_objects, create_tags, disable_warnings, get_random_string
 
 
 class {{ cookiecutter.__model_name }}ViewTestCase(PluginViewTestCase):
     """Test {{ cookiecutter.__model_name }} views."""
 
+    # Generous ceilings; lower them towards the current counts to catch regressions early
+    query_budgets = {
+        'plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list': 30,
+    }
+
     @classmethod
     def setUpTestData(cls):
         """Set up test data for all tests."""
+        super().setUpTestData()
         {{ cookiecutter.__model_name }}.objects.create(name='View Test 1')
         {{ cookiecutter.__model_name }}.objects.create(name='View Test 2')
         {{ cookiecutter.__model_name }}.objects.create(name='View Test 3')
@@ -24,6 +44,14 @@ class {{ cookiecutter.__model_name }}ViewTestCase(PluginViewTestCase):
         super().setUp()
         self.base_url = 'plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}'
 
+    def test_query_budgets(self):
+        """Test that list queries stay within budget however many objects are listed."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        tags = create_tags(['budget-a', 'budget-b'])
+        self.assertQueryBudgets(
+            lambda count: create_tagged_objects({{ cookiecutter.__model_name }}, count, tags, prefix='Budget')
+        )
+
     def test_list_{{ cookiecutter.__model_url_name }}s(self):
         """Test {{ cookiecutter.__model_name }} list view."""
         self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
@@ -33,6 +61,73 @@ class {{ cookiecutter.__model_name }}ViewTestCase(PluginViewTestCase):
 
         self.assertHttpStatus(response, 200)
 
+    def test_list_{{ cookiecutter.__model_url_name }}s_sql_snapshot(self):
+        """Test that the list SQL matches its recorded snapshot and avoids large sequential scans."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list')
+
+        # Warm up caches so the snapshot does not depend on which tests ran before
+        self.client.get(url)
+        with assert_sql_snapshot(self, explain=True):
+            response = self.client.get(url)
+
+        self.assertHttpStatus(response, 200)
+
+    @contextmanager
+    def snapshot_file(self, content=None):
+        """Point assert_sql_snapshot() at a temporary snapshot file, optionally with content."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'snapshot.sql'
+            if content is not None:
+                path.write_text(content)
+            with (
+                mock.patch('{{ cookiecutter.underscored }}.testing.utils.get_snapshot_path', return_value=path),
+                mock.patch.dict(os.environ),
+            ):
+                os.environ.pop('UPDATE_SQL_SNAPSHOTS', None)
+                os.environ.pop('REQUIRE_SQL_SNAPSHOTS', None)
+                yield path
+
+    def test_sql_snapshot_mismatch(self):
+        """Test that SQL differing from the snapshot fails with a diff."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list')
+        self.client.get(url)
+
+        with self.snapshot_file('SELECT ? FROM "unrelated"\n'):
+            with self.assertRaises(self.failureException) as context:
+                with assert_sql_snapshot(self):
+                    self.client.get(url)
+
+        message = str(context.exception)
+        self.assertIn('SQL differs from the snapshot', message)
+        self.assertIn('-SELECT ? FROM "unrelated"', message)
+        self.assertIn('+SELECT', message)
+
+    def test_sql_snapshot_missing(self):
+        """Test that a missing snapshot is recorded, or fails with REQUIRE_SQL_SNAPSHOTS."""
+        with self.snapshot_file() as path:
+            with assert_sql_snapshot(self):
+                list({{ cookiecutter.__model_name }}.objects.all())
+            self.assertIn({{ cookiecutter.__model_name }}._meta.db_table, path.read_text())
+
+            path.unlink()
+            os.environ['REQUIRE_SQL_SNAPSHOTS'] = '1'
+            with self.assertRaisesMessage(self.failureException, 'is missing'):
+                with assert_sql_snapshot(self):
+                    list({{ cookiecutter.__model_name }}.objects.all())
+
+    def test_sql_snapshot_sequential_scan(self):
+        """Test that explain=True fails on a sequential scan over a table above the threshold."""
+        table = {{ cookiecutter.__model_name }}._meta.db_table
+
+        with self.snapshot_file():
+            with self.assertRaises(self.failureException) as context:
+                with assert_sql_snapshot(self, explain=True, seq_scan_threshold=0):
+                    list({{ cookiecutter.__model_name }}.objects.all())
+
+        self.assertIn(f'Sequential scan over {table}', str(context.exception))
+
     def test_list_{{ cookiecutter.__model_url_name }}s_without_permission(self):
         """Test {{ cookiecutter.__model_name }} list view without permission."""
         url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list')
@@ -41,6 +136,89 @@ class {{ cookiecutter.__model_name }}ViewTestCase(PluginViewTestCase):
             response = self.client.get(url)
             self.assertHttpStatus(response, 403)
 
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'approximate_count_threshold': 2}})
+    def test_list_{{ cookiecutter.__model_url_name }}s_approximate_count(self):
+        """Test that the list view marks an estimated count as approximate."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE ' + connection.ops.quote_name({{ cookiecutter.__model_name }}._meta.db_table))
+
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list')
+        response = self.client.get(url)
+
+        self.assertHttpStatus(response, 200)
+        self.assertContains(response, '~3')
+        self.assertEqual(len(response.context['table'].page.object_list), 3)
+
+    def test_list_{{ cookiecutter.__model_url_name }}s_fetches_visible_columns_only(self):
+        """Test that the list view only fetches the fields of the visible columns."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        # Widen every row with a payload that none of the default columns show
+        payload = {'notes': 'x' * 10000}
+        {{ cookiecutter.__model_name }}.objects.update(custom_field_data=payload)
+
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+
+        table = {{ cookiecutter.__model_name }}._meta.db_table
+        [sql] = [
+            query['sql'] for query in queries
+            if f'FROM "{table}"' in query['sql'] and 'COUNT(' not in query['sql']
+        ]
+        self.assertNotIn('custom_field_data', sql)
+        # The hidden tags column is not prefetched either
+        self.assertFalse([query for query in queries if 'extras_taggeditem' in query['sql']])
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            fetched = sum(len(str(value)) for row in cursor.fetchall() for value in row)
+        self.assertLess(fetched, len(json.dumps(payload)))
+
+    def test_list_{{ cookiecutter.__model_url_name }}s_optimized_queryset(self):
+        """Test that the table derives only() and prefetch_related() from its visible columns."""
+        queryset = {{ cookiecutter.__model_name }}.objects.all()
+        table = {{ cookiecutter.__model_name }}Table(queryset)
+        table.columns.show('tags')
+
+        optimized = table.get_optimized_queryset(queryset)
+        self.assertEqual(set(optimized.query.deferred_loading[0]), {'id', 'name'})
+        self.assertEqual(optimized._prefetch_related_lookups, ('tags',))
+
+        # Exports may render hidden columns, so they load every field
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list')
+        request = RequestFactory().get(url, {'export': 'table'})
+        request.user = self.user
+        table = {{ cookiecutter.__model_name }}Table(queryset, user=self.user)
+        table.configure(request)
+        self.assertEqual(table.data.data.query.deferred_loading, (frozenset(), True))
+
+    def test_list_{{ cookiecutter.__model_url_name }}s_tags_column_query_count(self):
+        """Test that showing the tags column does not add queries per row."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+        self.user.config.set('tables.{{ cookiecutter.__model_name }}Table.columns', ['name', 'tags'], commit=True)
+        tags = create_tags(['list-a', 'list-b'])
+        for instance in {{ cookiecutter.__model_name }}.objects.all():
+            instance.tags.set(tags)
+
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_list')
+        self.client.get(url)
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertHttpStatus(response, 200)
+            self.assertContains(response, 'list-a')
+            return len(queries)
+
+        baseline = count_queries()
+        for i in range(10):
+            {{ cookiecutter.__model_name }}.objects.create(name=f'View Tags {i}').tags.set(tags)
+
+        self.assertEqual(count_queries(), baseline)
+
     def test_view_{{ cookiecutter.__model_url_name }}(self):
         """Test {{ cookiecutter.__model_name }} detail view."""
         self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
@@ -52,6 +230,21 @@ class {{ cookiecutter.__model_name }}ViewTestCase(PluginViewTestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(response.context['object'], instance)
 
+    def test_view_{{ cookiecutter.__model_url_name }}_conditional(self):
+        """Test conditional GET requests for the {{ cookiecutter.__model_name }} detail view."""
+        self.add_permissions('{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}')
+
+        instance = {{ cookiecutter.__model_name }}.objects.first()
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}', kwargs={'pk': instance.pk})
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertHttpStatus(response, 304)
+
+        instance.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertHttpStatus(response, 200)
+
     def test_create_{{ cookiecutter.__model_url_name }}(self):
         """Test creating a {{ cookiecutter.__model_name }} via form."""
         self.add_permissions(
@@ -131,6 +324,101 @@ class {{ cookiecutter.__model_name }}ViewTestCase(PluginViewTestCase):
             response = self.client.get(url)
             self.assertHttpStatus(response, 403)
 
+    def import_data(self, names):
+        """Build bulk import form data for the given names."""
+        return {
+            'data': '\n'.join(['name', *names]),
+            'format': ImportFormatChoices.CSV,
+            'csv_delimiter': CSVDelimiterChoices.AUTO,
+        }
+
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'bulk_import_chunk_size': 2}})
+    def test_bulk_import_{{ cookiecutter.__model_url_name }}s(self):
+        """Test a bulk import spanning several chunks."""
+        self.add_permissions(
+            '{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}',
+            '{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}'
+        )
+
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_bulk_import')
+        names = [f'Imported {i}' for i in range(5)]
+
+        response = self.client.post(url, self.import_data(names), follow=True)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual({{ cookiecutter.__model_name }}.objects.filter(name__in=names).count(), 5)
+
+    @override_settings(PLUGINS_CONFIG={'{{ cookiecutter.underscored }}': {'bulk_import_chunk_size': 2}})
+    def test_bulk_import_{{ cookiecutter.__model_url_name }}s_failing_chunk(self):
+        """Test that a failing chunk is rolled back while earlier chunks stay committed."""
+        self.add_permissions(
+            '{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}',
+            '{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}'
+        )
+
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_bulk_import')
+        names = ['Imported 1', 'Imported 2', 'Imported 3', 'View Test 1', 'Imported 4']
+
+        response = self.client.post(url, self.import_data(names))
+        self.assertHttpStatus(response, 200)  # Form redisplay
+        self.assertEqual(
+            list({{ cookiecutter.__model_name }}.objects.filter(name__startswith='Imported').values_list('name', flat=True)),
+            ['Imported 1', 'Imported 2']
+        )
+
+    def test_import_job_{{ cookiecutter.__model_url_name }}s(self):
+        """Test queueing a background import from the UI."""
+        self.add_permissions('{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}')
+
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_import_job')
+        self.assertHttpStatus(self.client.get(url), 200)
+
+        upload = SimpleUploadedFile('import.csv', b'name\nQueued 1\n', content_type='text/csv')
+        response = self.client.post(url, {'file': upload})
+
+        job = Job.objects.get(user=self.user)
+        self.assertRedirects(response, job.get_absolute_url(), fetch_redirect_response=False)
+
+    def test_bulk_edit_{{ cookiecutter.__model_url_name }}s(self):
+        """Test adding a tag to several {{ cookiecutter.__model_name }}s at once."""
+        self.add_permissions(
+            '{{ cookiecutter.underscored }}.change_{{ cookiecutter.__model_url_name }}',
+            '{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}'
+        )
+        tags = create_tags(['bulk'])
+        pks = list({{ cookiecutter.__model_name }}.objects.values_list('pk', flat=True))
+
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_bulk_edit')
+        form_data = {'pk': pks, 'add_tags': [tags[0].pk], '_apply': True}
+
+        response = self.client.post(url, form_data, follow=True)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual({{ cookiecutter.__model_name }}.objects.filter(tags=tags[0]).count(), len(pks))
+
+    def test_bulk_delete_{{ cookiecutter.__model_url_name }}s(self):
+        """Test deleting several {{ cookiecutter.__model_name }}s at once."""
+        self.add_permissions(
+            '{{ cookiecutter.underscored }}.delete_{{ cookiecutter.__model_url_name }}',
+            '{{ cookiecutter.underscored }}.view_{{ cookiecutter.__model_url_name }}'
+        )
+        pks = list({{ cookiecutter.__model_name }}.objects.values_list('pk', flat=True))
+
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_bulk_delete')
+        form_data = {'pk': pks, 'confirm': True, '_confirm': True}
+
+        response = self.client.post(url, form_data, follow=True)
+        self.assertHttpStatus(response, 200)
+        self.assertFalse({{ cookiecutter.__model_name }}.objects.exists())
+
+    def test_bulk_delete_{{ cookiecutter.__model_url_name }}s_without_permission(self):
+        """Test bulk deletion without permission."""
+        pks = list({{ cookiecutter.__model_name }}.objects.values_list('pk', flat=True))
+        url = reverse('plugins:{{ cookiecutter.underscored }}:{{ cookiecutter.__model_url_name }}_bulk_delete')
+
+        with disable_warnings('django.request'):
+            response = self.client.post(url, {'pk': pks, 'confirm': True, '_confirm': True})
+            self.assertHttpStatus(response, 403)
+        self.assertEqual({{ cookiecutter.__model_name }}.objects.count(), len(pks))
+
 
 class {{ cookiecutter.__model_name }}FormTestCase(PluginViewTestCase):
     """Test {{ cookiecutter.__model_name }} form validation."""
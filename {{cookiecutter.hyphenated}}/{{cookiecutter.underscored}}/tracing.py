@@ -0,0 +1,221 @@
+"""
+Request tracing for {{ cookiecutter.project_name }}.
+
+When ``tracing_enabled`` is set, TracingMiddleware opens a trace for every
+request handled by a plugin view. Nested spans are recorded for the layers
+the request passes through: filterset filtering, table construction,
+serializer calls, table and template rendering and every SQL statement,
+which becomes a child of the span that ran it. A W3C ``traceparent`` request header is
+honoured, so plugin spans join the caller's trace.
+
+Finished traces are handed to the exporter named by ``tracing_exporter``
+(a dotted path), constructed with ``tracing_exporter_options`` as keyword
+arguments. ConsoleSpanExporter logs an indented tree, FileSpanExporter appends
+spans as JSON lines and MemorySpanExporter keeps them for tests. Spans use
+OpenTelemetry's field names, so an exporter forwarding them to an
+OpenTelemetry SDK only needs to subclass SpanExporter.
+
+For OpenTelemetry's span model, see:
+https://opentelemetry.io/docs/concepts/signals/traces/
+"""
+
+import json
+import logging
+import re
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+
+from django.db import connection
+from django.utils.module_loading import import_string
+from netbox.plugins.utils import get_plugin_config
+
+from .metrics import get_view_name
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+# Span being recorded in the current context, if a trace is active
+current_span = ContextVar("{{ cookiecutter.underscored }}_current_span", default=None)
+
+# Exporters by (dotted path, options), so each is constructed only once
+exporters = {}
+
+
+def get_config(name):
+    return get_plugin_config("{{ cookiecutter.underscored }}", name)
+
+
+@dataclass
+class Span:
+    """One timed operation of a trace, with OpenTelemetry's field names."""
+
+    name: str
+    trace_id: str
+    parent_span_id: str | None
+    span_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    start_time_unix_nano: int = field(default_factory=time.time_ns)
+    end_time_unix_nano: int | None = None
+    attributes: dict = field(default_factory=dict)
+    status: str = "OK"
+    # Spans of the trace, shared by all of its spans
+    trace: list = field(default_factory=list, repr=False, compare=False)
+
+    @property
+    def duration_ms(self):
+        return (self.end_time_unix_nano - self.start_time_unix_nano) / 1e6
+
+    def to_dict(self):
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "trace"}
+
+
+@contextmanager
+def span(name, attributes=None):
+    """
+    Record the block as a child span of the current span.
+
+    Does nothing (and yields None) outside a trace, so instrumented code costs
+    a context variable lookup when tracing is disabled.
+    """
+    parent = current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(
+        name=name, trace_id=parent.trace_id, parent_span_id=parent.span_id,
+        attributes=attributes or {}, trace=parent.trace,
+    )
+    token = current_span.set(child)
+    try:
+        yield child
+    except Exception as e:
+        child.status = "ERROR"
+        child.attributes["exception.type"] = type(e).__name__
+        raise
+    finally:
+        current_span.reset(token)
+        child.end_time_unix_nano = time.time_ns()
+        parent.trace.append(child)
+
+
+def trace_sql(execute, sql, params, many, context):
+    """Database execute wrapper recording each statement as a span."""
+    with span("db.query", {"db.system": "postgresql", "db.statement": sql}):
+        return execute(sql, params, many, context)
+
+
+def get_exporter():
+    """Return the configured exporter, constructing it on first use."""
+    path = get_config("tracing_exporter")
+    options = get_config("tracing_exporter_options") or {}
+    key = (path, json.dumps(options, sort_keys=True))
+    if key not in exporters:
+        exporters[key] = import_string(path)(**options)
+    return exporters[key]
+
+
+def parse_traceparent(request):
+    """Return (trace_id, parent_span_id) from a W3C traceparent header, or new IDs."""
+    match = TRACEPARENT_RE.match(request.META.get("HTTP_TRACEPARENT", ""))
+    if match:
+        return match.group(1), match.group(2)
+    return secrets.token_hex(16), None
+
+
+class TracingMiddleware:
+    """Trace requests handled by plugin views and export the finished spans."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        view = get_view_name(request) if get_config("tracing_enabled") else None
+        if view is None:
+            return self.get_response(request)
+
+        trace_id, parent_span_id = parse_traceparent(request)
+        root = Span(
+            name=f"{request.method} {view}",
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+            attributes={"http.method": request.method, "http.route": view, "http.target": request.get_full_path()},
+        )
+        token = current_span.set(root)
+        try:
+            with connection.execute_wrapper(trace_sql):
+                response = self.get_response(request)
+        finally:
+            current_span.reset(token)
+            root.end_time_unix_nano = time.time_ns()
+
+        root.attributes["http.status_code"] = response.status_code
+        if response.status_code >= 500:
+            root.status = "ERROR"
+        root.trace.append(root)
+        try:
+            get_exporter().export(root.trace)
+        except Exception:
+            # A broken exporter must not break the request
+            logger.exception(f"Exporting trace {trace_id} failed")
+        return response
+
+
+#
+# Exporters
+#
+
+class SpanExporter(ABC):
+    """Receives the spans of every finished trace; the root span is last."""
+
+    @abstractmethod
+    def export(self, spans):
+        pass
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """Log each trace as an indented tree of spans with their durations."""
+
+    def export(self, spans):
+        children = {}
+        for s in spans:
+            children.setdefault(s.parent_span_id, []).append(s)
+        root = spans[-1]
+        lines = [f"Trace {root.trace_id}"]
+
+        def add(s, depth):
+            detail = s.attributes.get("db.statement") or s.attributes.get("template.name") or ""
+            lines.append(f"{'  ' * depth}{s.name} {s.duration_ms:.2f}ms {detail}".rstrip())
+            for child in sorted(children.get(s.span_id, []), key=lambda c: c.start_time_unix_nano):
+                add(child, depth + 1)
+
+        add(root, 1)
+        logger.info("\n".join(lines))
+
+
+class FileSpanExporter(SpanExporter):
+    """Append every span to path as one JSON object per line."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def export(self, spans):
+        lines = "".join(json.dumps(s.to_dict()) + "\n" for s in spans)
+        with self.lock, open(self.path, "a") as f:
+            f.write(lines)
+
+
+class MemorySpanExporter(SpanExporter):
+    """Keep exported spans in memory, for tests."""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
@@ -12,10 +12,22 @@ from django.urls import path
 from netbox.views.generic import ObjectChangeLogView
 
 from . import models, views
+{%- if cookiecutter.include_graphql == "yes" %}
+from .graphql_views import PersistedQueryGraphQLView
+{%- endif %}
+from .metrics import metrics_view
 
 urlpatterns = (
     path("{{ cookiecutter.__model_url }}s/", views.{{ cookiecutter.__model_name }}ListView.as_view(), name="{{ cookiecutter.__model_url_name }}_list"),
     path("{{ cookiecutter.__model_url }}s/add/", views.{{ cookiecutter.__model_name }}EditView.as_view(), name="{{ cookiecutter.__model_url_name }}_add"),
+    path("{{ cookiecutter.__model_url }}s/import/", views.{{ cookiecutter.__model_name }}BulkImportView.as_view(), name="{{ cookiecutter.__model_url_name }}_bulk_import"),
+    path(
+        "{{ cookiecutter.__model_url }}s/import/background/",
+        views.{{ cookiecutter.__model_name }}ImportJobView.as_view(),
+        name="{{ cookiecutter.__model_url_name }}_import_job",
+    ),
+    path("{{ cookiecutter.__model_url }}s/edit/", views.{{ cookiecutter.__model_name }}BulkEditView.as_view(), name="{{ cookiecutter.__model_url_name }}_bulk_edit"),
+    path("{{ cookiecutter.__model_url }}s/delete/", views.{{ cookiecutter.__model_name }}BulkDeleteView.as_view(), name="{{ cookiecutter.__model_url_name }}_bulk_delete"),
     path("{{ cookiecutter.__model_url }}s/<int:pk>/", views.{{ cookiecutter.__model_name }}View.as_view(), name="{{ cookiecutter.__model_url_name }}"),
     path("{{ cookiecutter.__model_url }}s/<int:pk>/edit/", views.{{ cookiecutter.__model_name }}EditView.as_view(), name="{{ cookiecutter.__model_url_name }}_edit"),
     path("{{ cookiecutter.__model_url }}s/<int:pk>/delete/", views.{{ cookiecutter.__model_name }}DeleteView.as_view(), name="{{ cookiecutter.__model_url_name }}_delete"),
@@ -25,4 +37,16 @@ urlpatterns = (
         name="{{ cookiecutter.__model_url_name }}_changelog",
         kwargs={"model": models.{{ cookiecutter.__model_name }}},
     ),
+{%- if cookiecutter.include_graphql == "yes" %}
+    path("graphql/", PersistedQueryGraphQLView.as_view(), name="graphql"),
+{%- endif %}
+    path("metrics/", metrics_view, name="metrics"),
+    path("profiles/", views.RequestProfileListView.as_view(), name="request_profile_list"),
+    path("profiles/<str:name>/", views.RequestProfileView.as_view(), name="request_profile"),
+    path(
+        "profiles/<str:name>/pstats/",
+        views.RequestProfileView.as_view(),
+        name="request_profile_pstats",
+        kwargs={"suffix": ".prof"},
+    ),
 )
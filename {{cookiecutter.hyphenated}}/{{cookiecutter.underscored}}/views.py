@@ -8,20 +8,47 @@ For generic view classes, see:
 https://docs.netbox.dev/en/stable/development/views/
 """
 
+from django.contrib import messages
+from django.contrib.auth.mixins import UserPassesTestMixin
+from django.core.exceptions import ValidationError
+from django.db import router, transaction
+from django.http import FileResponse, Http404
+from django.shortcuts import redirect, render
+from django.urls import reverse
+from django.views.generic import View
+from netbox.context import events_queue
+from netbox.plugins.utils import get_plugin_config
 from netbox.views import generic
+from utilities.exceptions import AbortRequest, AbortTransaction, PermissionsViolation
+from utilities.forms import BulkImportForm
+from utilities.views import ContentTypePermissionRequiredMixin, GetReturnURLMixin, get_viewname
 
-from . import filtersets, forms, models, tables
+from . import filtersets, forms, models, profiling, tables
+from .conditional import conditional_response, get_object_validators
+from .jobs import enqueue_import
+from .tracing import span
 
 
 class {{ cookiecutter.__model_name }}View(generic.ObjectView):
     queryset = models.{{ cookiecutter.__model_name }}.objects.all()
 
+    def get(self, request, **kwargs):
+        # The page also shows the user's own navigation and permissions, so the
+        # ETag is per user; self.queryset has already been restricted to the user
+        etag, last_modified = get_object_validators(self.queryset, kwargs["pk"], request.user.pk)
+        return conditional_response(request, lambda: super({{ cookiecutter.__model_name }}View, self).get(request, **kwargs), etag, last_modified)
+
 
 class {{ cookiecutter.__model_name }}ListView(generic.ObjectListView):
     queryset = models.{{ cookiecutter.__model_name }}.objects.all()
     table = tables.{{ cookiecutter.__model_name }}Table
     filterset = filtersets.{{ cookiecutter.__model_name }}FilterSet
 
+    def get_table(self, data, request, bulk_actions=True):
+        # The table restricts the queryset to its visible columns while configuring
+        with span(f"{self.table.__name__}.configure"):
+            return super().get_table(data, request, bulk_actions)
+
 
 class {{ cookiecutter.__model_name }}EditView(generic.ObjectEditView):
     queryset = models.{{ cookiecutter.__model_name }}.objects.all()
@@ -30,3 +57,142 @@ class {{ cookiecutter.__model_name }}EditView(generic.ObjectEditView):
 
 class {{ cookiecutter.__model_name }}DeleteView(generic.ObjectDeleteView):
     queryset = models.{{ cookiecutter.__model_name }}.objects.all()
+
+
+class {{ cookiecutter.__model_name }}BulkImportView(generic.BulkImportView):
+    """
+    Bulk import that commits every ``bulk_import_chunk_size`` records.
+
+    NetBox saves an entire import in one transaction, holding its row locks
+    until the last record is written. Imports larger than one chunk are split
+    here instead: each chunk is saved and permission-checked in its own
+    transaction. A failing chunk is rolled back and stops the import, while
+    the chunks before it stay committed.
+    """
+
+    queryset = models.{{ cookiecutter.__model_name }}.objects.all()
+    model_form = forms.{{ cookiecutter.__model_name }}ImportForm
+
+    def post(self, request):
+        form = BulkImportForm(request.POST, request.FILES)
+        chunk_size = get_plugin_config("{{ cookiecutter.underscored }}", "bulk_import_chunk_size")
+
+        # Invalid input, background jobs and imports that fit in a single
+        # chunk are handled exactly as NetBox does
+        if (
+            not form.is_valid()
+            or form.cleaned_data["background_job"]
+            or len(form.cleaned_data["data"]) <= chunk_size
+        ):
+            return super().post(request)
+
+        model = self.queryset.model
+        records = form.cleaned_data["data"]
+        saved_objects = []
+
+        for start in range(0, len(records), chunk_size):
+            form.cleaned_data["data"] = records[start:start + chunk_size]
+            # Events queued by earlier, committed chunks must survive a rollback
+            queued_events = dict(events_queue.get())
+            try:
+                with transaction.atomic(using=router.db_for_write(model)):
+                    new_objects = self.create_and_update_objects(form, request)
+
+                    # Enforce object-level permissions
+                    pks = [obj.pk for obj in new_objects]
+                    if self.queryset.filter(pk__in=pks).count() != len(new_objects):
+                        raise PermissionsViolation
+            except (AbortTransaction, ValidationError):
+                events_queue.set(queued_events)
+            except (AbortRequest, PermissionsViolation) as e:
+                form.add_error(None, e.message)
+                events_queue.set(queued_events)
+            else:
+                saved_objects.extend(new_objects)
+                continue
+
+            form.add_error(
+                None,
+                f"Import stopped in the chunk starting at record {start + 1}; record numbers above count from "
+                f"there. The {len(saved_objects)} records before it were imported.",
+            )
+            return render(request, self.template_name, {
+                "model": model,
+                "form": form,
+                "fields": self.model_form().fields,
+                "return_url": self.get_return_url(request),
+                **self.get_extra_context(request),
+            })
+
+        messages.success(request, f"Imported {len(saved_objects)} {model._meta.verbose_name_plural}")
+        return redirect(f"{reverse(get_viewname(model, action='list'))}?modified_by_request={request.id}")
+
+
+class {{ cookiecutter.__model_name }}ImportJobView(ContentTypePermissionRequiredMixin, GetReturnURLMixin, View):
+    """Upload a CSV file to be imported in the background by {{ cookiecutter.__model_name }}ImportJob."""
+
+    queryset = models.{{ cookiecutter.__model_name }}.objects.all()
+    template_name = "{{ cookiecutter.underscored }}/{{ cookiecutter.__model_url_name }}_import_job.html"
+
+    def get_required_permission(self):
+        return "{{ cookiecutter.underscored }}.add_{{ cookiecutter.__model_url_name }}"
+
+    def get(self, request):
+        return self.render_form(request, forms.{{ cookiecutter.__model_name }}ImportJobForm())
+
+    def post(self, request):
+        form = forms.{{ cookiecutter.__model_name }}ImportJobForm(request.POST, request.FILES)
+        if not form.is_valid():
+            return self.render_form(request, form)
+
+        job = enqueue_import(form.cleaned_data["file"], request.user)
+        messages.info(request, f"Import queued as job {job.pk}")
+        return redirect(job.get_absolute_url())
+
+    def render_form(self, request, form):
+        return render(request, self.template_name, {
+            "model": self.queryset.model,
+            "form": form,
+            "return_url": self.get_return_url(request),
+        })
+
+
+class {{ cookiecutter.__model_name }}BulkEditView(generic.BulkEditView):
+    queryset = models.{{ cookiecutter.__model_name }}.objects.all()
+    filterset = filtersets.{{ cookiecutter.__model_name }}FilterSet
+    table = tables.{{ cookiecutter.__model_name }}Table
+    form = forms.{{ cookiecutter.__model_name }}BulkEditForm
+
+
+class {{ cookiecutter.__model_name }}BulkDeleteView(generic.BulkDeleteView):
+    queryset = models.{{ cookiecutter.__model_name }}.objects.all()
+    filterset = filtersets.{{ cookiecutter.__model_name }}FilterSet
+    table = tables.{{ cookiecutter.__model_name }}Table
+
+
+class RequestProfileListView(UserPassesTestMixin, View):
+    """List the request profiles saved by ProfilerMiddleware. Superusers only."""
+
+    template_name = "{{ cookiecutter.underscored }}/request_profiles.html"
+
+    def test_func(self):
+        return self.request.user.is_superuser
+
+    def get(self, request):
+        return render(request, self.template_name, {
+            "profiles": profiling.list_profiles(),
+            "profiling_enabled": get_plugin_config("{{ cookiecutter.underscored }}", "profiling_enabled"),
+        })
+
+
+class RequestProfileView(UserPassesTestMixin, View):
+    """Download a saved request profile as a text report or, with suffix ".prof", as pstats data."""
+
+    def test_func(self):
+        return self.request.user.is_superuser
+
+    def get(self, request, name, suffix=".txt"):
+        path = profiling.get_profile_path(name, suffix)
+        if path is None:
+            raise Http404("No such profile")
+        return FileResponse(path.open("rb"), as_attachment=True, filename=path.name)